@@ -124,8 +124,11 @@ CheckIfFileExists "./sources/common/date_from_requests_retry_after.py"
 CheckIfFileExists "./sources/common/dates_and_times.py"
 CheckIfFileExists "./sources/common/files.py"
 CheckIfFileExists "./sources/common/filters.py"
+CheckIfFileExists "./sources/common/records.py"
+CheckIfFileExists "./sources/common/ignores.py"
 CheckIfFileExists "./sources/common/names.py"
 CheckIfFileExists "./sources/common/prompts.py"
+CheckIfFileExists "./sources/common/workers.py"
 
 CheckIfFileExists "./sources/configuration/__init__.py"
 CheckIfFileExists "./sources/configuration/config.py"
@@ -133,11 +136,25 @@ CheckIfFileExists "./sources/configuration/config.py"
 CheckIfFileExists "./sources/dependency/__init__.py"
 CheckIfFileExists "./sources/dependency/dependencies.py"
 CheckIfFileExists "./sources/dependency/parsings.py"
+CheckIfFileExists "./sources/dependency/dependency_sets.py"
+CheckIfFileExists "./sources/dependency/lockfiles.py"
 
 CheckIfFileExists "./sources/search/__init__.py"
+CheckIfFileExists "./sources/search/caches.py"
+CheckIfFileExists "./sources/search/deferred.py"
 CheckIfFileExists "./sources/search/downloads.py"
+CheckIfFileExists "./sources/search/github.py"
+CheckIfFileExists "./sources/search/crates.py"
+CheckIfFileExists "./sources/search/node_modules.py"
+CheckIfFileExists "./sources/search/module_caches.py"
+CheckIfFileExists "./sources/search/maven_caches.py"
+CheckIfFileExists "./sources/search/cocoapods_specs.py"
+CheckIfFileExists "./sources/search/html_parsings.py"
 CheckIfFileExists "./sources/search/parsings.py"
+CheckIfFileExists "./sources/search/rate_limits.py"
+CheckIfFileExists "./sources/search/retries.py"
 CheckIfFileExists "./sources/search/search.py"
+CheckIfFileExists "./sources/search/sessions.py"
 
 CheckIfFileExists "./sources/__init__.py"
 CheckIfFileExists "./sources/main.py"
@@ -233,6 +250,34 @@ CheckIfFileExists "./tests/unittests/test_5_downloads.py"
 CheckIfFileExists "./tests/unittests/test_6_licenses.py"
 CheckIfFileExists "./tests/unittests/test_7_save_the_licenses.py"
 CheckIfFileExists "./tests/unittests/test_8_save_the_errors.py"
+CheckIfFileExists "./tests/unittests/test_9_parallel_downloads.py"
+CheckIfFileExists "./tests/unittests/test_10_cache.py"
+CheckIfFileExists "./tests/unittests/test_11_rate_limits.py"
+CheckIfFileExists "./tests/unittests/test_12_deferred_retries.py"
+CheckIfFileExists "./tests/unittests/test_13_retries.py"
+CheckIfFileExists "./tests/unittests/test_14_in_memory.py"
+CheckIfFileExists "./tests/unittests/test_15_streaming.py"
+CheckIfFileExists "./tests/unittests/test_16_html_parser.py"
+CheckIfFileExists "./tests/unittests/test_17_pipeline.py"
+CheckIfFileExists "./tests/unittests/test_18_github.py"
+CheckIfFileExists "./tests/unittests/test_19_crates.py"
+CheckIfFileExists "./tests/unittests/test_20_node_modules.py"
+CheckIfFileExists "./tests/unittests/test_21_module_caches.py"
+CheckIfFileExists "./tests/unittests/test_22_maven_caches.py"
+CheckIfFileExists "./tests/unittests/test_23_cocoapods.py"
+CheckIfFileExists "./tests/unittests/test_24_lockfiles.py"
+CheckIfFileExists "./tests/unittests/test_25_cargo_and_go.py"
+CheckIfFileExists "./tests/unittests/test_26_swift_flutter_gradle_lockfiles.py"
+CheckIfFileExists "./tests/unittests/test_27_discovery.py"
+CheckIfFileExists "./tests/unittests/test_28_dependency_sets.py"
+CheckIfFileExists "./tests/unittests/test_29_records.py"
+CheckIfFileExists "./tests/unittests/test_30_comments.py"
+CheckIfFileExists "./tests/unittests/test_31_streaming_manifests.py"
+CheckIfFileExists "./tests/benchmarks/benchmark_html_parsers.py"
+CheckIfFileExists "./tests/benchmarks/benchmark_comments.py"
+CheckIfFileExists "./tests/benchmarks/html/cocoapods_alamofire.html"
+CheckIfFileExists "./tests/benchmarks/html/npm_express.html"
+CheckIfFileExists "./tests/benchmarks/html/pub_dev_http.html"
 
 # Runtimes and tools
 # ------------------
@@ -280,6 +325,29 @@ python3.8 -m pytest ./tests/unittests/test_5_downloads.py
 python3.8 -m pytest ./tests/unittests/test_6_licenses.py
 python3.8 -m pytest ./tests/unittests/test_7_save_the_licenses.py
 python3.8 -m pytest ./tests/unittests/test_8_save_the_errors.py
+python3.8 -m pytest ./tests/unittests/test_9_parallel_downloads.py
+python3.8 -m pytest ./tests/unittests/test_10_cache.py
+python3.8 -m pytest ./tests/unittests/test_11_rate_limits.py
+python3.8 -m pytest ./tests/unittests/test_12_deferred_retries.py
+python3.8 -m pytest ./tests/unittests/test_13_retries.py
+python3.8 -m pytest ./tests/unittests/test_14_in_memory.py
+python3.8 -m pytest ./tests/unittests/test_15_streaming.py
+python3.8 -m pytest ./tests/unittests/test_16_html_parser.py
+python3.8 -m pytest ./tests/unittests/test_17_pipeline.py
+python3.8 -m pytest ./tests/unittests/test_18_github.py
+python3.8 -m pytest ./tests/unittests/test_19_crates.py
+python3.8 -m pytest ./tests/unittests/test_20_node_modules.py
+python3.8 -m pytest ./tests/unittests/test_21_module_caches.py
+python3.8 -m pytest ./tests/unittests/test_22_maven_caches.py
+python3.8 -m pytest ./tests/unittests/test_23_cocoapods.py
+python3.8 -m pytest ./tests/unittests/test_24_lockfiles.py
+python3.8 -m pytest ./tests/unittests/test_25_cargo_and_go.py
+python3.8 -m pytest ./tests/unittests/test_26_swift_flutter_gradle_lockfiles.py
+python3.8 -m pytest ./tests/unittests/test_27_discovery.py
+python3.8 -m pytest ./tests/unittests/test_28_dependency_sets.py
+python3.8 -m pytest ./tests/unittests/test_29_records.py
+python3.8 -m pytest ./tests/unittests/test_30_comments.py
+python3.8 -m pytest ./tests/unittests/test_31_streaming_manifests.py
 
 # Conclusion
 # ----------
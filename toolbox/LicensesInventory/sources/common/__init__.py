@@ -16,8 +16,11 @@ from .comments import *
 from .dates_and_times import *
 from .date_from_requests_retry_after import *
 from .names import *
+from .records import *
 from .datas import *
+from .ignores import *
 from .files import *
 from .filters import *
 from .choices import *
 from .prompts import *
+from .workers import *
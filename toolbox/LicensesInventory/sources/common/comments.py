@@ -11,83 +11,147 @@
 # Authors: See CONTRIBUTORS.txt
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
+import re
+
+from .names import CName
+
 
 class CComment:
+    """
+    The comments of the dependencies manager files, deleted in one pass on the lines, line by line:
+        - the syntax of the comments is the one of the format of the file, and the formats without comments
+          (JSON) are not read
+        - the strings are kept: "https://github.com/..." is not a comment
+        - the lines with only a comment are deleted, the other ones are kept without their comment
+    """
 
     def __init__(self):
         self.the_simples = ['#', '//']
         self.the_complexes = [('/*', '*/')]
-
-    def is_simple_comment(self, ref):
-        line = ref.strip()
-        for start in self.the_simples:
-            if line.find(start) == 0:
-                return True
-
-                return False
-
-    def is_complex_comment(self, the_lines, a):
-        line = the_lines[a].replace('\n', str())
-        b = a + 0
-
-        # search comment
-        the_values = tuple()
-        my_line = line.strip()
-        for start_and_stop in self.the_complexes:
-            start, stop = start_and_stop
-            p = my_line.find(start)
-            if p > -1:
-                the_values = (start, stop, p)
-
-        if the_values == tuple():
-            return (line, a)
-
-        text_before = str()
-        if p > 0:
-            text_before = line[0:p]
-            my_line = my_line[p:]
-
-        # search the end of the comment
-        b = a + 0
-        while stop not in my_line:
-            b += 1
-            my_line = the_lines[b].replace('\n', str())
-
-        text_after = str()
-        p_stop = my_line.find(stop)
-        p_stop += len(stop)
-        if p_stop < len(my_line):
-            text_after = my_line[p:]
-
-        text_after = text_after.strip()
-        if (text_before == str()) and (text_after == str()):
-            line = None
-        else:
-            line = text_before + ' ' + text_after
-            line = line.rstrip()
-
-        return (line, b)
-
-    def delete(self, the_lines):
-        result = list()
-
-        to_continue = False
-        a = -1
-        while (a+1) < len(the_lines):
-            a += 1
-            line = the_lines[a].replace('\n', str())
-            to_continue = True
-
-            if self.is_simple_comment(line) == True:
-                to_continue = False
-
-            if to_continue == True:
-                r = self.is_complex_comment(the_lines, a)
-                line, a = r
-                if line == None:
-                    to_continue = False
-
-            if to_continue == True:
-                result.append(line)
-
-        return result
+        self.the_quotes = ['"', '\'']
+
+        # the line comments and the block comments by platform, None without comments
+        ins_name = CName()
+        self.the_syntaxes_by_platform = dict()
+        self.the_syntaxes_by_platform[ins_name.gradle] = (['//'], [('/*', '*/')])
+        self.the_syntaxes_by_platform[ins_name.swift] = (['//'], [('/*', '*/')])
+        self.the_syntaxes_by_platform[ins_name.flutter] = (['#'], list())
+        self.the_syntaxes_by_platform[ins_name.cocoapods] = (['#'], list())
+        self.the_syntaxes_by_platform[ins_name.cocoapods_lock] = (['#'], list())
+        self.the_syntaxes_by_platform[ins_name.package_json] = None
+        self.the_patterns = dict()
+
+    def get_syntax(self, platform):
+        # the syntax of the platform, else all the comments
+        return self.the_syntaxes_by_platform.get(platform, (self.the_simples, self.the_complexes))
+
+    def get_the_patterns(self, syntax):
+        # the code until the first comment, with the strings: one match by part of line;
+        # and the same code with the closed strings without \ only, faster for most of the lines,
+        # followed by the start of a comment until the end of the line (group 1) or of a block comment (group 2)
+        the_simples, the_complexes = syntax
+        key = (tuple(the_simples), tuple(the_complexes))
+        if key in self.the_patterns.keys():
+            return self.the_patterns[key]
+
+        the_starts = the_simples + [start for start, stop in the_complexes]
+        the_characters = sorted(set([start[0] for start in the_starts] + self.the_quotes))
+        # the other characters are read in one run between the alternatives: less backtracking
+        others = '[^' + re.escape(str().join(the_characters)) + ']*'
+        the_alternatives = list()
+        the_closed_strings = list()
+        for quote in self.the_quotes:
+            q = re.escape(quote)
+            the_alternatives.append(q + '[^' + q + r'\\]*(?:\\.[^' + q + r'\\]*)*' + q + '?')
+            the_closed_strings.append(q + '[^' + q + r'\\]*' + q)
+        for character in the_characters:
+            if character in self.the_quotes: continue
+            the_ends = [re.escape(start[1:]) for start in the_starts if start[0] == character]
+            if str() in the_ends:
+                # a # in a word is not a comment (YAML): https://host/page#anchor
+                the_alternatives.append('(?<=\\S)' + re.escape(character))
+            else:
+                the_alternatives.append(re.escape(character) + '(?!' + '|'.join(the_ends) + ')')
+        # like the alternatives: a start of one character after a space only
+        the_simple_starts = ['(?<!\\S)' + re.escape(start) if len(start) == 1 else re.escape(start) for start in the_simples]
+        # without block comments: a group never found
+        the_block_starts = [re.escape(start) for start, stop in the_complexes] or ['(?!)']
+        pattern = re.compile(others + '(?:(?:' + '|'.join(the_alternatives) + ')' + others + ')*')
+        fast_pattern = re.compile(others + '(?:(?:' + '|'.join(the_closed_strings) + ')' + others + ')*'
+                                  + '(?:(?=(' + '|'.join(the_simple_starts) + '))|(?=(' + '|'.join(the_block_starts) + '))|)')
+        self.the_patterns[key] = (pattern, fast_pattern)
+
+        return self.the_patterns[key]
+
+    def get_the_lines(self, the_lines, platform=None):
+        # the lines without comments, one by one
+        syntax = self.get_syntax(platform)
+        if syntax == None:
+            for line in the_lines:
+                yield line.replace('\n', str())
+            return
+
+        the_simples, the_complexes = syntax
+        the_block_starts = tuple([start for start, end in the_complexes])
+        pattern, fast_pattern = self.get_the_patterns(syntax)
+        # the character which starts all the comments (/ or #), else an empty one found in all the lines
+        the_firsts = sorted(set([start[0] for start in the_simples + list(the_block_starts)]))
+        first = str()
+        if len(the_firsts) == 1:
+            first = the_firsts[0]
+        nothing = str()
+
+        # the end of the block comment in progress
+        stop = None
+        for line in the_lines:
+            line = line.replace('\n', nothing)
+            i = 0
+            if stop == None:
+                # most of the lines: no comment, or simple strings before it; else the whole pattern
+                if first not in line:
+                    yield line
+                    continue
+                m = fast_pattern.match(line)
+                i = m.end()
+                group = m.lastindex
+                is_a_simple_comment = group == 1
+                if group == None:
+                    if i < len(line):
+                        i = pattern.match(line).end()
+                    if i == len(line):
+                        yield line
+                        continue
+                    is_a_simple_comment = line.startswith(the_block_starts, i) == False
+                # a comment until the end of the line
+                if is_a_simple_comment == True:
+                    line = line[:i].rstrip()
+                    if line != nothing:
+                        yield line
+                    continue
+
+            the_parts = [line[:i]]
+            while i < len(line):
+                if stop != None:
+                    p = line.find(stop, i)
+                    if p < 0: break
+                    i = p + len(stop)
+                    stop = None
+                    # like a space
+                    the_parts.append(' ')
+                    continue
+
+                j = pattern.match(line, i).end()
+                the_parts.append(line[i:j])
+                i = len(line)
+                for start, end in the_complexes:
+                    if line.startswith(start, j) == True:
+                        stop = end
+                        i = j + len(start)
+                        break
+
+            line = str().join(the_parts).rstrip()
+            if line.strip() != str():
+                yield line
+
+    def delete(self, the_lines, platform=None):
+        return list(self.get_the_lines(the_lines, platform))
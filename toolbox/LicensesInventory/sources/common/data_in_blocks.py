@@ -19,8 +19,10 @@ class CDataInBlock:
         self.the_foot = the_foot
 
     def get(self, the_lines, ends_by_feet, data_with_head):
-        result = list()
+        return list(self.get_the_lines(the_lines, ends_by_feet, data_with_head))
 
+    def get_the_lines(self, the_lines, ends_by_feet, data_with_head):
+        # the lines of the blocks, one by one
         level = 0
         for line in the_lines:
             if level < 0: level = 0
@@ -47,6 +49,4 @@ class CDataInBlock:
                         continue
 
             if (level > 0) and (line.strip() != str()):
-                result.append(line)
-
-        return result
+                yield line
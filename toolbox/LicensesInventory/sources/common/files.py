@@ -14,6 +14,7 @@
 import os
 
 from sources.common import CDate
+from sources.common import CIgnoredFolders
 
 class CErrorCode():
     def __init__(self):
@@ -49,6 +50,55 @@ class CFile:
 
         return the_files
 
+    def find_the_files(self, path, the_filenames, ins_ignored_folders=CIgnoredFolders()):
+        # all the names in one walk, without the ignored folders, and the files in the order of the names
+        the_files_by_name = dict()
+        for filename in the_filenames:
+            the_files_by_name[filename] = list()
+
+        the_folders = [(path, list())]
+        while len(the_folders) > 0:
+            folder, the_gitignore_files = the_folders.pop()
+            try:
+                the_entries = sorted(os.scandir(folder), key=lambda entry: entry.name)
+            except OSError as e:
+                continue
+
+            the_names = [entry.name for entry in the_entries]
+            the_gitignore_files = ins_ignored_folders.get_the_gitignore_files(the_gitignore_files, folder, the_names)
+            the_subfolders = list()
+            for entry in the_entries:
+                try:
+                    is_a_folder = entry.is_dir()
+                except OSError as e:
+                    continue
+                if is_a_folder == True:
+                    # like os.walk: the links to folders are not walked
+                    if entry.is_symlink() == True: continue
+                    relative_path = os.path.relpath(entry.path, path).replace(os.sep, '/')
+                    if ins_ignored_folders.is_ignored_by_the_globs(relative_path, entry.name) == True: continue
+                if (is_a_folder == False) and (entry.name not in the_files_by_name.keys()): continue
+                is_ignored = ins_ignored_folders.is_ignored_by_the_gitignore_files(the_gitignore_files, entry.path, is_a_folder)
+                if is_a_folder == True:
+                    if is_ignored == True:
+                        print('INFO: ' + entry.path + ': folder ignored by .gitignore, not walked')
+                        continue
+                    the_subfolders.append((entry.path, the_gitignore_files))
+                else:
+                    # the filenames of the configuration are asked: they are kept
+                    if is_ignored == True:
+                        print('INFO: ' + entry.path + ': ignored by .gitignore, but read as a filename of the configuration')
+                    the_files_by_name[entry.name].append(entry.path)
+            # the first subfolder is the next one
+            the_folders += reversed(the_subfolders)
+
+        the_files = list()
+        for filename in the_filenames:
+            the_files += the_files_by_name[filename]
+            the_files_by_name[filename] = list()
+
+        return the_files
+
     def ask_before_creating_directory(self, my_path):
         response = ""
 
@@ -87,6 +137,19 @@ class CFile:
 
         return the_lines
 
+    def read_the_lines(self, path, filename=''):
+        # the lines one by one, as read_text_file: an empty line at the end if the file ends by a new line
+        file = os.path.join(path, filename)
+        with open(file, 'rt', encoding='utf-8') as f:
+            line = str()
+            for line in f:
+                if line.endswith('\n') == True:
+                    yield line[:-1]
+                else:
+                    yield line
+            if (line == str()) or (line.endswith('\n') == True):
+                yield str()
+
     def manage(self, the_licenses, my_path):
 
         for k, v in the_licenses.items():
@@ -114,19 +177,20 @@ class CFile:
 
         return result
 
+    def get_line(self, record):
+        # the fields of a license or of an error (a record or a list), 'None' for the empty ones
+        the_fields = list()
+        for field in record:
+            if field == None or field == str():
+                field = 'None'
+            the_fields.append(field)
+        return self.separator.join(the_fields)
+
     def get_the_lines_from_the_new_licenses(self, the_licenses):
         result = list()
 
         for license in the_licenses:
-            line = str()
-            for field in license:
-                if field == None or field == str():
-                    field = 'None'
-                if line == str():
-                    line = field
-                else:
-                    line += self.separator + field
-            result.append(line)
+            result.append(self.get_line(license))
 
         return result
 
@@ -209,15 +273,7 @@ class CFile:
     def manage_new_lines(self, the_new_dependencies_on_error):
         the_new_lines = list()
         for new_dependency_on_error in the_new_dependencies_on_error:
-            line = str()
-            for value in new_dependency_on_error:
-                if value == None or value == str():
-                    value = 'None'
-                if line == str():
-                    line+= value
-                else:
-                    line += self.separator + value
-            the_new_lines += [line]
+            the_new_lines.append(self.get_line(new_dependency_on_error))
 
         return the_new_lines
 
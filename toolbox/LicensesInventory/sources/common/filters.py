@@ -16,6 +16,7 @@ import os
 from .names import CName
 from .datas import CData
 from .files import CFile
+from .ignores import CIgnoredFolders
 from .comments import CComment
 from .data_in_blocks import CDataInBlock
 
@@ -47,42 +48,30 @@ class CFilter:
             print('No path to extract the dependencies.')
             return dict()
 
-        the_files = list()
-        for filename in self.ins_config.the_filenames:
-            the_files += CFile().get_the_files_by_names(self.ins_config.path_dependencies, filename)
+        # all the filenames in one walk
+        to_read_the_gitignore_files = str(self.ins_config.gitignore).lower() == 'yes'
+        ins_ignored_folders = CIgnoredFolders(self.ins_config.the_ignored_folders, to_read_the_gitignore_files)
+        the_files = CFile().find_the_files(self.ins_config.path_dependencies, self.ins_config.the_filenames, ins_ignored_folders)
         if len(the_files) == 0:
             msg = 'No file to extract the dependencies.'
             print(msg)
             return dict()
 
-        # extract the contents
+        # only the paths: each file is read when its dependencies are parsed, one by one
         for file in the_files:
-            the_fields = os.path.split(file)
-            path = the_fields[0]
-            filename = the_fields[1]
+            path, filename = os.path.split(file)
             platform = self.get_platform(filename)
-
-            the_lines = CFile().read_text_file (path, filename)
-            the_lines = self.clean(the_lines, platform)
-
-            s = len(the_lines)
-            if s == 0:
-                continue
-
-            data_found = False
-            for line in the_lines:
-                if line != str():
-                    data_found = True
-                    break
-
-            if data_found == True:
-                if platform in result.keys():
-                    result[platform] += the_lines
-                else:
-                    result[platform] = the_lines
+            result.setdefault(platform, list()).append(file)
 
         return result
 
+    def get_the_lines_of_the_file(self, file, platform):
+        # the lines of the dependencies of a file, one by one: read, without comments, then in their blocks
+        path, filename = os.path.split(file)
+        the_lines = CFile().read_the_lines(path, filename)
+        the_lines = self.get_the_clean_lines(the_lines, platform)
+        return self.get_the_lines_in_blocks(the_lines, platform)
+
     def get_content_on_error_by_platform(self):
         result = dict()
 
@@ -98,7 +87,8 @@ class CFilter:
             try:
                 filename_errors = self.ins_config.model_for_errors_file.replace('[platform]', platform)
                 the_lines = CFile().read_text_file (path_errors, filename_errors)
-                the_lines = self.clean(the_lines, platform)
+                # no comments in the errors files, and their URLs are kept
+                the_lines = self.clean(the_lines, platform, False)
                 result[platform] = the_lines
             except Exception as e:
                 pass
@@ -106,6 +96,10 @@ class CFilter:
         return result
 
     def get_platform(self, filename):
+            # before build.gradle(.kts): gradle.lockfile
+            for platform in self.ins_name.the_files_read_by_their_parser:
+                if platform.lower() == filename.lower():
+                    return platform
             if self.ins_name.gradle.lower() in filename.lower():
                 return self.ins_name.gradle
             if self.ins_name.package_json.lower() == filename.lower():
@@ -120,6 +114,8 @@ class CFilter:
                 return self.ins_name.swift
             if self.ins_name.cocoapods.lower() == filename.lower():
                 return self.ins_name.cocoapods
+            if self.ins_name.cocoapods_lock.lower() == filename.lower():
+                return self.ins_name.cocoapods_lock
 
     def get_the_heads_by_name(self, ins_name):
         result = dict()
@@ -133,11 +129,12 @@ class CFilter:
         h_d = '{'
         result[ins_name.package_json] = [h_a, h_b, h_c]
 
-        result[ins_name.roast] = ['[[package]]']
-        result[ins_name.go] = ['require (']
         result[ins_name.flutter] = ['dependencies:', 'dev_dependencies:']
         result[ins_name.swift] = ['dependencies: [']
         result[ins_name.cocoapods] = None
+        result[ins_name.cocoapods_lock] = None
+        for platform in ins_name.the_files_read_by_their_parser:
+            result[platform] = None
 
         quote = '\"'
         a = quote + 'dependencies' + quote + ': {'
@@ -154,11 +151,12 @@ class CFilter:
         comma = ','
         result[ins_name.gradle] = [feet, feet + comma]
         result[ins_name.package_json] = [feet, feet + comma]
-        result[ins_name.roast] = [str()]
-        result[ins_name.go] = [')']
         result[ins_name.flutter] = [str()]
         result[ins_name.swift] = [']', '],']
         result[ins_name.cocoapods] = None
+        result[ins_name.cocoapods_lock] = None
+        for platform in ins_name.the_files_read_by_their_parser:
+            result[platform] = None
         #result[ins_name.elm_lang] = [foot, foot + comma]
 
         return result
@@ -181,6 +179,11 @@ class CFilter:
         result[ins_name.cocoapods] = 'https://cocoapods.org/pods/[component]'
         #result[ins_name.elm_lang] = 'https://package.elm-lang.org/packages/[component]/latest/about'
 
+        # the lockfiles (gradle is searched with the models of github and maven central)
+        for platform, platform_of_the_packages in ins_name.the_platforms_of_the_lockfiles.items():
+            if platform_of_the_packages in result.keys():
+                result[platform] = result[platform_of_the_packages]
+
         return result
 
     def get_the_filenames_by_name(self, ins_name):
@@ -201,39 +204,37 @@ class CFilter:
         result[ins_name.cocoapods] = '[component].html'
         #result[ins_name.elm_lang] = '[component].html'
 
-        return result
-
-    def clean(self, the_lines, platform):
-        result = list()
-
-        for line in the_lines:
-            my_line = line.replace(self.ins_data.old_quote, self.ins_data.quote)
-            result.append(my_line)
-
-        result = CComment().delete(result)
+        # the lockfiles (gradle is searched with the models of github and maven central)
+        for platform, platform_of_the_packages in ins_name.the_platforms_of_the_lockfiles.items():
+            if platform_of_the_packages in result.keys():
+                result[platform] = result[platform_of_the_packages]
 
         return result
 
-    def get_the_data(self, the_lines_by_platform):
-        result = dict()
+    def clean(self, the_lines, platform, with_comments=True):
+        return list(self.get_the_clean_lines(the_lines, platform, with_comments))
 
-        for platform, the_lines in the_lines_by_platform.items():
-            if platform == self.ins_name.cocoapods:
-                result[platform] = the_lines
-                continue
-
-            heads = self.the_heads[platform]
-            foot = self.the_foot[platform]
-            ends_with_feet = False
-            if (platform == self.ins_name.flutter) or (platform == self.ins_name.roast):
-                ends_with_feet = True
-            data_with_head = False
-            if platform == CName().gradle:
-                data_with_head = True
-            the_new_lines = CDataInBlock(heads, foot).get(the_lines, ends_with_feet, data_with_head)
-            result[platform] = the_new_lines
+    def get_the_clean_lines(self, the_lines, platform, with_comments=True):
+        # one pass on the lines: the comments of the format deleted, then the quotes replaced
+        if with_comments == True:
+            the_lines = CComment().get_the_lines(the_lines, platform)
 
-        return result
+        for line in the_lines:
+            yield line.replace(self.ins_data.old_quote, self.ins_data.quote)
+
+    def get_the_lines_in_blocks(self, the_lines, platform):
+        if platform in [self.ins_name.cocoapods, self.ins_name.cocoapods_lock]:
+            return the_lines
+
+        heads = self.the_heads[platform]
+        foot = self.the_foot[platform]
+        ends_with_feet = False
+        if platform == self.ins_name.flutter:
+            ends_with_feet = True
+        data_with_head = False
+        if platform == CName().gradle:
+            data_with_head = True
+        return CDataInBlock(heads, foot).get_the_lines(the_lines, ends_with_feet, data_with_head)
 
     def prepare(self, ins_config):
         self.ins_config = ins_config
@@ -249,6 +250,102 @@ class CFilter:
         except Exception as e:
             raise Exception('The number of authorized errors is not valid in the ini file.')
 
+        msg = 'The number of parallel downloads is not valid in the ini file.'
+        the_numbers = ins_config.the_numbers_of_parallel_downloads_by_platform
+        try:
+            ins_config.number_of_parallel_downloads = int(ins_config.number_of_parallel_downloads)
+            for platform, number in the_numbers.items():
+                the_numbers[platform] = int(number)
+        except Exception as e:
+            raise Exception(msg)
+        if min([ins_config.number_of_parallel_downloads] + list(the_numbers.values())) < 1:
+            raise Exception(msg)
+
+        msg = 'The number of requests per second is not valid in the ini file.'
+        the_numbers = ins_config.the_numbers_of_requests_per_second_by_platform
+        try:
+            ins_config.number_of_requests_per_second = float(ins_config.number_of_requests_per_second)
+            for platform, number in the_numbers.items():
+                the_numbers[platform] = float(number)
+        except Exception as e:
+            raise Exception(msg)
+        if min([ins_config.number_of_requests_per_second] + list(the_numbers.values())) < 0:
+            raise Exception(msg)
+
+        msg = 'The size of the pool of connections is not valid in the ini file.'
+        try:
+            ins_config.size_of_the_pool_of_connections = int(ins_config.size_of_the_pool_of_connections)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.size_of_the_pool_of_connections < 1:
+            raise Exception(msg)
+
+        msg = 'The time to live of the cache is not valid in the ini file.'
+        the_times = ins_config.the_times_to_live_of_the_cache_by_platform
+        try:
+            ins_config.time_to_live_of_the_cache = float(ins_config.time_to_live_of_the_cache)
+            for platform, time_to_live in the_times.items():
+                the_times[platform] = float(time_to_live)
+        except Exception as e:
+            raise Exception(msg)
+        if (ins_config.path_cache != str()) and (os.path.isdir(ins_config.path_cache) == False):
+            raise Exception('The path to store the cache does not exist.')
+
+        msg = 'The maximal delay before a deferred retry is not valid in the ini file.'
+        try:
+            ins_config.maximal_delay_of_a_deferred_retry = float(ins_config.maximal_delay_of_a_deferred_retry)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.maximal_delay_of_a_deferred_retry < 0:
+            raise Exception(msg)
+
+        msg = 'The number of deferred retries is not valid in the ini file.'
+        try:
+            ins_config.number_of_deferred_retries = int(ins_config.number_of_deferred_retries)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.number_of_deferred_retries < 0:
+            raise Exception(msg)
+
+        msg = 'The number of retries on network errors is not valid in the ini file.'
+        try:
+            ins_config.number_of_retries = int(ins_config.number_of_retries)
+            ins_config.budget_of_retries = int(ins_config.budget_of_retries)
+        except Exception as e:
+            raise Exception(msg)
+        if min(ins_config.number_of_retries, ins_config.budget_of_retries) < 0:
+            raise Exception(msg)
+
+        msg = 'The timeout of the requests is not valid in the ini file.'
+        try:
+            ins_config.timeout = float(ins_config.timeout)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.timeout < 0:
+            raise Exception(msg)
+
+        if str(ins_config.to_write).lower() not in ['yes', 'no', 'in background']:
+            raise Exception('The way to write the downloaded files is not valid in the ini file.')
+
+        if str(ins_config.html_parser).lower() not in ['fast', 'beautifulsoup']:
+            raise Exception('The parser of the HTML pages is not valid in the ini file.')
+
+        msg = 'The number of threads to read the files is not valid in the ini file.'
+        try:
+            ins_config.number_of_threads_to_read_the_files = int(ins_config.number_of_threads_to_read_the_files)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.number_of_threads_to_read_the_files < 1:
+            raise Exception(msg)
+
+        msg = 'The number of processes to parse the pages is not valid in the ini file.'
+        try:
+            ins_config.number_of_parsing_processes = int(ins_config.number_of_parsing_processes)
+        except Exception as e:
+            raise Exception(msg)
+        if ins_config.number_of_parsing_processes < 0:
+            raise Exception(msg)
+
         # to get the data
         self.the_heads = self.get_the_heads_by_name(self.ins_name)
         self.the_foot = self.get_the_foot_by_name(self.ins_name)
@@ -261,5 +358,5 @@ class CFilter:
         the_content_by_platform = self.get_content_by_name(self.ins_name)
         the_content_on_error_by_platform = self.get_content_on_error_by_platform()
 
-        self.the_contents = self.get_the_data(the_content_by_platform)
+        self.the_contents = the_content_by_platform
         self.the_contents_on_error = the_content_on_error_by_platform
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import os
+import re
+import fnmatch
+
+
+class CGitIgnore:
+    """
+    The patterns of a .gitignore file, for the paths under its folder:
+        - # for a comment, ! to include again, / at the end for the folders only
+        - with a / (not at the end), the pattern is relative to the folder of the file, else it matches any level
+        - *, ?, [...] and ** like git
+    The last pattern matching a path gives the result.
+    """
+
+    def __init__(self, folder, the_lines=list()):
+        self.folder = folder
+        # (regular expression, to include again, for the folders only)
+        self.the_rules = list()
+        for line in the_lines:
+            rule = self.get_rule(line)
+            if rule != None:
+                self.the_rules.append(rule)
+
+    def translate(self, pattern):
+        # the glob of git as a regular expression
+        result = str()
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if pattern.startswith('**/', i) == True:
+                result += '(?:.*/)?'
+                i += 3
+                continue
+            if pattern.startswith('**', i) == True:
+                result += '.*'
+                i += 2
+                continue
+            if c == '*':
+                result += '[^/]*'
+            elif c == '?':
+                result += '[^/]'
+            elif c == '[':
+                p = pattern.find(']', i + 1)
+                if p < 0:
+                    result += re.escape(c)
+                else:
+                    characters = pattern[i + 1:p]
+                    if characters.startswith('!') == True:
+                        characters = '^' + characters[1:]
+                    result += '[' + characters.replace('\\', '\\\\') + ']'
+                    i = p
+            elif (c == '\\') and (i + 1 < len(pattern)):
+                i += 1
+                result += re.escape(pattern[i])
+            else:
+                result += re.escape(c)
+            i += 1
+        return result
+
+    def get_rule(self, line):
+        line = line.rstrip('\r')
+        if line.endswith('\\ ') == False:
+            line = line.rstrip(' ')
+        if (line == str()) or (line.startswith('#') == True): return None
+
+        to_include = False
+        if line.startswith('!') == True:
+            to_include = True
+            line = line[1:]
+        if line.startswith('\\') == True:
+            line = line[1:]
+
+        for_the_folders_only = False
+        if line.endswith('/') == True:
+            for_the_folders_only = True
+            line = line.rstrip('/')
+        if line == str(): return None
+
+        prefix = '(?:.*/)?'
+        if '/' in line:
+            prefix = str()
+            line = line.lstrip('/')
+
+        try:
+            expression = re.compile(prefix + self.translate(line) + '$')
+        except re.error as e:
+            return None
+
+        return (expression, to_include, for_the_folders_only)
+
+    def is_ignored(self, path, is_a_folder):
+        # True or False if a pattern matches the path, else None
+        result = None
+
+        relative_path = os.path.relpath(path, self.folder).replace(os.sep, '/')
+        for expression, to_include, for_the_folders_only in self.the_rules:
+            if (for_the_folders_only == True) and (is_a_folder == False): continue
+            if expression.match(relative_path) != None:
+                result = not to_include
+
+        return result
+
+
+class CIgnoredFolders:
+    """
+    The folders not walked to find the dependencies manager files: the globs of the configuration
+    (on the name of the folder, or on its path from the path to parse with a /), and the .gitignore files if asked.
+    The files named in the configuration are read even if a .gitignore file ignores them (Cargo.lock, package-lock.json...).
+    """
+
+    def __init__(self, the_globs=list(), to_read_the_gitignore_files=False):
+        self.the_globs = the_globs
+        self.to_read_the_gitignore_files = to_read_the_gitignore_files
+
+    def is_ignored_by_the_globs(self, relative_path, name):
+        for glob in self.the_globs:
+            if '/' in glob:
+                if fnmatch.fnmatchcase(relative_path, glob.strip('/')) == True: return True
+            elif fnmatch.fnmatchcase(name, glob) == True:
+                return True
+        return False
+
+    def is_ignored_by_the_gitignore_files(self, the_gitignore_files, path, is_a_folder):
+        # the nearest .gitignore file is the last one
+        for ins_gitignore in reversed(the_gitignore_files):
+            result = ins_gitignore.is_ignored(path, is_a_folder)
+            if result != None:
+                return result
+        return False
+
+    def get_the_gitignore_files(self, the_gitignore_files, folder, the_names):
+        if self.to_read_the_gitignore_files == False: return the_gitignore_files
+        if '.gitignore' not in the_names: return the_gitignore_files
+
+        file = os.path.join(folder, '.gitignore')
+        try:
+            with open(file, 'rt', encoding='utf-8', errors='replace') as f:
+                the_lines = f.read().split('\n')
+        except OSError as e:
+            return the_gitignore_files
+
+        return the_gitignore_files + [CGitIgnore(folder, the_lines)]
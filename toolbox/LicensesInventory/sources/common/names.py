@@ -23,9 +23,18 @@ class CName:
         self.package_json = 'package.json'
         self.roast = 'Cargo.lock'
         self.go = 'go.mod'
+        self.go_sum = 'go.sum'
         self.flutter = 'pubspec.yaml'
         self.swift = 'Package.swift'
         self.cocoapods = 'Podfile'
+        self.cocoapods_lock = 'Podfile.lock'
+        self.package_lock = 'package-lock.json'
+        self.yarn_lock = 'yarn.lock'
+        self.pnpm_lock = 'pnpm-lock.yaml'
+        self.swift_resolved = 'Package.resolved'
+        self.flutter_lock = 'pubspec.lock'
+        self.gradle_lock = 'gradle.lockfile'
+        self.gradle_catalog = 'libs.versions.toml'
         #self.elm_lang = 'elm.json' #unable: no result in the response of the request
 
         self.github = 'github'
@@ -36,12 +45,40 @@ class CName:
         self.version_for_maven_central = 'version'
         self.maven_central = 'maven_central'
 
+        # the lockfiles, by the platform of their packages: same website, same limits
+        self.the_platforms_of_the_lockfiles = dict()
+        self.the_platforms_of_the_lockfiles[self.cocoapods_lock] = self.cocoapods
+        self.the_platforms_of_the_lockfiles[self.package_lock] = self.package_json
+        self.the_platforms_of_the_lockfiles[self.yarn_lock] = self.package_json
+        self.the_platforms_of_the_lockfiles[self.pnpm_lock] = self.package_json
+        self.the_platforms_of_the_lockfiles[self.go_sum] = self.go
+        self.the_platforms_of_the_lockfiles[self.swift_resolved] = self.swift
+        self.the_platforms_of_the_lockfiles[self.flutter_lock] = self.flutter
+        self.the_platforms_of_the_lockfiles[self.gradle_lock] = self.gradle
+        self.the_platforms_of_the_lockfiles[self.gradle_catalog] = self.gradle
+        # the files read by their parser, without loading them in memory, with the version of the dependencies
+        self.the_files_read_by_their_parser = [self.package_lock, self.yarn_lock, self.pnpm_lock, self.roast, self.go, self.go_sum]
+        self.the_files_read_by_their_parser += [self.swift_resolved, self.flutter_lock, self.gradle_lock, self.gradle_catalog]
+
     def get_the_platforms(self):
         r = [self.gradle]
         r += [self.package_json]
         r += [self.roast]
         r += [self.go]
+        r += [self.go_sum]
         r += [self.flutter]
         r += [self.swift]
         r += [self.cocoapods]
+        r += [self.cocoapods_lock]
+        r += [self.package_lock]
+        r += [self.yarn_lock]
+        r += [self.pnpm_lock]
+        r += [self.swift_resolved]
+        r += [self.flutter_lock]
+        r += [self.gradle_lock]
+        r += [self.gradle_catalog]
         return r
+
+    def get_the_platform_of_the_packages(self, platform):
+        # package-lock.json: package.json
+        return self.the_platforms_of_the_lockfiles.get(platform, platform)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import sys
+
+
+class CRecord(tuple):
+    """
+    An immutable and hashable sequence of fields, without a dict by object (__slots__ is empty).
+    It is equal to the list of its fields: the former form of the records, like the lines
+    of the errors files, is still accepted.
+    """
+    __slots__ = ()
+
+    def __new__(cls, the_fields=tuple()):
+        return tuple.__new__(cls, [intern_the_field(field) for field in the_fields])
+
+    def __eq__(self, other):
+        if type(other) == list:
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    # the same hash as the tuple of the fields: the records and the tuples are the same keys
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # for pickle: the fields as they are, without the __new__ of the subclasses
+        return (CRecord.__new__, (self.__class__, tuple(self)))
+
+
+def intern_the_field(field):
+    # the same strings (platforms, components, licenses...) are stored once
+    if type(field) == str:
+        return sys.intern(field)
+    return field
+
+
+class CDependency(CRecord):
+    """
+    A dependency: the component, then the namespace (Gradle) and the version (lockfiles) if they are known
+    """
+    __slots__ = ()
+
+    def get_component(self):
+        return self[0]
+
+
+class CLicenseResult(CRecord):
+    """
+    The license of a dependency: the fields of the dependency, then the values found for its license
+    """
+    __slots__ = ()
+
+    def __new__(cls, dependency, the_values_for_license=list()):
+        return CRecord.__new__(cls, tuple(dependency) + tuple(the_values_for_license))
+
+
+class CErrorResult(CRecord):
+    """
+    A dependency on error: 'error code = [code]', the fields of the dependency, then the notes
+    (like the number of successive errors when the next dependencies are not treated)
+    """
+    __slots__ = ()
+    prefix_of_the_error_code = 'error code = '
+    prefix_of_the_successive_errors = 'successive authorized errors at '
+    the_prefixes_of_the_notes = (prefix_of_the_successive_errors,)
+
+    def __new__(cls, dependency, error_code=str(None), the_notes=list()):
+        field_error_code = CErrorResult.prefix_of_the_error_code + str(error_code)
+        return CRecord.__new__(cls, (field_error_code,) + tuple(dependency) + tuple(the_notes))
+
+    def get_dependency(self):
+        return get_the_dependency_of_the_error(self)
+
+
+def get_the_dependency_of_the_error(the_fields):
+    # the fields of an error (a record or a line of the errors files split): all the fields after
+    # the error code, without the notes at the end
+    the_fields = list(the_fields[1:])
+    while (len(the_fields) > 0) and (type(the_fields[-1]) == str) and the_fields[-1].startswith(CErrorResult.the_prefixes_of_the_notes):
+        del the_fields[-1]
+    return CDependency(the_fields)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+class CWorkers:
+    """
+    Call a function for each item with a pool of threads.
+    The results are given in the order of the items.
+    """
+
+    def __init__(self, number_of_workers=1):
+        self.number_of_workers = number_of_workers
+        self.end = object()
+
+    def get_size_of_the_window(self):
+        # the items are submitted while the results are consumed:
+        # the caller can stop before all the items are treated
+        return 2 * self.number_of_workers
+
+    def is_sequential(self):
+        return self.number_of_workers < 2
+
+    def create_executor(self):
+        return ThreadPoolExecutor(max_workers=self.number_of_workers)
+
+    def release_executor(self, executor):
+        executor.shutdown(wait=True)
+
+    def map(self, function, the_items):
+        if self.is_sequential() == True:
+            for item in the_items:
+                yield function(*item)
+            return
+
+        executor = self.create_executor()
+        the_futures = deque()
+        the_items = iter(the_items)
+        try:
+            while True:
+                while len(the_futures) < self.get_size_of_the_window():
+                    item = next(the_items, self.end)
+                    if item is self.end: break
+                    the_futures.append(executor.submit(function, *item))
+
+                if len(the_futures) == 0: break
+                yield the_futures.popleft().result()
+        finally:
+            for future in the_futures:
+                future.cancel()
+            self.release_executor(executor)
+
+
+class CProcesses(CWorkers):
+    """
+    Call a function for each item with a pool of processes, for the work using the CPU.
+    The function must be defined in a module and the items must be picklable.
+    The processes are started once and kept for the next calls, until close.
+    """
+
+    def __init__(self, number_of_processes=0):
+        super().__init__(number_of_processes)
+        self.executor = None
+
+    def is_sequential(self):
+        return self.number_of_workers < 1
+
+    def create_executor(self):
+        if self.executor == None:
+            self.executor = ProcessPoolExecutor(max_workers=self.number_of_workers)
+        return self.executor
+
+    def release_executor(self, executor):
+        # the futures not consumed are cancelled, the processes are kept
+        pass
+
+    def close(self):
+        if self.executor != None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -13,7 +13,7 @@
 
 import os
 
-from sources.common import CFile, CFileException
+from sources.common import CFile, CFileException, CName
 
 
 class CConfig():
@@ -24,14 +24,62 @@ class CConfig():
 
         self.path_dependencies = str()
         self.the_filenames = list()
+        # the folders not walked to find the files, the .gitignore files read, the threads to read and parse the files
+        self.the_ignored_folders = ['.git', 'node_modules', 'build', 'vendor']
+        self.gitignore = 'yes'
+        self.number_of_threads_to_read_the_files = 1
         self.path_licenses = str()
         self.number_of_errors_max = 999
+        self.number_of_parallel_downloads = 1
+        self.the_numbers_of_parallel_downloads_by_platform = dict()
+        self.number_of_requests_per_second = 0
+        # npmjs.com blocks the requests sent faster than one each 2.5 seconds
+        self.the_numbers_of_requests_per_second_by_platform = {CName().package_json: 0.4}
+        self.size_of_the_pool_of_connections = 10
+        self.keep_alive = 'yes'
+        self.path_cache = str()
+        self.time_to_live_of_the_cache = 0
+        self.the_times_to_live_of_the_cache_by_platform = dict()
+        self.maximal_delay_of_a_deferred_retry = 900
+        self.number_of_deferred_retries = 3
+        self.number_of_retries = 3
+        self.budget_of_retries = 100
+        self.timeout = 30
+        self.in_memory = 'no'
+        self.to_write = 'yes'
+        self.to_stream = 'no'
+        self.html_parser = 'fast'
+        self.number_of_parsing_processes = 0
+        # the licenses of the installed packages, before the downloads
+        self.local_installations = 'yes'
+        # the POMs of Gradle downloaded from Maven Central when they are not in the caches
+        self.maven_central = 'no'
+        self.path_cargo_home = os.getenv('CARGO_HOME', os.path.join(os.path.expanduser('~'), '.cargo'))
+        path_go = os.getenv('GOPATH', os.path.join(os.path.expanduser('~'), 'go')).split(os.pathsep)[0]
+        self.path_go_modules = os.getenv('GOMODCACHE', os.path.join(path_go, 'pkg', 'mod'))
+        self.path_maven_repository = os.path.join(os.path.expanduser('~'), '.m2', 'repository')
+        path_gradle = os.getenv('GRADLE_USER_HOME', os.path.join(os.path.expanduser('~'), '.gradle'))
+        self.path_gradle_caches = os.path.join(path_gradle, 'caches', 'modules-2', 'files-2.1')
+        path_cocoapods = os.getenv('CP_HOME_DIR', os.path.join(os.path.expanduser('~'), '.cocoapods'))
+        self.path_cocoapods_repos = os.getenv('CP_REPOS_DIR', os.path.join(path_cocoapods, 'repos'))
+        # the licenses of GitHub by batches of GraphQL queries, with a token
+        self.github_token = os.getenv('GITHUB_API_TOKEN', str())
 
         self.filename_for_the_licenses = 'licenses_[platform].txt'
         self.path_errors = str()
         self.model_for_errors_file = 'errors_[platform].txt'
 
         self.separator = ' = '
+        self.separator_for_platform = ' for '
+
+    def get_platform_in_options(self, options):
+        platform = None
+
+        if self.separator_for_platform in options:
+            platform = options.split(self.separator_for_platform)[1]
+            platform = platform.strip()
+
+        return platform
 
     def extract_data_from_ini_file(self, the_lines):
 
@@ -44,7 +92,63 @@ class CConfig():
             value = the_parameters[1]
             value = value.strip()
 
-            if "parse" in options:
+            if "local installations" in options:
+                self.local_installations = value
+            elif "Maven Central" in options:
+                self.maven_central = value
+            elif "gitignore" in options:
+                self.gitignore = value
+            elif "ignored folders" in options:
+                self.the_ignored_folders = list()
+                if value != str():
+                    self.the_ignored_folders = value.split(", ")
+            elif "threads to read" in options:
+                self.number_of_threads_to_read_the_files = value
+            elif "deferred retries" in options:
+                self.number_of_deferred_retries = value
+            elif "deferred retry" in options:
+                self.maximal_delay_of_a_deferred_retry = value
+            elif "retries on" in options:
+                self.number_of_retries = value
+            elif "budget" in options:
+                self.budget_of_retries = value
+            elif "timeout" in options:
+                self.timeout = value
+            elif "in memory" in options:
+                self.in_memory = value
+            elif "downloaded files" in options:
+                self.to_write = value
+            elif "stream" in options:
+                self.to_stream = value
+            elif "parser" in options:
+                self.html_parser = value
+            elif "processes" in options:
+                self.number_of_parsing_processes = value
+            elif "parallel downloads" in options:
+                platform = self.get_platform_in_options(options)
+                if platform == None:
+                    self.number_of_parallel_downloads = value
+                else:
+                    self.the_numbers_of_parallel_downloads_by_platform[platform] = value
+            elif "requests per second" in options:
+                platform = self.get_platform_in_options(options)
+                if platform == None:
+                    self.number_of_requests_per_second = value
+                else:
+                    self.the_numbers_of_requests_per_second_by_platform[platform] = value
+            elif "pool of connections" in options:
+                self.size_of_the_pool_of_connections = value
+            elif "alive" in options:
+                self.keep_alive = value
+            elif "time to live" in options:
+                platform = self.get_platform_in_options(options)
+                if platform == None:
+                    self.time_to_live_of_the_cache = value
+                else:
+                    self.the_times_to_live_of_the_cache_by_platform[platform] = value
+            elif "cache" in options:
+                self.path_cache = value
+            elif "parse" in options:
                 self.path_dependencies = value
             elif "file" in options:
                 if value != str():
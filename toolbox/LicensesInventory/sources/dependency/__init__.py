@@ -11,5 +11,7 @@
 # Authors: See CONTRIBUTORS.txt
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
+from .dependency_sets import *
+from .lockfiles import *
 from .parsings import *
 from .dependencies import *
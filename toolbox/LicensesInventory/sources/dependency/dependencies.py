@@ -11,8 +11,8 @@
 # Authors: See CONTRIBUTORS.txt
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
-from sources.common import CName, CDate, CFile
-from sources.dependency import CParsing
+from sources.common import CName, CDate, CFile, get_the_dependency_of_the_error
+from sources.dependency import CParsing, CDependencySet
 from sources.common import CChoice, CPrompt
 ins_prompt = CPrompt()
 
@@ -29,24 +29,26 @@ class CDependencies:
     def delete_the_duplicated(self, the_dependencies_by_platform):
         result = dict()
 
-        separator = ':::'
         for platform, the_dependencies in the_dependencies_by_platform.items():
-            the_new_dependencies = list()
-            for i_dependency in range(0, len(the_dependencies)):
-                my_copy = the_dependencies[i_dependency + 1:]
-                if the_dependencies[i_dependency] not in my_copy:
-                    the_new_dependencies.append(the_dependencies[i_dependency])
-            result[platform] = the_new_dependencies
+            # the last of the same dependencies is kept, at its place
+            ins_dependency_set = CDependencySet(platform)
+            for dependency in the_dependencies:
+                ins_dependency_set.add_at_the_end(dependency)
+            result[platform] = ins_dependency_set.get_the_dependencies()
 
         return result
 
-    def get_the_data(self, ins_filter, the_lines_by_platform):
+    def get_the_data(self, ins_filter, the_files_by_platform):
         result = dict()
 
-        for platform, the_lines in the_lines_by_platform.items():
-            self.ins_parsing.the_heads = ins_filter.the_heads[platform]
-            self.ins_parsing.the_foot = ins_filter.the_foot[platform]
-            the_new_dependencies = self.ins_parsing.route(platform, the_lines, ins_filter)
+        for platform, the_files in the_files_by_platform.items():
+            if platform in self.ins_name.the_files_read_by_their_parser:
+                result[platform] = self.ins_parsing.route(platform, the_files, ins_filter)
+                continue
+
+            # the manifests are read and parsed file by file
+            the_new_dependencies = self.ins_parsing.get_the_dependencies_of_the_manifests(platform, the_files, ins_filter)
+            if len(the_new_dependencies) == 0: continue
             result[platform] = the_new_dependencies
 
         return result
@@ -61,10 +63,8 @@ class CDependencies:
                 if CDate().prefix_for_date in line: continue
                 the_fields = line.split(CFile().separator)
                 if len(the_fields) < 2: continue
-                dependency = [the_fields[1]]
-                if len(the_fields) > 2:
-                    dependency += [the_fields[2]]
-                the_dependencies.append(dependency)
+                # all the fields of the dependency (component, namespace, version), after the error code
+                the_dependencies.append(get_the_dependency_of_the_error(the_fields))
 
             result[platform] = the_dependencies
 
@@ -88,11 +88,20 @@ class CDependencies:
         if the_dependencies_by_platform == the_dependencies_on_error_by_platform:
             return result
 
+        # the dependencies on error of all the platforms of a registry (package.json and its lockfiles...)
+        the_sets_on_error_by_registry = dict()
         for platform, the_d_on_error in the_dependencies_on_error_by_platform.items():
-            if platform not in the_dependencies_by_platform.keys(): continue
-            the_d = the_dependencies_by_platform[platform]
+            registry = self.ins_name.get_the_platform_of_the_packages(platform)
+            ins_d_on_error = the_sets_on_error_by_registry.setdefault(registry, CDependencySet(registry))
+            for d in the_d_on_error:
+                ins_d_on_error.add(d)
+
+        for platform, the_d in the_dependencies_by_platform.items():
+            registry = self.ins_name.get_the_platform_of_the_packages(platform)
+            if registry not in the_sets_on_error_by_registry.keys(): continue
+            ins_d_on_error = the_sets_on_error_by_registry[registry]
             for d in the_d:
-                if d not in the_d_on_error: continue
+                if ins_d_on_error.contains(d) == False: continue
                 if platform not in result.keys():
                     result[platform] = [d]
                 else:
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+from ..common import CName
+
+
+class CDependencySet:
+    """
+    The dependencies of a platform, each once, in the order they are added, indexed by a canonical key:
+    the fields without spaces, and for Swift the URL of the repository in lower case, without / nor .git at the end.
+    Adding, searching and removing a dependency do not depend on the number of dependencies.
+    """
+
+    def __init__(self, platform=None, the_dependencies=list()):
+        self.ins_name = CName()
+        self.platform = self.ins_name.get_the_platform_of_the_packages(platform)
+        # the dicts keep the order of the keys
+        self.the_dependencies_by_key = dict()
+        for dependency in the_dependencies:
+            self.add(dependency)
+
+    def get_key(self, dependency):
+        the_fields = list()
+        for field in dependency:
+            if type(field) == str:
+                field = field.strip()
+            the_fields.append(field)
+
+        if (self.platform == self.ins_name.swift) and (len(the_fields) > 0) and (type(the_fields[0]) == str):
+            url = the_fields[0].lower().rstrip('/')
+            if url.endswith('.git') == True:
+                url = url[:-len('.git')]
+            the_fields[0] = url
+
+        return tuple(the_fields)
+
+    def add(self, dependency):
+        # False if the dependency is already in the set: the first one is kept
+        key = self.get_key(dependency)
+        if key in self.the_dependencies_by_key.keys(): return False
+        self.the_dependencies_by_key[key] = dependency
+        return True
+
+    def add_at_the_end(self, dependency):
+        # the dependency is moved at the end if it is already in the set
+        key = self.get_key(dependency)
+        self.the_dependencies_by_key.pop(key, None)
+        self.the_dependencies_by_key[key] = dependency
+
+    def contains(self, dependency):
+        return self.get_key(dependency) in self.the_dependencies_by_key.keys()
+
+    def size(self):
+        return len(self.the_dependencies_by_key)
+
+    def get_the_dependencies(self):
+        return list(self.the_dependencies_by_key.values())
@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import re
+import json
+try:
+    # python 3.11+
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from ..common import CName, CWorkers, CDependency
+
+
+class CJSONTokens:
+    """
+    The tokens of a JSON file read by parts: strings, literals and punctuation,
+    without loading the file in memory
+    """
+
+    def __init__(self, size_of_the_parts=1048576):
+        self.size_of_the_parts = size_of_the_parts
+        self.pattern = re.compile(r'\s*("[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]:,]|[^\s{}\[\]:,"]+)')
+
+    def get(self, file):
+        with open(file, 'rt', encoding='utf-8') as f:
+            text = str()
+            is_the_end = False
+            while is_the_end == False:
+                part = f.read(self.size_of_the_parts)
+                is_the_end = part == str()
+                text += part
+                pos = 0
+                while True:
+                    m = self.pattern.match(text, pos)
+                    # a token at the end of the part can continue in the next one
+                    if (m == None) or ((m.end() == len(text)) and (is_the_end == False)):
+                        break
+                    pos = m.end()
+                    yield m.group(1)
+                text = text[pos:]
+
+
+class CFrame:
+    """
+    An object or an array being read in a JSON file
+    """
+
+    def __init__(self, kind, key, is_a_package):
+        self.kind = kind
+        self.key = key
+        self.is_a_package = is_a_package
+        self.current_key = None
+        self.is_a_value = False
+        self.the_fields = dict()
+
+
+class CLockfiles:
+    """
+    The dependencies of the lockfiles (npm, yarn, pnpm, Cargo.lock, go.sum, Package.resolved, pubspec.lock,
+    gradle.lockfile) and of go.mod and libs.versions.toml, read line by line (or by parts for JSON):
+    the name and the version of each package, once, whatever the size of the file.
+    For Gradle, like build.gradle: the artifact, the group (with / for .) and the version
+    """
+
+    def __init__(self):
+        self.ins_name = CName()
+        self.ins_json_tokens = CJSONTokens()
+        self.the_urls_of_pub = ['https://pub.dev', 'https://pub.dartlang.org']
+
+    def add(self, name, version, the_dependencies, the_keys):
+        if (name == None) or (version == None): return
+        name = name.strip()
+        version = version.strip()
+        if (name == str()) or (version == str()): return
+
+        # an alias: "version": "npm:real-name@1.0.0"
+        if version.find('npm:') == 0:
+            value = version[len('npm:'):]
+            p = value.rfind('@')
+            if p > 0:
+                name = value[:p]
+                version = value[p + 1:]
+
+        key = (name, version)
+        if key in the_keys: return
+        the_keys.add(key)
+        the_dependencies.append([name, version])
+
+    def get_name_of_the_package(self, path):
+        # node_modules/a/node_modules/@scope/b: @scope/b
+        p = path.rfind('node_modules/')
+        if p < 0: return None
+        return path[p + len('node_modules/'):]
+
+    def is_a_package(self, the_frames, key):
+        # the objects of "packages" (v2, v3), and of "dependencies" in the root and in these objects (v1)
+        parent = the_frames[-1]
+        if parent.kind != '{': return False
+        if (len(the_frames) == 2) and (parent.key == 'packages'):
+            return True
+        if parent.key != 'dependencies': return False
+        return (len(the_frames) == 2) or (the_frames[-2].is_a_package == True)
+
+    def read_the_package(self, frame, the_frames, the_dependencies, the_keys):
+        version = frame.the_fields.get('version')
+        if (len(the_frames) == 2) and (the_frames[-1].key == 'packages'):
+            # not the project, nor the packages of the workspace
+            name = self.get_name_of_the_package(frame.key)
+            if name == None: return
+            name = frame.the_fields.get('name', name)
+        else:
+            name = frame.key
+        self.add(name, version, the_dependencies, the_keys)
+
+    def get_the_dependencies_of_package_lock(self, file):
+        the_dependencies = list()
+        the_keys = set()
+
+        the_frames = list()
+        for token in self.ins_json_tokens.get(file):
+            frame = None
+            if len(the_frames) > 0:
+                frame = the_frames[-1]
+
+            if token in ['{', '[']:
+                key = None
+                if (frame != None) and (frame.kind == '{'):
+                    key = frame.current_key
+                is_a_package = (token == '{') and (len(the_frames) > 0) and (self.is_a_package(the_frames, key) == True)
+                the_frames.append(CFrame(token, key, is_a_package))
+            elif token in ['}', ']']:
+                if len(the_frames) == 0: continue
+                frame = the_frames.pop()
+                if frame.is_a_package == True:
+                    self.read_the_package(frame, the_frames, the_dependencies, the_keys)
+            elif frame == None:
+                continue
+            elif token == ':':
+                frame.is_a_value = True
+            elif token == ',':
+                frame.current_key = None
+                frame.is_a_value = False
+            elif frame.kind == '{':
+                value = token
+                if token[0] == '"':
+                    value = token[1:-1]
+                    if '\\' in value:
+                        value = json.loads(token)
+                if frame.is_a_value == False:
+                    frame.current_key = value
+                elif (frame.is_a_package == True) and (frame.current_key in ['name', 'version']) and (token[0] == '"'):
+                    frame.the_fields[frame.current_key] = value
+
+        return the_dependencies
+
+    def get_name_and_version(self, spec, separator='@'):
+        # @scope/name@1.0.0: (@scope/name, 1.0.0)
+        p = spec.find(separator, 1)
+        if p < 0: return (None, None)
+        return (spec[:p], spec[p + len(separator):])
+
+    def get_the_dependencies_of_yarn_lock(self, file):
+        # "name@^1.0.0", name@~1.0.1:
+        #   version "1.0.2"     (or version: 1.0.2 for yarn 2+)
+        the_dependencies = list()
+        the_keys = set()
+
+        name = None
+        with open(file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                if (line == str()) or (line.lstrip().find('#') == 0):
+                    continue
+                if line[0] != ' ':
+                    spec = line.rstrip(':').split(',')[0].strip().strip('"')
+                    name, version_range = self.get_name_and_version(spec)
+                    # the projects of the workspace are not dependencies
+                    if (version_range == None) or (version_range.find('workspace:') == 0) or (version_range.find('link:') == 0):
+                        name = None
+                    continue
+                if name == None:
+                    continue
+
+                value = line.strip()
+                if (value.find('version ') == 0) or (value.find('version:') == 0):
+                    version = value[len('version'):].lstrip(':').strip().strip('"')
+                    self.add(name, version, the_dependencies, the_keys)
+                    name = None
+
+        return the_dependencies
+
+    def get_the_dependencies_of_pnpm_lock(self, file):
+        # packages:
+        #   /name/1.0.0:                 (lockfile 5)
+        #   /@scope/name@1.0.0(peer@2):  (lockfile 6)
+        #   '@scope/name@1.0.0':         (lockfile 9, and in snapshots:)
+        the_dependencies = list()
+        the_keys = set()
+
+        major_version = 9
+        section = str()
+        with open(file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                if (line == str()) or (line.lstrip().find('#') == 0):
+                    continue
+                if line[0] != ' ':
+                    section = line.split(':')[0].strip()
+                    if section == 'lockfileVersion':
+                        value = line.split(':', 1)[1].strip().strip('\'"')
+                        try:
+                            major_version = int(float(value))
+                        except ValueError as e:
+                            major_version = 9
+                    continue
+                if section not in ['packages', 'snapshots']:
+                    continue
+                if (line.find('  ') != 0) or (line[2] == ' ') or (line.endswith(':') == False):
+                    continue
+
+                key = line.strip().rstrip(':').strip('\'"')
+                key = key.split('(')[0]
+                if major_version < 6:
+                    # the packages of the registry only, not the tarballs
+                    p = key.rfind('/')
+                    if (key.find('/') != 0) or (p < 1): continue
+                    key = key[1:]
+                    p -= 1
+                    name = key[:p]
+                    version = key[p + 1:].split('_')[0]
+                else:
+                    name, version = self.get_name_and_version(key.lstrip('/'))
+                self.add(name, version, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def get_the_packages_of_cargo_lock(self, file):
+        # the [[package]] tables, without tomllib: name = "serde", version = "1.0.0", source = "..."
+        if tomllib != None:
+            with open(file, 'rb') as f:
+                return tomllib.load(f).get('package', list())
+
+        the_packages = list()
+        with open(file, 'rt', encoding='utf-8') as f:
+            package = None
+            for line in f:
+                line = line.strip()
+                if line.startswith('[') == True:
+                    package = None
+                    if line == '[[package]]':
+                        package = dict()
+                        the_packages.append(package)
+                    continue
+                if package == None:
+                    continue
+                m = re.match(r'^([A-Za-z_-]+)\s*=\s*"(.*)"$', line)
+                if m != None:
+                    package[m.group(1)] = m.group(2)
+
+        return the_packages
+
+    def get_the_dependencies_of_cargo_lock(self, file):
+        the_dependencies = list()
+        the_keys = set()
+
+        for package in self.get_the_packages_of_cargo_lock(file):
+            # the crates of the workspace have no source: they are the project
+            if package.get('source') == None: continue
+            self.add(package.get('name'), package.get('version'), the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def get_the_directives_of_go_mod(self, file):
+        # (verb, the fields) of each line, with the blocks like require ( ... )
+        with open(file, 'rt', encoding='utf-8') as f:
+            verb = None
+            for line in f:
+                p = line.find('//')
+                comment = str()
+                if p > -1:
+                    comment = line[p:]
+                    line = line[:p]
+                the_fields = line.split()
+                if len(the_fields) == 0:
+                    continue
+                if the_fields == [')']:
+                    verb = None
+                    continue
+                if (verb == None) and (the_fields[-1] == '('):
+                    verb = the_fields[0]
+                    continue
+                # the indirect dependencies are not in the inventory
+                if comment.replace(' ', str()).find('//indirect') == 0:
+                    continue
+                if verb != None:
+                    yield (verb, the_fields)
+                else:
+                    yield (the_fields[0], the_fields[1:])
+
+    def get_the_dependencies_of_go_mod(self, file):
+        # require a v1.0.0 / replace a [v1.0.0] => b v1.1.0, or => ../local
+        the_requirements = list()
+        the_replacements = dict()
+
+        for verb, the_fields in self.get_the_directives_of_go_mod(file):
+            the_fields = [field.strip('"`') for field in the_fields]
+            if (verb == 'require') and (len(the_fields) >= 2):
+                the_requirements.append((the_fields[0], the_fields[1]))
+            elif (verb == 'replace') and ('=>' in the_fields):
+                p = the_fields.index('=>')
+                old = tuple(the_fields[:p])
+                new = the_fields[p + 1:]
+                # a local folder keeps the module
+                if len(new) == 2:
+                    the_replacements[old] = (new[0], new[1])
+
+        the_dependencies = list()
+        the_keys = set()
+        for module, version in the_requirements:
+            replacement = the_replacements.get((module, version), the_replacements.get((module,)))
+            if replacement != None:
+                module, version = replacement
+            self.add(module, version, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def get_the_dependencies_of_go_sum(self, file):
+        # a v1.0.0 h1:...= for the code, a v1.0.0/go.mod h1:...= for the go.mod only
+        the_dependencies = list()
+        the_keys = set()
+
+        with open(file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                the_fields = line.split()
+                if len(the_fields) < 2: continue
+                if the_fields[1].endswith('/go.mod') == True: continue
+                self.add(the_fields[0], the_fields[1], the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def get_the_dependencies_of_package_resolved(self, file):
+        # version 1: {"object": {"pins": [{"repositoryURL": ...}]}}, versions 2 and 3: {"pins": [{"location": ...}]}
+        the_dependencies = list()
+        the_keys = set()
+
+        with open(file, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if type(data) != dict: return the_dependencies
+        if type(data.get('object')) == dict:
+            data = data['object']
+
+        for pin in data.get('pins', list()):
+            if type(pin) != dict: continue
+            url = pin.get('location', pin.get('repositoryURL'))
+            if type(url) != str: continue
+            # like Package.swift: the repositories of GitHub
+            if (url.find('https://github.com') != 0) and (url.find('http://github.com') != 0): continue
+            state = pin.get('state')
+            if type(state) != dict: continue
+            # a branch has no version: its commit
+            version = state.get('version')
+            if type(version) != str:
+                version = state.get('revision')
+            if type(version) != str: continue
+            self.add(url, version, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def add_a_package_of_pub(self, package, the_dependencies, the_keys):
+        # the packages of pub.dev: the hosted ones, not the sdk, path and git ones
+        if package == None: return
+        if package.get('source') != 'hosted': return
+        if package.get('url', self.the_urls_of_pub[0]) not in self.the_urls_of_pub: return
+        self.add(package.get('name'), package.get('version'), the_dependencies, the_keys)
+
+    def get_the_dependencies_of_pubspec_lock(self, file):
+        # packages: / name: / source, version / description: / name, url
+        the_dependencies = list()
+        the_keys = set()
+
+        with open(file, 'rt', encoding='utf-8') as f:
+            in_the_packages = False
+            package = None
+            for line in f:
+                line = line.rstrip()
+                if (line == str()) or (line.lstrip().startswith('#') == True): continue
+                indent = len(line) - len(line.lstrip())
+                line = line.strip()
+                if indent == 0:
+                    in_the_packages = (line == 'packages:')
+                    continue
+                if in_the_packages == False: continue
+
+                p = line.find(':')
+                if p < 0: continue
+                key = line[:p].strip().strip('"\'')
+                value = line[p + 1:].strip().strip('"\'')
+                if indent == 2:
+                    self.add_a_package_of_pub(package, the_dependencies, the_keys)
+                    package = {'name': key}
+                elif package == None:
+                    continue
+                elif (indent == 4) and (key in ['source', 'version']):
+                    package[key] = value
+                elif (indent == 6) and (key in ['name', 'url']) and (value != str()):
+                    package[key] = value.rstrip('/')
+            self.add_a_package_of_pub(package, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def add_an_artifact(self, coordinates, the_dependencies, the_keys):
+        # group:artifact[:version], as [artifact, group, version] like build.gradle
+        the_fields = coordinates.strip().split(':')
+        if (len(the_fields) < 2) or (the_fields[0] == str()) or (the_fields[1] == str()): return
+        dependency = [the_fields[1], the_fields[0].replace('.', '/')]
+        if (len(the_fields) > 2) and (the_fields[2] != str()):
+            dependency.append(the_fields[2])
+
+        key = tuple(dependency)
+        if key in the_keys: return
+        the_keys.add(key)
+        the_dependencies.append(dependency)
+
+    def get_the_dependencies_of_gradle_lockfile(self, file):
+        # group:artifact:version=configurations, empty=configurations
+        the_dependencies = list()
+        the_keys = set()
+
+        with open(file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if (line == str()) or (line.startswith('#') == True): continue
+                coordinates = line.split('=')[0]
+                if coordinates == 'empty': continue
+                self.add_an_artifact(coordinates, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def read_the_inline_table(self, the_tokens, i):
+        # { key = "value", key.sub = "value", key = { ... } }, as nested dicts like tomllib, and the next token
+        table = dict()
+        i += 1
+        while (i < len(the_tokens)) and (the_tokens[i] != '}'):
+            if the_tokens[i] == ',':
+                i += 1
+                continue
+            the_keys = the_tokens[i].strip('"\'').split('.')
+            if (i + 2 >= len(the_tokens)) or (the_tokens[i + 1] != '='): break
+            value = the_tokens[i + 2]
+            if value == '{':
+                value, i = self.read_the_inline_table(the_tokens, i + 2)
+            else:
+                value = value.strip('"\'')
+                i += 3
+            parent = table
+            for key in the_keys[:-1]:
+                parent = parent.setdefault(key, dict())
+            parent[the_keys[-1]] = value
+
+        return (table, i + 1)
+
+    def get_the_tables_of_version_catalog(self, file):
+        # [versions] and [libraries], without tomllib: the values are strings or inline tables
+        if tomllib != None:
+            with open(file, 'rb') as f:
+                return tomllib.load(f)
+
+        data = dict()
+        pattern = re.compile(r'\s*([{}=,]|"[^"]*"|\'[^\']*\'|[^\s{}=,"\']+)')
+        with open(file, 'rt', encoding='utf-8') as f:
+            table = None
+            for line in f:
+                line = line.strip()
+                m = re.match(r'^\[([A-Za-z0-9_.-]+)\]', line)
+                if m != None:
+                    table = None
+                    if m.group(1) in ['versions', 'libraries']:
+                        table = data.setdefault(m.group(1), dict())
+                    continue
+                if (table == None) or (line == str()) or (line.startswith('#') == True): continue
+
+                the_tokens = pattern.findall(line)
+                if (len(the_tokens) < 3) or (the_tokens[1] != '='): continue
+                key = the_tokens[0].strip('"\'')
+                if the_tokens[2] == '{':
+                    table[key] = self.read_the_inline_table(the_tokens, 2)[0]
+                else:
+                    table[key] = the_tokens[2].strip('"\'')
+
+        return data
+
+    def get_version_of_version_catalog(self, value, the_versions):
+        # "1.0", { ref = "name" } or { strictly = "1.0" }, { require = "1.0" }, { prefer = "1.0" }
+        if type(value) == dict:
+            if 'ref' in value.keys():
+                value = the_versions.get(value['ref'])
+                if type(value) == dict:
+                    return self.get_version_of_version_catalog(value, dict())
+            else:
+                for key in ['strictly', 'require', 'prefer']:
+                    if type(value.get(key)) == str:
+                        return value[key]
+        if type(value) != str: return str()
+        return value
+
+    def get_the_dependencies_of_version_catalog(self, file):
+        # the [libraries] of gradle/libs.versions.toml, with the versions of [versions]
+        the_dependencies = list()
+        the_keys = set()
+
+        data = self.get_the_tables_of_version_catalog(file)
+        the_versions = data.get('versions', dict())
+        for library in data.get('libraries', dict()).values():
+            # "group:artifact:version", { module = "group:artifact", version... } or { group, name, version... }
+            if type(library) == str:
+                self.add_an_artifact(library, the_dependencies, the_keys)
+                continue
+            if type(library) != dict: continue
+            module = library.get('module')
+            if (type(module) != str) and (type(library.get('group')) == str) and (type(library.get('name')) == str):
+                module = library['group'] + ':' + library['name']
+            if type(module) != str: continue
+            version = self.get_version_of_version_catalog(library.get('version'), the_versions)
+            self.add_an_artifact(module + ':' + version, the_dependencies, the_keys)
+
+        return the_dependencies
+
+    def get_the_dependencies_of_a_file(self, platform, file):
+        the_dependencies = list()
+        if platform == self.ins_name.package_lock:
+            the_dependencies = self.get_the_dependencies_of_package_lock(file)
+        elif platform == self.ins_name.yarn_lock:
+            the_dependencies = self.get_the_dependencies_of_yarn_lock(file)
+        elif platform == self.ins_name.pnpm_lock:
+            the_dependencies = self.get_the_dependencies_of_pnpm_lock(file)
+        elif platform == self.ins_name.roast:
+            the_dependencies = self.get_the_dependencies_of_cargo_lock(file)
+        elif platform == self.ins_name.go:
+            the_dependencies = self.get_the_dependencies_of_go_mod(file)
+        elif platform == self.ins_name.go_sum:
+            the_dependencies = self.get_the_dependencies_of_go_sum(file)
+        elif platform == self.ins_name.swift_resolved:
+            the_dependencies = self.get_the_dependencies_of_package_resolved(file)
+        elif platform == self.ins_name.flutter_lock:
+            the_dependencies = self.get_the_dependencies_of_pubspec_lock(file)
+        elif platform == self.ins_name.gradle_lock:
+            the_dependencies = self.get_the_dependencies_of_gradle_lockfile(file)
+        elif platform == self.ins_name.gradle_catalog:
+            the_dependencies = self.get_the_dependencies_of_version_catalog(file)
+
+        return the_dependencies
+
+    def get_the_dependencies(self, platform, the_files, number_of_workers=1):
+        result = list()
+        the_keys = set()
+
+        # the files are parsed by a pool of threads, the dependencies are kept in the order of the files
+        the_items = [(platform, file) for file in the_files]
+        for the_dependencies in CWorkers(number_of_workers).map(self.get_the_dependencies_of_a_file, the_items):
+            for dependency in the_dependencies:
+                dependency = CDependency(dependency)
+                if dependency in the_keys: continue
+                the_keys.add(dependency)
+                result.append(dependency)
+
+        return result
@@ -12,7 +12,8 @@
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
 from ..common import CData, CDataInBlock
-from ..common import CName
+from ..common import CName, CDependency, CWorkers
+from .lockfiles import CLockfiles
 
 
 class CParsing:
@@ -170,25 +171,6 @@ class CParsing:
 
         return result
 
-    def manage_roast(self, the_lines):
-        result = list()
-
-        separator = ' = '
-        head = '[[package]]'
-        for line in the_lines:
-                if line.strip().find('name') != 0:
-                    continue
-
-                the_fields = line.split(separator)
-                if len(the_fields) == 2:
-                    component = the_fields[1]
-                    component = component.strip()
-                    component = component.replace(self.ins_data.quote, str())
-                    my_list = [component]
-                    result.append(my_list)
-
-        return result
-
     def check_allowed_characters_in_string(self, my_string, the_allowed_characters):
         number_found = True
 
@@ -305,22 +287,6 @@ class CParsing:
 
         return result
 
-    def manage_go(self, the_lines):
-        result = list()
-
-        for line in the_lines:
-            line_with_indirect = line.replace(' ', '')
-            if '//indirect' in line_with_indirect:
-                continue
-
-            new_line = line.strip()
-            the_fields = new_line.split(' ')
-            component = the_fields[0]
-            my_list = [component]
-            result.append(my_list)
-
-        return result
-
     def manage_swift(self, the_lines):
         result = list()
 
@@ -370,6 +336,34 @@ class CParsing:
 
         return result
 
+    def get_data_for_cocoapods_lock(self, the_lines):
+        # the pods of the PODS section with their version: '  - "Firebase/Core (8.0.0)":'
+        result = list()
+        # the pods already found: the subspecs give the same root pod
+        the_found = set()
+
+        in_the_pods = False
+        for line in the_lines:
+            if (line != str()) and (line[0] != ' '):
+                in_the_pods = line.strip() == 'PODS:'
+                continue
+            if (in_the_pods == False) or (line.find('  - ') != 0):
+                continue
+
+            value = line[len('  - '):].strip().rstrip(':').strip(self.ins_data.quote)
+            p = value.find(' (')
+            if p < 0:
+                continue
+            # the license is the one of the root pod, not of its subspecs
+            component = value[:p].split('/')[0]
+            version = value[p + len(' ('):].rstrip(')')
+            if (component, version) in the_found:
+                continue
+            the_found.add((component, version))
+            result.append([component, version])
+
+        return result
+
     def manage_elm_lang(self, the_lines):
         result = list()
 
@@ -393,6 +387,27 @@ class CParsing:
 
         return the_dependencies_on_error
 
+    def get_the_dependencies_of_a_manifest(self, platform, file, ins_filter):
+        # a parsing by file: the lines of one file only are in memory, and the threads share nothing
+        ins_parsing = CParsing()
+        ins_parsing.the_heads = ins_filter.the_heads[platform]
+        ins_parsing.the_foot = ins_filter.the_foot[platform]
+        the_lines = list(ins_filter.get_the_lines_of_the_file(file, platform))
+        return ins_parsing.route(platform, the_lines, ins_filter)
+
+    def get_the_dependencies_of_the_manifests(self, platform, the_files, ins_filter):
+        result = list()
+
+        # the files are read and parsed by a pool of threads, the dependencies are kept in the order of the files
+        number_of_workers = 1
+        if ins_filter.ins_config != None:
+            number_of_workers = ins_filter.ins_config.number_of_threads_to_read_the_files
+        the_items = [(platform, file, ins_filter) for file in the_files]
+        for the_dependencies in CWorkers(number_of_workers).map(self.get_the_dependencies_of_a_manifest, the_items):
+            result += the_dependencies
+
+        return result
+
     def route(self, language, the_lines, ins_filter):
         result = list()
 
@@ -403,15 +418,19 @@ class CParsing:
             result = self.manage_gradle(the_lines)
         elif language == ins_name.package_json:
             result = self.manage_package_json(the_lines)
-        elif language == ins_name.roast:
-            result = self.manage_roast(the_lines)
-        elif language == ins_name.go:
-            result = self.manage_go(the_lines)
         elif language == ins_name.flutter:
             result = self.get_data_for_flutter(the_lines)
         elif language == ins_name.swift:
             result = self.manage_swift(the_lines)
         elif language == ins_name.cocoapods:
             result = self.get_data_for_cocoapods(the_lines)
-
-        return result
+        elif language == ins_name.cocoapods_lock:
+            result = self.get_data_for_cocoapods_lock(the_lines)
+        elif language in ins_name.the_files_read_by_their_parser:
+            # the lines are the files to read
+            number_of_workers = 1
+            if (ins_filter != None) and (ins_filter.ins_config != None):
+                number_of_workers = ins_filter.ins_config.number_of_threads_to_read_the_files
+            return CLockfiles().get_the_dependencies(language, the_lines, number_of_workers)
+
+        return [CDependency(dependency) for dependency in result]
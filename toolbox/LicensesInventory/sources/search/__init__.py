@@ -11,6 +11,18 @@
 # Authors: See CONTRIBUTORS.txt
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
+from .sessions import *
+from .caches import *
+from .rate_limits import *
+from .retries import *
+from .deferred import *
 from .downloads import *
 from .parsings import *
+from .html_parsings import *
+from .github import *
+from .crates import *
+from .node_modules import *
+from .module_caches import *
+from .maven_caches import *
+from .cocoapods_specs import *
 from .search import *
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from sources.common import CName
+
+
+class CCachedResponse:
+    """
+    A response read from the cache, with the attributes used by the downloads
+    """
+
+    def __init__(self, entry, content):
+        self.status_code = entry['status_code']
+        self.headers = dict()
+        self.content = content
+        self.encoding = entry['encoding']
+        self.from_cache = True
+
+    @property
+    def text(self):
+        encoding = self.encoding
+        if encoding == None:
+            encoding = 'utf-8'
+        return self.content.decode(encoding, errors='replace')
+
+
+class CCache:
+    """
+    The downloaded pages by URL, on the disk, with their validators (ETag, Last-Modified):
+        - during the time to live of the platform, the page is not downloaded
+        - after, the page is requested again with If-None-Match and If-Modified-Since,
+          and a response 304 (not modified) gives the page of the cache
+    """
+
+    def __init__(self, path=str(), time_to_live=0, the_times_to_live_by_platform=dict()):
+        self.path = path
+        self.time_to_live = time_to_live
+        self.the_times_to_live_by_platform = the_times_to_live_by_platform
+        self.extension_for_entry = '.json'
+        self.extension_for_content = '.data'
+
+    def is_enabled(self):
+        return self.path != str()
+
+    def get_time_to_live(self, platform):
+        platform = CName().get_the_platform_of_the_packages(platform)
+        if platform in self.the_times_to_live_by_platform.keys():
+            return self.the_times_to_live_by_platform[platform]
+        return self.time_to_live
+
+    def get_files(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        # 256 sub folders to not have too many files in a folder
+        path = os.path.join(self.path, key[0:2])
+        file_entry = os.path.join(path, key + self.extension_for_entry)
+        file_content = os.path.join(path, key + self.extension_for_content)
+        return (path, file_entry, file_content)
+
+    def get(self, url):
+        # the entry of the URL, or None: without its page, the entry can not give the validators
+        if self.is_enabled() == False: return None
+
+        path, file_entry, file_content = self.get_files(url)
+        if os.path.isfile(file_content) == False: return None
+        try:
+            with open(file_entry, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception as e:
+            return None
+        if entry.get('url') != url: return None
+
+        return entry
+
+    def get_content(self, url):
+        path, file_entry, file_content = self.get_files(url)
+        with open(file_content, 'rb') as f:
+            return f.read()
+
+    def write_atomically(self, file, content, mode):
+        # the readers never see a file partially written, and each writer (process or thread) has its own file
+        descriptor, tmp = tempfile.mkstemp(dir=os.path.dirname(file), suffix='.tmp')
+        encoding = None
+        if 'b' not in mode:
+            encoding = 'utf-8'
+        try:
+            with open(descriptor, mode, encoding=encoding) as f:
+                f.write(content)
+            os.replace(tmp, file)
+        except BaseException as e:
+            if os.path.isfile(tmp) == True:
+                os.remove(tmp)
+            raise
+
+    def save(self, url, response):
+        path, file_entry, file_content = self.get_files(url)
+
+        entry = dict()
+        entry['url'] = url
+        entry['status_code'] = int(response.status_code)
+        entry['encoding'] = response.encoding
+        entry['etag'] = response.headers.get('ETag')
+        entry['last_modified'] = response.headers.get('Last-Modified')
+        entry['date'] = time.time()
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            self.write_atomically(file_content, response.content, 'wb')
+            self.write_atomically(file_entry, json.dumps(entry), 'wt')
+        except Exception as e:
+            print('INFO: the cache can not be written for ' + url + ': ' + e.__str__())
+
+    def refresh(self, url, entry):
+        path, file_entry, file_content = self.get_files(url)
+
+        entry = dict(entry)
+        entry['date'] = time.time()
+        try:
+            self.write_atomically(file_entry, json.dumps(entry), 'wt')
+        except Exception as e:
+            pass
+
+    def is_fresh(self, entry, platform):
+        if entry == None: return False
+        age = time.time() - entry['date']
+        return age < self.get_time_to_live(platform)
+
+    def get_the_validators(self, entry):
+        result = dict()
+
+        if entry == None: return result
+        if entry.get('etag') != None:
+            result['If-None-Match'] = entry['etag']
+        if entry.get('last_modified') != None:
+            result['If-Modified-Since'] = entry['last_modified']
+
+        return result
+
+    def get_response(self, url, entry):
+        # the page of the cache, or None if it can not be read
+        try:
+            content = self.get_content(url)
+        except Exception as e:
+            return None
+        return CCachedResponse(entry, content)
+
+    def manage(self, url, response, entry):
+        # the response to use after a request sent with the validators of the entry
+        if self.is_enabled() == False: return response
+
+        code = int(response.status_code)
+        if (code == 304) and (entry != None):
+            cached_response = self.get_response(url, entry)
+            if cached_response != None:
+                self.refresh(url, entry)
+                return cached_response
+        elif code == 200:
+            self.save(url, response)
+
+        return response
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import os
+import re
+import json
+import hashlib
+
+from sources.common import CName
+from .module_caches import CModuleCache
+
+
+class CCocoaPodsSpecs(CModuleCache):
+    """
+    The pods of the Specs repositories of CocoaPods: [CP_HOME_DIR]/repos/[repository]/Specs/.../[pod]/[version]/[pod].podspec.json,
+    the license is the one of the podspec. The folder of a pod is given by the MD5 of its name: the repositories
+    are not walked, and only the versions of the pods of the dependencies are listed.
+    """
+
+    def __init__(self, path=str()):
+        super().__init__([CName().cocoapods, CName().cocoapods_lock], path)
+        self.the_extensions = ['.podspec.json', '.podspec']
+        self.the_repositories = None
+        # the folders by version, by pod
+        self.the_folders_by_pod = dict()
+
+    def get_module(self, dependency):
+        # the license is the one of the root pod, not of its subspecs
+        return dependency[0].split('/')[0]
+
+    def get_podspec(self, folder, pod):
+        # the podspec of a version of a pod, or None
+        for extension in self.the_extensions:
+            file = os.path.join(folder, pod + extension)
+            if os.path.isfile(file) == True:
+                return file
+        return None
+
+    def get_the_repositories(self):
+        # the folders of the repositories, listed once
+        if self.the_repositories == None:
+            try:
+                the_entries = sorted(os.scandir(self.path), key=lambda entry: entry.name)
+            except OSError as e:
+                the_entries = list()
+            self.the_repositories = [e.path for e in the_entries if (e.is_dir() == True) and (e.name.startswith('.') == False)]
+        return self.the_repositories
+
+    def get_the_folders_of_the_pod(self, repository, pod):
+        # Specs/[md5 of the pod: 3 first characters]/[pod], else Specs/[pod] or [pod] (the private repositories)
+        digest = hashlib.md5(pod.encode('utf-8')).hexdigest()
+        return [
+            os.path.join(repository, 'Specs', digest[0], digest[1], digest[2], pod),
+            os.path.join(repository, 'Specs', pod),
+            os.path.join(repository, pod)
+        ]
+
+    def get_the_folders(self, module):
+        # the folders of the pod are found by their path, the repositories are not walked
+        if module not in self.the_folders_by_pod.keys():
+            the_folders = dict()
+            for repository in self.get_the_repositories():
+                for folder in self.get_the_folders_of_the_pod(repository, module):
+                    try:
+                        the_versions = sorted(os.listdir(folder))
+                    except OSError as e:
+                        continue
+                    for version in the_versions:
+                        path = os.path.join(folder, version)
+                        if self.get_podspec(path, module) == None: continue
+                        the_folders.setdefault(version, path)
+            self.the_folders_by_pod[module] = the_folders if len(the_folders) > 0 else None
+
+        return self.the_folders_by_pod[module]
+
+    def get_license_in_podspec(self, data):
+        # "license": "MIT" or "license": {"type": "MIT", "file": "LICENSE"}
+        license = data.get('license')
+        if type(license) == dict:
+            license = license.get('type')
+        if type(license) != str: return None
+        license = license.strip()
+        if license == str(): return None
+        return license
+
+    def read_the_license(self, folder):
+        pod = os.path.basename(os.path.dirname(folder))
+        file = self.get_podspec(folder, pod)
+        if file == None: return None
+
+        try:
+            with open(file, 'rt', encoding='utf-8') as f:
+                text = f.read()
+        except OSError as e:
+            return None
+
+        if file.endswith('.json') == True:
+            try:
+                data = json.loads(text)
+            except ValueError as e:
+                return None
+            if type(data) != dict: return None
+            return self.get_license_in_podspec(data)
+
+        # a podspec in Ruby: s.license = 'MIT' or s.license = { :type => 'MIT', :file => 'LICENSE' }
+        m = re.search(r'\.license\s*=\s*(\{[^}]*?(:type\s*=>|type:)\s*)?[\'"]([^\'"]+)[\'"]', text)
+        if m == None: return None
+        return m.group(3).strip()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import json
+
+from sources.common import CName, CWorkers
+from .parsings import CParsing
+
+
+class CCrates:
+    """
+    The licenses of the crates of Cargo.lock locked in several versions, resolved before their download:
+    the page of a crate (/api/v1/crates/[crate]) gives the license of each of its versions,
+    so a crate is requested once for all its versions, by the workers of the parallel downloads.
+    The listings of crates.io (/api/v1/crates?ids[]=...) give no license: they are not used.
+    The crates locked in one version, and the versions not found in the page, are downloaded as usual.
+    """
+
+    def __init__(self, ins_download=None, number_of_workers=1):
+        self.ins_download = ins_download
+        self.number_of_workers = number_of_workers
+        self.ins_name = CName()
+        self.ins_parsing = CParsing()
+
+    def is_enabled(self):
+        return self.ins_download != None
+
+    def get_the_dependencies_by_crate(self, the_dependencies):
+        # the crates with several dependencies only (several versions, or with and without version)
+        the_dependencies_by_crate = dict()
+        for dependency in the_dependencies:
+            the_dependencies_by_crate.setdefault(dependency[0], list()).append(dependency)
+
+        result = dict()
+        for crate, the_dependencies_of_the_crate in the_dependencies_by_crate.items():
+            if len(the_dependencies_of_the_crate) > 1:
+                result[crate] = the_dependencies_of_the_crate
+
+        return result
+
+    def get_data(self, result):
+        # the page of the crate decoded, or None
+        text = result.text
+        try:
+            if (text == None) and (result.file != None):
+                text = self.ins_parsing.read(result.file)
+            if text == None: return None
+            data = json.loads(text)
+        except (OSError, ValueError) as e:
+            return None
+        if type(data) != dict: return None
+
+        return data
+
+    def get_the_licenses_by_version(self, data):
+        the_licenses_by_version = dict()
+        the_versions = data.get('versions')
+        if type(the_versions) != list: return the_licenses_by_version
+
+        for version in the_versions:
+            if type(version) != dict: continue
+            license = version.get('license')
+            if (type(version.get('num')) == str) and (type(license) == str) and (license.strip() != str()):
+                the_licenses_by_version[version['num']] = license.strip()
+
+        return the_licenses_by_version
+
+    def resolve_a_crate(self, crate, the_dependencies_of_the_crate):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+
+        the_key_and_dependency = dict()
+        the_key_and_dependency[self.ins_name.component] = crate
+        result = self.ins_download.fetch(self.ins_name.roast, the_key_and_dependency, None)
+        if result.is_ok() == False:
+            # the error of the crate for all its versions: they are retried or deferred together
+            for dependency in the_dependencies_of_the_crate:
+                the_licenses[tuple(dependency)] = (list(), result)
+            return the_licenses
+
+        data = self.get_data(result)
+        if data == None: return the_licenses
+        the_licenses_by_version = self.get_the_licenses_by_version(data)
+
+        for dependency in the_dependencies_of_the_crate:
+            if (len(dependency) > 1) and (dependency[1] not in [None, str(), 'None']):
+                license = the_licenses_by_version.get(dependency[1])
+            else:
+                # without version: the last stable version, like the download of the crate
+                license = self.ins_parsing.get_license_of_a_crate(data)
+            if license == None: continue
+            the_licenses[tuple(dependency)] = ([license.strip()], result)
+
+        return the_licenses
+
+    def resolve(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+        if platform != self.ins_name.roast: return the_licenses
+        if self.is_enabled() == False: return the_licenses
+
+        the_dependencies_by_crate = self.get_the_dependencies_by_crate(the_dependencies)
+        if len(the_dependencies_by_crate) == 0: return the_licenses
+
+        the_items = list(the_dependencies_by_crate.items())
+        for r in CWorkers(self.number_of_workers).map(self.resolve_a_crate, the_items):
+            the_licenses.update(r)
+        print('INFO: crates.io: ' + str(len(the_items)) + ' crates requested once for ' + str(len(the_licenses)) + ' versions')
+
+        return the_licenses
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import calendar
+import heapq
+import itertools
+import time
+
+
+class CDeferredQueue:
+    """
+    The dependencies of a platform which answered with a Retry-After header,
+    ordered by the date to retry them
+    """
+
+    def __init__(self, maximal_delay=0, number_of_retries=0):
+        self.maximal_delay = maximal_delay
+        self.number_of_retries = number_of_retries
+        self.the_items = list()
+        self.the_numbers_of_retries = dict()
+        self.counter = itertools.count()
+        self.format_of_date = '%Y-%m-%d %H:%M:%S'
+
+    def is_empty(self):
+        return len(self.the_items) == 0
+
+    def get_time(self, next_date):
+        # the date of CDateFromRetryAfter, in UTC
+        return calendar.timegm(time.strptime(next_date, self.format_of_date))
+
+    def get_key(self, platform, dependency):
+        return (platform,) + tuple(dependency)
+
+    def can_defer(self, platform, the_dependencies, result):
+        if (result == None) or (result.next_date == None): return False
+
+        try:
+            delay = self.get_time(result.next_date) - time.time()
+        except Exception as e:
+            return False
+        if delay > self.maximal_delay: return False
+
+        for dependency in the_dependencies:
+            key = self.get_key(platform, dependency)
+            if self.the_numbers_of_retries.get(key, 0) >= self.number_of_retries: return False
+
+        return True
+
+    def put(self, platform, the_dependencies, result):
+        for dependency in the_dependencies:
+            key = self.get_key(platform, dependency)
+            self.the_numbers_of_retries[key] = self.the_numbers_of_retries.get(key, 0) + 1
+
+        msg = 'INFO: ' + platform + ': ' + str(len(the_dependencies)) + ' dependencies to retry after '
+        msg += result.next_date + ' - in ' + result.delay
+        print(msg)
+
+        # the sequence keeps the order of the platforms with the same date
+        item = (self.get_time(result.next_date), next(self.counter), platform, the_dependencies)
+        heapq.heappush(self.the_items, item)
+
+    def get(self, to_wait=True):
+        # the first platform to retry, or None if its date is not reached and not to wait
+        if self.is_empty() == True: return None
+
+        delay = self.the_items[0][0] - time.time()
+        if delay > 0:
+            if to_wait == False: return None
+            time.sleep(delay)
+
+        item = heapq.heappop(self.the_items)
+        return (item[2], item[3])
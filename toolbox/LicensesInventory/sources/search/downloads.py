@@ -11,11 +11,40 @@
 # Authors: See CONTRIBUTORS.txt
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
+import codecs
 import time
 import os
+import threading
 import requests
+from collections import namedtuple
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 
 from sources.common import CFile, CName, CDateFromRetryAfter
+from .sessions import CSession
+from .caches import CCache
+from .rate_limits import CRateLimits
+from .retries import CRetries
+
+
+class CDownloadResult(namedtuple('CDownloadResult',
+        ['error_code', 'next_date', 'delay', 'content', 'start_time', 'duration', 'file', 'text'],
+        defaults=(None,))):
+    """
+    The result of one download, it is not modified after the request:
+        error_code: the status code of the response, or the name of the exception
+        next_date, delay: the date and the delay of the header 'Retry-After', or None
+        content: the bytes of the response
+        start_time, duration: the timings of the request, in seconds
+        file: the downloaded file, or None on error or if it is not written
+        text: the decoded response when it is parsed in memory, or None
+    """
+    __slots__ = ()
+
+    def is_ok(self):
+        if self.error_code == None: return False
+        if self.error_code.isdigit() == False: return False
+        return int(self.error_code) < 300
 
 
 class CDownload:
@@ -26,10 +55,29 @@ class CDownload:
         self.ins_name = CName()
         self.path_licenses = str()
         self.error_code = None
-        self.sleep = 2.5
         self.the_letters = list('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ@_')
         self.next_date = None
 
+        # the pace of the downloads, by platform
+        self.ins_rate_limits = CRateLimits()
+
+        # the connections by host, shared by all the platforms
+        self.ins_session = CSession()
+        # the pages already downloaded, disabled by default
+        self.ins_cache = CCache()
+        # the transient failures, not retried by default
+        self.ins_retries = CRetries()
+
+        # the responses parsed in memory, and their files written or not ('yes', 'no', 'in background')
+        self.in_memory = False
+        self.to_write = 'yes'
+        self.executor_for_files = None
+        self.lock = threading.Lock()
+
+        # the HTML pages read by parts until the license is found
+        self.to_stream = False
+        self.size_of_the_parts = 16384
+
     def rename(self, filename):
         result = str()
 
@@ -50,6 +98,8 @@ class CDownload:
 
         # from main
         component = the_key_and_dependency['component']
+        # the lockfiles: like the files of their packages
+        platform = self.ins_name.get_the_platform_of_the_packages(platform)
 
         # url
         if platform == self.ins_name.go_github:
@@ -60,6 +110,11 @@ class CDownload:
             for key, parameter in the_key_and_dependency.items():
                 url = url.replace('[' + key + ']', parameter)
 
+        # the exact version of a crate
+        version = the_key_and_dependency.get(self.ins_name.version)
+        if (platform == self.ins_name.roast) and (version != None):
+            url += '/' + quote(version, safe=str())
+
         # file
         if platform == self.ins_name.swift:
             component = component.replace('https://github.com/', str())
@@ -78,55 +133,156 @@ class CDownload:
                 break
 
         before = self.rename(before)
+        if (platform == self.ins_name.roast) and (version != None):
+            # the digits of the version are kept: a file by version
+            before += '__' + str().join([c if c.isalnum() else '_' for c in version])
         filename = before + extension
 
         return [url, filename, component]
 
-    def manage_status(self, component, response):
+    def get_retry_after(self, response):
+        my_date_time = None
+        try:
+            my_date_time = response.headers.get('Retry-After')
+        except Exception as e:
+            my_date_time = None
+        if my_date_time == None:
+            my_date_time = getattr(response, 'retry_after', None)
+
+        return my_date_time
+
+    def get_status(self, component, response):
+        next_date = None
+        delay = None
+
         code = int(response.status_code)
-        self.error_code = str(code)
+        error_code = str(code)
 
-        if code < 300: return
+        if code < 300: return (error_code, next_date, delay)
 
         msg = 'INFO: ' + component + ': '
         msg += 'status-code=' + str(code)
         print(msg)
 
         try:
-            my_date_time = response.retry_after
+            my_date_time = self.get_retry_after(response)
             r = CDateFromRetryAfter().get(my_date_time)
             next_date, delay = r
-            self.next_date = next_date
-            self.delay = delay
         except Exception as e:
-            self.next_date = None
+            next_date = None
+            delay = None
 
-        raise Exception()
+        return (error_code, next_date, delay)
 
     def write_in_file(self, response, filename):
-        content = response.text
+        return self.write_text(self.path_licenses, response.text, filename)
+
+    def write_text(self, path, content, filename):
         the_lines = content.split('\n')
 
-        if os.path.isdir(self.path_licenses) == False:
-            os.mkdir(self.path_licenses)
+        # several workers can create the directory at the same time
+        os.makedirs(path, exist_ok=True)
         file = None
         try:
-            self.ins_file.write_in_text_file(self.path_licenses, filename, the_lines)
-            file = os.path.join(self.path_licenses, filename)
+            self.ins_file.write_in_text_file(path, filename, the_lines)
+            file = os.path.join(path, filename)
         except Exception as e:
             raise Exception(e.__str__())
 
         return file
 
-    def manage_sleep(self, platform, interval):
-        the_platforms = [self.ins_name.package_json]
-        if platform in the_platforms:
-            to_wait = self.sleep - interval
-            if to_wait > 0:
-                time.sleep(to_wait)
+    def write_in_background(self, content, filename):
+        with self.lock:
+            if self.executor_for_files == None:
+                self.executor_for_files = ThreadPoolExecutor(max_workers=1)
+            executor = self.executor_for_files
 
-    def get_file(self, platform, the_key_and_dependency, namespace):
-        result = None
+        # the path of the platform is kept: the next platform can change it before the writing
+        path = self.path_licenses
+        future = executor.submit(self.write_text, path, content, filename)
+        future.add_done_callback(self.manage_writing)
+
+        return os.path.join(path, filename)
+
+    def manage_writing(self, future):
+        e = future.exception()
+        if e != None:
+            print('INFO: the downloaded file can not be written: ' + e.__str__())
+
+    def save(self, response, filename):
+        # the text to parse in memory, and the downloaded file
+        text = None
+        file = None
+
+        if self.in_memory == False:
+            file = self.write_in_file(response, filename)
+            return (text, file)
+
+        text = response.text
+        if self.to_write == 'yes':
+            file = self.write_text(self.path_licenses, text, filename)
+        elif self.to_write == 'in background':
+            file = self.write_in_background(text, filename)
+
+        return (text, file)
+
+    def close(self):
+        # the files written in background are finished
+        with self.lock:
+            executor = self.executor_for_files
+            self.executor_for_files = None
+        if executor != None:
+            executor.shutdown(wait=True)
+
+        self.ins_session.close()
+
+    def request(self, platform, component, url, headers, stream=False, json=None):
+        # a GET, or a POST of a query (json), can be sent again: the transient failures are retried
+        rate_limit = self.ins_rate_limits.get(platform)
+
+        attempt = 0
+        while True:
+            response = None
+            exception = None
+            rate_limit.acquire()
+            try:
+                if json == None:
+                    response = self.ins_session.get(url, headers=headers, timeout=self.ins_retries.timeout, stream=stream)
+                else:
+                    response = self.ins_session.post(url, headers=headers, timeout=self.ins_retries.timeout, json=json)
+            except requests.exceptions.RequestException as e:
+                exception = e
+            finally:
+                rate_limit.release(response)
+
+            if self.ins_retries.can_retry(attempt, response, exception) == False: break
+
+            attempt += 1
+            msg = 'INFO: ' + component + ': retry ' + str(attempt) + ' after '
+            if exception != None:
+                msg += type(exception).__name__
+            else:
+                msg += 'status-code=' + str(response.status_code)
+                # the connection goes back to the pool: a streamed response not read keeps it
+                response.close()
+            print(msg)
+            self.ins_retries.wait(attempt - 1)
+
+        if exception != None:
+            raise exception
+
+        return response
+
+    def fetch(self, platform, the_key_and_dependency, namespace):
+        # no attribute of the instance is modified: the workers can share the instance
+        error_code = None
+        next_date = None
+        delay = None
+        content = None
+        start_time = None
+        duration = None
+        file = None
+        text = None
 
         r = self.get_data(platform, the_key_and_dependency, namespace)
         url = r[0]
@@ -137,18 +293,108 @@ class CDownload:
             'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/86.0.4240.111 Safari/537.36'
         }
 
-        response = None
+        entry = self.ins_cache.get(url)
         try:
-            start_time = time.time()
-            response = requests.get(url, headers=headers)
-            interval = time.time() - start_time
-            self.manage_sleep(platform, interval)
-            self.manage_status(component, response)
-            result = self.write_in_file(response, filename)
+            response = None
+            if self.ins_cache.is_fresh(entry, platform) == True:
+                start_time = time.time()
+                response = self.ins_cache.get_response(url, entry)
+                duration = time.time() - start_time
+
+            if response == None:
+                start_time = time.time()
+                response = self.request(platform, component, url, dict(headers, **self.ins_cache.get_the_validators(entry)))
+                response = self.ins_cache.manage(url, response, entry)
+                if int(response.status_code) == 304:
+                    # the page of the cache is removed since the entry was read: requested again, without validators
+                    response = self.request(platform, component, url, headers)
+                    response = self.ins_cache.manage(url, response, None)
+                duration = time.time() - start_time
+
+            r = self.get_status(component, response)
+            error_code, next_date, delay = r
+            content = response.content
+            if int(error_code) < 300:
+                text, file = self.save(response, filename)
         except requests.exceptions.RequestException as e:
-            self.manage_status(component, response)
+            error_code = type(e).__name__
+            print('INFO: ' + component + ': ' + error_code)
         except Exception as e:
             #print(e.__str__())
-            return None
+            if error_code == None:
+                error_code = type(e).__name__
+            file = None
+            text = None
 
-        return result
+        return CDownloadResult(error_code, next_date, delay, content, start_time, duration, file, text)
+
+    def can_stream(self):
+        # the cache needs the whole pages
+        return (self.to_stream == True) and (self.ins_cache.is_enabled() == False)
+
+    def get_decoder(self, response):
+        encoding = response.encoding
+        if encoding == None:
+            encoding = 'utf-8'
+        try:
+            return codecs.getincrementaldecoder(encoding)(errors='replace')
+        except LookupError as e:
+            return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def read_by_parts(self, response, ins_parser):
+        decoder = self.get_decoder(response)
+        for part in response.iter_content(chunk_size=self.size_of_the_parts):
+            ins_parser.feed(decoder.decode(part))
+            # the rest of the page is not downloaded
+            if ins_parser.is_done() == True: return
+
+        ins_parser.feed(decoder.decode(b'', True))
+        ins_parser.close()
+
+    def stream(self, platform, the_key_and_dependency, namespace, ins_parser):
+        # the page is not written nor cached: its parts are given to the parser
+        error_code = None
+        next_date = None
+        delay = None
+        start_time = None
+        duration = None
+
+        r = self.get_data(platform, the_key_and_dependency, namespace)
+        url = r[0]
+        component = r[2]
+
+        headers = {
+            'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/86.0.4240.111 Safari/537.36'
+        }
+
+        try:
+            start_time = time.time()
+            response = self.request(platform, component, url, headers, True)
+            try:
+                r = self.get_status(component, response)
+                error_code, next_date, delay = r
+                if int(error_code) < 300:
+                    self.read_by_parts(response, ins_parser)
+            finally:
+                # the connection is closed if the page is not read until its end
+                response.close()
+            duration = time.time() - start_time
+        except requests.exceptions.RequestException as e:
+            error_code = type(e).__name__
+            print('INFO: ' + component + ': ' + error_code)
+        except Exception as e:
+            if error_code == None:
+                error_code = type(e).__name__
+
+        return CDownloadResult(error_code, next_date, delay, None, start_time, duration, None)
+
+    def get_file(self, platform, the_key_and_dependency, namespace):
+        # the status of the last download is kept in the instance
+        result = self.fetch(platform, the_key_and_dependency, namespace)
+
+        self.error_code = result.error_code
+        if result.is_ok() == False:
+            self.next_date = result.next_date
+            self.delay = result.delay
+
+        return result.file
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import json
+import time
+import requests
+
+from sources.common import CName
+from .downloads import CDownloadResult
+
+
+class CGitHub:
+    """
+    The licenses of the dependencies hosted by GitHub, resolved before their download
+    by batches of GraphQL queries (one alias by dependency), a token is needed:
+        - gradle: a search of the repositories by component, like the REST API
+        - Package.swift and go github: the repository given by the dependency
+    When a batch fails, the repositories are requested one by one with the REST API.
+    """
+
+    def __init__(self, ins_download=None, token=str(), size_of_the_batches=50):
+        self.ins_download = ins_download
+        self.token = token
+        self.size_of_the_batches = size_of_the_batches
+        self.ins_name = CName()
+        self.url_for_graphql = 'https://api.github.com/graphql'
+        self.url_for_rest = 'https://api.github.com/repos/[owner]/[repository]/license'
+
+    def is_enabled(self):
+        return self.token != str()
+
+    def get_headers(self):
+        headers = dict()
+        headers['Authorization'] = 'bearer ' + self.token
+        headers['Accept'] = 'application/vnd.github+json'
+        return headers
+
+    def get_repository(self, platform, dependency):
+        # (owner, repository) of the dependency, or None
+        component = dependency[0]
+        platform = self.ins_name.get_the_platform_of_the_packages(platform)
+        if platform == self.ins_name.swift:
+            prefix = 'https://github.com/'
+        elif platform == self.ins_name.go:
+            prefix = 'github.com/'
+        else:
+            return None
+        if component.find(prefix) != 0: return None
+
+        the_names = component[len(prefix):].split('/')
+        if len(the_names) < 2: return None
+        owner = the_names[0]
+        repository = the_names[1]
+        if repository.endswith('.git') == True:
+            repository = repository[:-len('.git')]
+        if (owner == str()) or (repository == str()): return None
+
+        return (owner, repository)
+
+    def get_query(self, platform, dependency, alias):
+        fields = 'name licenseInfo { name }'
+
+        if platform == self.ins_name.gradle:
+            text = json.dumps(dependency[0])
+            return alias + ': search(query: ' + text + ', type: REPOSITORY, first: 1) { nodes { ... on Repository { ' + fields + ' } } }'
+
+        owner, repository = self.get_repository(platform, dependency)
+        return alias + ': repository(owner: ' + json.dumps(owner) + ', name: ' + json.dumps(repository) + ') { ' + fields + ' }'
+
+    def can_resolve(self, platform, dependency):
+        if platform == self.ins_name.gradle: return True
+        return self.get_repository(platform, dependency) != None
+
+    def get_result(self, error_code, start_time, duration):
+        return CDownloadResult(error_code, None, None, None, start_time, duration, None)
+
+    def get_values(self, platform, repository):
+        name = str()
+        license = str()
+        try:
+            name = repository['name'].strip()
+        except Exception as e:
+            name = str()
+        try:
+            license = repository['licenseInfo']['name'].strip()
+        except Exception as e:
+            license = str()
+
+        # like CParsing.get_license_for_github for gradle
+        if platform == self.ins_name.gradle:
+            return [name, license]
+        if license == str():
+            return list()
+        return [license]
+
+    def send(self, query):
+        # the data of the response, or None if the batch fails
+        headers = self.get_headers()
+        try:
+            response = self.ins_download.request(self.ins_name.github, 'graphql', self.url_for_graphql, headers, json={'query': query})
+            if int(response.status_code) != 200:
+                print('INFO: graphql: status-code=' + str(response.status_code))
+                return None
+            data = response.json()['data']
+        except Exception as e:
+            print('INFO: graphql: ' + type(e).__name__)
+            return None
+        if data == None: return None
+
+        return data
+
+    def get_license_with_rest(self, platform, dependency):
+        # the values and the result, for a repository
+        owner, repository = self.get_repository(platform, dependency)
+        url = self.url_for_rest.replace('[owner]', owner).replace('[repository]', repository)
+
+        start_time = time.time()
+        try:
+            response = self.ins_download.request(self.ins_name.github, dependency[0], url, self.get_headers())
+        except requests.exceptions.RequestException as e:
+            return (list(), self.get_result(type(e).__name__, start_time, time.time() - start_time))
+        duration = time.time() - start_time
+
+        error_code = str(response.status_code)
+        if int(response.status_code) != 200:
+            return (list(), self.get_result(error_code, start_time, duration))
+
+        the_values_for_license = list()
+        try:
+            license = response.json()['license']['name'].strip()
+            if license != str():
+                the_values_for_license = [license]
+        except Exception as e:
+            the_values_for_license = list()
+
+        return (the_values_for_license, self.get_result(error_code, start_time, duration))
+
+    def resolve_the_batch(self, platform, the_dependencies, the_licenses):
+        the_queries = list()
+        for i in range(0, len(the_dependencies)):
+            the_queries.append(self.get_query(platform, the_dependencies[i], 'd' + str(i)))
+
+        start_time = time.time()
+        data = self.send('query { ' + ' '.join(the_queries) + ' }')
+        duration = time.time() - start_time
+
+        for i in range(0, len(the_dependencies)):
+            dependency = the_dependencies[i]
+            key = tuple(dependency)
+            if data == None:
+                # the search of gradle is done by the usual download
+                if platform != self.ins_name.gradle:
+                    the_licenses[key] = self.get_license_with_rest(platform, dependency)
+                continue
+
+            node = data.get('d' + str(i))
+            if platform == self.ins_name.gradle:
+                the_nodes = list()
+                if node != None:
+                    the_nodes = node.get('nodes', list())
+                repository = None
+                if len(the_nodes) > 0:
+                    repository = the_nodes[0]
+                the_licenses[key] = (self.get_values(platform, repository), self.get_result('200', start_time, duration))
+            elif node == None:
+                the_licenses[key] = (list(), self.get_result('404', start_time, duration))
+            else:
+                the_licenses[key] = (self.get_values(platform, node), self.get_result('200', start_time, duration))
+
+    def resolve(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+        if self.is_enabled() == False: return the_licenses
+        platform = self.ins_name.get_the_platform_of_the_packages(platform)
+
+        the_dependencies = [dependency for dependency in the_dependencies if self.can_resolve(platform, dependency) == True]
+        for i in range(0, len(the_dependencies), self.size_of_the_batches):
+            self.resolve_the_batch(platform, the_dependencies[i:i + self.size_of_the_batches], the_licenses)
+
+        return the_licenses
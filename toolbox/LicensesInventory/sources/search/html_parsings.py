@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+from html.parser import HTMLParser
+
+
+class CHead:
+    """
+    A heading of the page, and then the element which follows it
+    """
+
+    def __init__(self, level, number, depth):
+        self.level = level
+        # the order of the heading in the page
+        self.number = number
+        # the depth of the heading: its siblings are at the same depth
+        self.depth = depth
+        self.state = CHTMLLicense.in_head
+        self.the_texts = list()
+
+
+class CHTMLLicense(HTMLParser):
+    """
+    The license of a HTML page in one pass: the text of the first element which follows,
+    in the same parent, a heading (h1 to h10) containing 'license'.
+        - by default, the headings are taken by level (h1, then h2...) and by order in the page,
+          like CParsing.get_license_with_soup_in_text
+        - with to_stream, the first heading of the page is taken whatever its level:
+          the parser is done as soon as its text is read, the rest of the page is not needed
+    """
+
+    in_head = 'in head'
+    after_head = 'after head'
+    in_value = 'in value'
+
+    def __init__(self, to_stream=False):
+        super().__init__(convert_charrefs=True)
+        self.to_stream = to_stream
+        self.the_levels = dict()
+        for i in range(1, 11):
+            self.the_levels['h' + str(i)] = i
+        self.the_empty_tags = ['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr']
+        self.the_tags_without_text = ['script', 'style', 'template']
+
+        self.the_open_tags = list()
+        self.the_heads = list()
+        self.number_of_heads = 0
+        self.done = False
+        # the best heading found, and its license
+        self.head = None
+        self.license = None
+
+    def is_done(self):
+        return self.done
+
+    def get_the_values(self):
+        if self.license == None: return list()
+        return [self.license]
+
+    def is_better(self, head):
+        if self.head == None: return True
+        if head.level != self.head.level: return head.level < self.head.level
+        return head.number < self.head.number
+
+    def set_license(self, head, text):
+        self.the_heads.remove(head)
+        if self.is_better(head) == False: return
+
+        self.head = head
+        self.license = text
+        if self.to_stream == True:
+            self.done = True
+            return
+
+        # no heading in progress can be better than the first h1
+        self.the_heads = [h for h in self.the_heads if self.is_better(h) == True]
+        if (head.level == 1) and (len(self.the_heads) == 0):
+            self.done = True
+
+    def handle_starttag(self, tag, attrs):
+        if self.done == True: return
+
+        depth = len(self.the_open_tags) + 1
+        for head in list(self.the_heads):
+            if head not in self.the_heads: continue
+            if (head.state != self.after_head) or (head.depth != depth): continue
+            if tag in self.the_empty_tags:
+                self.set_license(head, str())
+            else:
+                head.state = self.in_value
+                head.the_texts = list()
+        if self.done == True: return
+
+        if tag in self.the_empty_tags: return
+        self.the_open_tags.append(tag)
+
+        if tag not in self.the_levels.keys(): return
+        self.number_of_heads += 1
+        head = CHead(self.the_levels[tag], self.number_of_heads, depth)
+        if (self.to_stream == True) or (self.is_better(head) == True):
+            self.the_heads.append(head)
+
+    def handle_endtag(self, tag):
+        if self.done == True: return
+        if tag not in self.the_open_tags: return
+
+        # the tags not closed in the page are closed with their parent
+        while self.the_open_tags.pop() != tag:
+            pass
+        depth = len(self.the_open_tags)
+
+        for head in list(self.the_heads):
+            if head not in self.the_heads: continue
+            if (head.state == self.in_head) and (depth < head.depth):
+                if 'license' in str().join(head.the_texts).lower():
+                    head.state = self.after_head
+                else:
+                    self.the_heads.remove(head)
+                    continue
+            elif (head.state == self.in_value) and (depth < head.depth):
+                self.set_license(head, str().join(head.the_texts).strip())
+                if self.done == True: return
+                continue
+
+            # no more sibling: the parent of the heading is closed
+            if (head.state == self.after_head) and (depth < head.depth - 1):
+                self.the_heads.remove(head)
+
+    def handle_data(self, data):
+        depth = len(self.the_open_tags)
+        for head in self.the_heads:
+            if head.state == self.after_head: continue
+            # the scripts inside the heading or the value are not text, but a script can be the value
+            if (depth > head.depth) and (self.the_open_tags[-1] in self.the_tags_without_text): continue
+            head.the_texts.append(data)
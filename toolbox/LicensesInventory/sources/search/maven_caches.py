@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import os
+import time
+import threading
+import requests
+import xmltodict
+
+from sources.common import CName, CWorkers
+from .downloads import CDownloadResult
+from .module_caches import CModuleCache
+
+
+class CMavenPoms:
+    """
+    The licenses of the dependencies of Gradle, read before their download in their POM:
+        - in the caches of Maven (~/.m2/repository) and of Gradle (~/.gradle/caches/modules-2/files-2.1)
+        - else in Maven Central, if a downloader is given, by the workers of the parallel downloads
+    Without <licenses>, the licenses are the ones of the <parent> POM. The POMs are read once for all the run:
+    the artifacts share a few parents.
+    The POM of a dependency with a version (gradle.lockfile, libs.versions.toml) is the one of this version only.
+    The dependencies of build.gradle have no version: their POM is the one of the last version in the caches,
+    else of the release of Maven Central, which is not always the version used by the project.
+    """
+
+    def __init__(self, ins_download=None, path_maven=str(), path_gradle=str(), maximal_depth=10, number_of_workers=1):
+        self.ins_download = ins_download
+        self.path_maven = path_maven
+        self.path_gradle = path_gradle
+        self.maximal_depth = maximal_depth
+        self.number_of_workers = number_of_workers
+        self.ins_name = CName()
+        self.ins_module_cache = CModuleCache()
+        self.url_for_metadata = 'https://repo1.maven.org/maven2/[group]/[artifact]/maven-metadata.xml'
+        self.url_for_pom = 'https://repo1.maven.org/maven2/[group]/[artifact]/[version]/[artifact]-[version].pom'
+        # the POMs read, by (group, artifact, version), None if not found
+        self.the_poms = dict()
+        # the licenses of the POMs with their parents, by (group, artifact, version)
+        self.the_licenses_by_pom = dict()
+        # a POM is read by one worker, the others wait for it
+        self.the_locks_by_pom = dict()
+        self.lock = threading.Lock()
+
+    def is_enabled(self):
+        if self.ins_download != None: return True
+        return (os.path.isdir(self.path_maven) == True) or (os.path.isdir(self.path_gradle) == True)
+
+    def get_folder_in_maven(self, group, artifact):
+        return os.path.join(self.path_maven, *group.split('.'), artifact)
+
+    def get_folder_in_gradle(self, group, artifact):
+        return os.path.join(self.path_gradle, group, artifact)
+
+    def get_the_local_versions(self, group, artifact):
+        the_versions = list()
+
+        for folder in [self.get_folder_in_maven(group, artifact), self.get_folder_in_gradle(group, artifact)]:
+            if os.path.isdir(folder) == False: continue
+            for version in os.listdir(folder):
+                if (version not in the_versions) and (self.get_local_pom(group, artifact, version) != None):
+                    the_versions.append(version)
+
+        return the_versions
+
+    def get_local_pom(self, group, artifact, version):
+        # the file of the POM in the caches, or None
+        filename = artifact + '-' + version + '.pom'
+
+        file = os.path.join(self.get_folder_in_maven(group, artifact), version, filename)
+        if os.path.isfile(file) == True:
+            return file
+
+        # by hash of the file in the cache of Gradle
+        folder = os.path.join(self.get_folder_in_gradle(group, artifact), version)
+        if os.path.isdir(folder) == False:
+            return None
+        for hash in sorted(os.listdir(folder)):
+            file = os.path.join(folder, hash, filename)
+            if os.path.isfile(file) == True:
+                return file
+
+        return None
+
+    def download(self, url):
+        # the text of the response, or None
+        if self.ins_download == None: return None
+
+        headers = {
+            'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/86.0.4240.111 Safari/537.36'
+        }
+        try:
+            response = self.ins_download.request(self.ins_name.maven_central, url.split('/')[-1], url, headers)
+        except requests.exceptions.RequestException as e:
+            print('INFO: maven central: ' + type(e).__name__)
+            return None
+        if int(response.status_code) != 200:
+            return None
+
+        return response.text
+
+    def get_url(self, url, group, artifact, version=str()):
+        url = url.replace('[group]', group.replace('.', '/'))
+        url = url.replace('[artifact]', artifact)
+        return url.replace('[version]', version)
+
+    def get_the_values(self, data):
+        # the values of a tag, a list even for one value
+        if data == None: return list()
+        if type(data) == list: return data
+        return [data]
+
+    def get_text(self, data, key):
+        if type(data) != dict: return str()
+        value = data.get(key)
+        if type(value) != str: return str()
+        return value.strip()
+
+    def read_the_pom(self, text):
+        # the name, the licenses and the parent of a POM, or None
+        try:
+            project = xmltodict.parse(text)['project']
+        except Exception as e:
+            return None
+        if type(project) != dict: return None
+
+        the_licenses = list()
+        the_tags = project.get('licenses')
+        if type(the_tags) == dict:
+            for license in self.get_the_values(the_tags.get('license')):
+                name = self.get_text(license, 'name')
+                if (name != str()) and (name.find('${') < 0):
+                    the_licenses.append(name)
+
+        parent = None
+        tag = project.get('parent')
+        if type(tag) == dict:
+            parent = (self.get_text(tag, 'groupId'), self.get_text(tag, 'artifactId'), self.get_text(tag, 'version'))
+            if str() in parent:
+                parent = None
+
+        name = self.get_text(project, 'name')
+        if (name == str()) or (name.find('${') >= 0):
+            name = self.get_text(project, 'artifactId')
+
+        return {'name': name, 'licenses': the_licenses, 'parent': parent}
+
+    def get_pom(self, group, artifact, version):
+        key = (group, artifact, version)
+        if key in self.the_poms.keys():
+            return self.the_poms[key]
+
+        with self.lock:
+            lock = self.the_locks_by_pom.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self.the_poms.keys():
+                self.the_poms[key] = self.read_the_pom_of_the_caches_or_download(group, artifact, version)
+
+        return self.the_poms[key]
+
+    def read_the_pom_of_the_caches_or_download(self, group, artifact, version):
+        text = None
+        file = self.get_local_pom(group, artifact, version)
+        if file != None:
+            try:
+                with open(file, 'rt', encoding='utf-8') as f:
+                    text = f.read()
+            except OSError as e:
+                text = None
+        if text == None:
+            text = self.download(self.get_url(self.url_for_pom, group, artifact, version))
+
+        pom = None
+        if text != None:
+            pom = self.read_the_pom(text)
+
+        return pom
+
+    def get_the_licenses(self, group, artifact, version, depth=0):
+        # the licenses of the POM, else the ones of its parents
+        key = (group, artifact, version)
+        if key in self.the_licenses_by_pom.keys():
+            return self.the_licenses_by_pom[key]
+
+        the_licenses = list()
+        pom = self.get_pom(group, artifact, version)
+        if pom != None:
+            the_licenses = pom['licenses']
+            if (len(the_licenses) == 0) and (pom['parent'] != None) and (depth < self.maximal_depth):
+                the_licenses = self.get_the_licenses(*pom['parent'], depth + 1)
+        self.the_licenses_by_pom[key] = the_licenses
+
+        return the_licenses
+
+    def get_version(self, group, artifact):
+        # the last version in the caches, else the release of Maven Central, or None
+        the_versions = self.get_the_local_versions(group, artifact)
+        if len(the_versions) > 0:
+            return max(the_versions, key=self.ins_module_cache.get_key_of_version)
+
+        text = self.download(self.get_url(self.url_for_metadata, group, artifact))
+        if text == None: return None
+        try:
+            versioning = xmltodict.parse(text)['metadata']['versioning']
+        except Exception as e:
+            return None
+        for key in ['release', 'latest']:
+            version = self.get_text(versioning, key)
+            if version != str():
+                return version
+
+        return None
+
+    def resolve_a_dependency(self, dependency):
+        # the values for the license and the result, or None
+        if (len(dependency) < 2) or (dependency[1] == str()): return None
+        artifact = dependency[0]
+        group = dependency[1].replace('/', '.')
+
+        start_time = time.time()
+        # the version of the lockfiles only, else the last one
+        version = None
+        if (len(dependency) > 2) and (dependency[2] not in [None, str(), 'None']):
+            version = dependency[2]
+            if self.get_pom(group, artifact, version) == None: return None
+        else:
+            version = self.get_version(group, artifact)
+        if version == None: return None
+        the_licenses_of_the_pom = self.get_the_licenses(group, artifact, version)
+        if len(the_licenses_of_the_pom) == 0: return None
+
+        # like CParsing.get_license_for_github for gradle: the name and the license
+        name = self.get_pom(group, artifact, version)['name']
+        result = CDownloadResult('200', None, None, None, start_time, time.time() - start_time, None)
+        return ([name, ', '.join(the_licenses_of_the_pom)], result)
+
+    def resolve(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+        if self.ins_name.get_the_platform_of_the_packages(platform) != self.ins_name.gradle: return the_licenses
+        if self.is_enabled() == False: return the_licenses
+
+        # the downloads of Maven Central by the workers, with the limits of its platform
+        number_of_workers = 1
+        if self.ins_download != None:
+            number_of_workers = self.number_of_workers
+        the_items = [(dependency,) for dependency in the_dependencies]
+        the_results = CWorkers(number_of_workers).map(self.resolve_a_dependency, the_items)
+        for dependency, r in zip(the_dependencies, the_results):
+            if r == None: continue
+            the_licenses[tuple(dependency)] = r
+
+        return the_licenses
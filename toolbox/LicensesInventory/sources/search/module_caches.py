@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import os
+import re
+import time
+
+from sources.common import CName
+from .downloads import CDownloadResult
+
+
+class CLicenseFiles:
+    """
+    The licenses of the LICENSE, LICENCE and COPYING files of a folder, by the sentences of their text
+    """
+
+    def __init__(self):
+        self.the_prefixes = ['license', 'licence', 'copying']
+        # the first license found in the text, the most specific first;
+        # the GNU licenses quote each other, their name is searched in the title only
+        self.size_of_the_title = 200
+        self.the_sentences_by_license = [
+            ('Apache-2.0', ['apache license', 'version 2.0'], None),
+            ('MPL-2.0', ['mozilla public license', '2.0'], None),
+            ('AGPL-3.0', ['gnu affero general public license', 'version 3'], self.size_of_the_title),
+            ('LGPL-3.0', ['gnu lesser general public license', 'version 3'], self.size_of_the_title),
+            ('LGPL-2.1', ['gnu lesser general public license', 'version 2.1'], self.size_of_the_title),
+            ('GPL-3.0', ['gnu general public license', 'version 3'], self.size_of_the_title),
+            ('GPL-2.0', ['gnu general public license', 'version 2'], self.size_of_the_title),
+            ('Unlicense', ['this is free and unencumbered software released into the public domain'], None),
+            ('CC0-1.0', ['cc0 1.0 universal'], None),
+            ('MIT', ['permission is hereby granted, free of charge'], None),
+            ('ISC', ['permission to use, copy, modify, and', 'distribute this software for any purpose with or without fee'], None),
+            ('BSD-3-Clause', ['redistribution and use in source and binary forms', 'neither the name'], None),
+            ('BSD-3-Clause', ['redistribution and use in source and binary forms', 'names of its contributors'], None),
+            ('BSD-2-Clause', ['redistribution and use in source and binary forms'], None)
+        ]
+
+    def is_a_license_file(self, filename):
+        name = filename.lower()
+        for prefix in self.the_prefixes:
+            if name.startswith(prefix) == True:
+                return True
+        return False
+
+    def get_license_in_text(self, text):
+        text = ' '.join(text.lower().split())
+        for license, the_sentences, size in self.the_sentences_by_license:
+            the_found = [sentence for sentence in the_sentences if sentence in text[:size]]
+            if len(the_found) == len(the_sentences):
+                return license
+        return None
+
+    def get_license(self, folder):
+        # the licenses of the files, like 'Apache-2.0, MIT', or None
+        the_licenses = list()
+
+        try:
+            the_filenames = sorted(os.listdir(folder))
+        except OSError as e:
+            return None
+
+        for filename in the_filenames:
+            if self.is_a_license_file(filename) == False: continue
+            file = os.path.join(folder, filename)
+            if os.path.isfile(file) == False: continue
+            try:
+                with open(file, 'rt', encoding='utf-8', errors='replace') as f:
+                    license = self.get_license_in_text(f.read())
+            except OSError as e:
+                continue
+            if (license != None) and (license not in the_licenses):
+                the_licenses.append(license)
+
+        if len(the_licenses) == 0: return None
+        return ', '.join(the_licenses)
+
+
+class CModuleCache:
+    """
+    The licenses of the modules downloaded by the builds in a cache folder, read before their download.
+    The folders of the cache are indexed once by module, the version of the dependency
+    is read if it is given (a version not in the cache is downloaded), else the last version.
+    """
+
+    def __init__(self, the_platforms=list(), path=str()):
+        self.the_platforms = the_platforms
+        self.path = path
+        self.ins_license_files = CLicenseFiles()
+        # the folders by version, by module
+        self.the_folders_by_module = None
+        # the licenses by (module, version)
+        self.the_licenses_by_module = dict()
+
+    def is_enabled(self):
+        return (self.path != str()) and (os.path.isdir(self.path) == True)
+
+    def get_key_of_version(self, version):
+        # 1.10.0 after 1.9.0, and 1.0.0 after 1.0.0-alpha
+        the_parts = re.split(r'[-+]', version.lstrip('v'), 1)
+        the_numbers = list()
+        for number in the_parts[0].split('.'):
+            the_numbers.append(int(number) if number.isdigit() == True else -1)
+        return (the_numbers, len(the_parts) == 1, version)
+
+    def index(self):
+        # the folders by version, by module
+        return dict()
+
+    def read_the_license(self, folder):
+        return self.ins_license_files.get_license(folder)
+
+    def get_module(self, dependency):
+        return dependency[0]
+
+    def get_the_folders(self, module):
+        # the folders by version of a module, or None: the cache is indexed at the first call
+        if self.the_folders_by_module == None:
+            self.the_folders_by_module = self.index()
+            print('INFO: ' + self.path + ': ' + str(len(self.the_folders_by_module)) + ' modules')
+        return self.the_folders_by_module.get(module)
+
+    def get_license(self, module, version=None):
+        the_folders = self.get_the_folders(module)
+        if the_folders == None: return None
+        if version == None:
+            version = max(the_folders.keys(), key=self.get_key_of_version)
+        elif version not in the_folders.keys():
+            # the license of another version could be a different one: it is downloaded
+            return None
+
+        key = (module, version)
+        if key not in self.the_licenses_by_module.keys():
+            self.the_licenses_by_module[key] = self.read_the_license(the_folders[version])
+
+        return self.the_licenses_by_module[key]
+
+    def resolve(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+        if platform not in self.the_platforms: return the_licenses
+        if self.is_enabled() == False: return the_licenses
+
+        start_time = time.time()
+        for dependency in the_dependencies:
+            version = None
+            if len(dependency) > 1:
+                version = dependency[1]
+            license = self.get_license(self.get_module(dependency), version)
+            if license == None: continue
+            result = CDownloadResult('200', None, None, None, start_time, time.time() - start_time, None)
+            the_licenses[tuple(dependency)] = ([license], result)
+
+        return the_licenses
+
+
+class CCargoRegistry(CModuleCache):
+    """
+    The crates of the registry of Cargo: [CARGO_HOME]/registry/src/[registry]/[crate]-[version],
+    the license is the one of Cargo.toml, else the one of the LICENSE files
+    """
+
+    def __init__(self, path=str()):
+        super().__init__([CName().roast], path)
+
+    def index(self):
+        the_folders_by_module = dict()
+
+        path = os.path.join(self.path, 'registry', 'src')
+        try:
+            the_registries = sorted(os.scandir(path), key=lambda entry: entry.name)
+        except OSError as e:
+            return the_folders_by_module
+
+        for registry in the_registries:
+            if registry.is_dir() == False: continue
+            try:
+                the_entries = list(os.scandir(registry.path))
+            except OSError as e:
+                continue
+            for entry in the_entries:
+                m = re.match(r'^(.+?)-(\d+\.\d+\.\d+.*)$', entry.name)
+                if (m == None) or (entry.is_dir() == False): continue
+                the_folders_by_module.setdefault(m.group(1), dict()).setdefault(m.group(2), entry.path)
+
+        return the_folders_by_module
+
+    def read_the_license_in_cargo_toml(self, folder):
+        # the license field of the [package] section, or None
+        file = os.path.join(folder, 'Cargo.toml')
+        try:
+            with open(file, 'rt', encoding='utf-8') as f:
+                the_lines = f.read().split('\n')
+        except OSError as e:
+            return None
+
+        section = str()
+        for line in the_lines:
+            line = line.strip()
+            if line.startswith('[') == True:
+                section = line
+                continue
+            if section != '[package]': continue
+            m = re.match(r'^license\s*=\s*["\'](.*)["\']$', line)
+            if m != None:
+                return m.group(1).strip()
+
+        return None
+
+    def read_the_license(self, folder):
+        license = self.read_the_license_in_cargo_toml(folder)
+        if (license != None) and (license != str()):
+            return license
+        return self.ins_license_files.get_license(folder)
+
+
+class CGoModuleCache(CModuleCache):
+    """
+    The modules of the cache of Go: [GOMODCACHE]/[module]@[version], where the capital letters
+    of the module are written as '!' and the small letter. The license is the one of the LICENSE files.
+    """
+
+    def __init__(self, path=str()):
+        super().__init__([CName().go, CName().go_sum], path)
+
+    def decode_the_module(self, path):
+        # github.com/!burnt!sushi/toml: github.com/BurntSushi/toml
+        return re.sub(r'!([a-z])', lambda m: m.group(1).upper(), path)
+
+    def index(self):
+        the_folders_by_module = dict()
+
+        for root, dirs, files in os.walk(self.path):
+            dirs.sort()
+            if root == self.path:
+                # the downloaded archives
+                dirs[:] = [d for d in dirs if d != 'cache']
+            the_folders = list()
+            for d in dirs:
+                if '@' in d:
+                    the_folders.append(d)
+                    name, version = d.split('@', 1)
+                    path = os.path.relpath(os.path.join(root, name), self.path).replace(os.sep, '/')
+                    module = self.decode_the_module(path)
+                    the_folders_by_module.setdefault(module, dict()).setdefault(version, os.path.join(root, d))
+            # the folders of the modules are not walked
+            dirs[:] = [d for d in dirs if d not in the_folders]
+
+        return the_folders_by_module
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import os
+import json
+import time
+from collections import deque
+
+from sources.common import CName
+from .downloads import CDownloadResult
+
+
+class CNodeModules:
+    """
+    The licenses of the dependencies of the package.json files and of the lockfiles, read before their download
+    in the package.json of the packages installed in the node_modules folders next to these files
+    (scoped packages like @scope/name and nested node_modules included).
+    The files are the ones found in the path to parse, without the ignored folders: it is not walked again.
+    The packages which are not installed, or without license, are downloaded as usual,
+    like the ones of the lockfiles installed with another version.
+    """
+
+    def __init__(self, path=str(), the_files_by_platform=dict()):
+        self.path = path
+        # the package.json files and the lockfiles found in the path to parse, by platform
+        self.the_files_by_platform = the_files_by_platform
+        self.ins_name = CName()
+        self.folder = 'node_modules'
+        # the license by package, the nearest of the project, and by (package, version), read once for all the run
+        self.the_licenses_by_package = None
+        self.the_licenses_by_version = dict()
+
+    def is_enabled(self):
+        return (self.path != str()) and (os.path.isdir(self.path) == True)
+
+    def get_license(self, data):
+        # "license": "MIT", "license": {"type": "MIT"} or the former "licenses": [{"type": "MIT"}]
+        license = data.get('license')
+        if type(license) == dict:
+            license = license.get('type')
+        if (type(license) == str) and (license.strip() != str()):
+            return license.strip()
+
+        the_licenses = data.get('licenses')
+        if type(the_licenses) != list: return None
+        the_types = list()
+        for license in the_licenses:
+            if type(license) == dict:
+                license = license.get('type')
+            if (type(license) == str) and (license.strip() != str()):
+                the_types.append(license.strip())
+        if len(the_types) == 0: return None
+
+        return ' OR '.join(the_types)
+
+    def read_the_package(self, folder):
+        # the name, the version and the license of an installed package, or (None, None, None)
+        file = os.path.join(folder, 'package.json')
+        try:
+            with open(file, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            return (None, None, None)
+        if type(data) != dict: return (None, None, None)
+
+        name = data.get('name')
+        if type(name) != str: return (None, None, None)
+
+        return (name, data.get('version'), self.get_license(data))
+
+    def get_the_packages(self, folder):
+        # the folders of the packages of a node_modules folder, with the scoped ones
+        the_packages = list()
+
+        try:
+            the_entries = sorted(os.scandir(folder), key=lambda entry: entry.name)
+        except OSError as e:
+            return the_packages
+
+        for entry in the_entries:
+            if entry.name.startswith('.') == True: continue
+            if entry.is_dir() == False: continue
+            if entry.name.startswith('@') == False:
+                the_packages.append(entry.path)
+                continue
+            try:
+                the_scoped_entries = sorted(os.scandir(entry.path), key=lambda entry: entry.name)
+            except OSError as e:
+                continue
+            for scoped_entry in the_scoped_entries:
+                if scoped_entry.is_dir() == True:
+                    the_packages.append(scoped_entry.path)
+
+        return the_packages
+
+    def read_the_node_modules(self, folder, the_licenses_by_package, the_folders_read):
+        # the packages nearest the project first: they are the ones installed for it
+        the_folders = deque([folder])
+        while len(the_folders) > 0:
+            folder = the_folders.popleft()
+            real_folder = os.path.realpath(folder)
+            if real_folder in the_folders_read: continue
+            the_folders_read.add(real_folder)
+
+            for package_folder in self.get_the_packages(folder):
+                name, version, license = self.read_the_package(package_folder)
+                if (name != None) and (license != None):
+                    the_licenses_by_package.setdefault(name, license)
+                    self.the_licenses_by_version.setdefault((name, version), license)
+                nested_folder = os.path.join(package_folder, self.folder)
+                if os.path.isdir(nested_folder) == True:
+                    the_folders.append(nested_folder)
+
+    def get_the_projects(self):
+        # the folders of the package.json files and of the lockfiles, else the path to parse only
+        the_projects = set()
+        for platform, the_files in self.the_files_by_platform.items():
+            if self.ins_name.get_the_platform_of_the_packages(platform) != self.ins_name.package_json: continue
+            for file in the_files:
+                the_projects.add(os.path.dirname(file))
+        if len(the_projects) == 0:
+            the_projects.add(self.path)
+
+        return sorted(the_projects)
+
+    def read_the_licenses(self):
+        the_licenses_by_package = dict()
+        the_folders_read = set()
+
+        for project in self.get_the_projects():
+            folder = os.path.join(project, self.folder)
+            if os.path.isdir(folder) == True:
+                self.read_the_node_modules(folder, the_licenses_by_package, the_folders_read)
+
+        return the_licenses_by_package
+
+    def resolve(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple)
+        the_licenses = dict()
+        if self.ins_name.get_the_platform_of_the_packages(platform) != self.ins_name.package_json: return the_licenses
+        if self.is_enabled() == False: return the_licenses
+
+        start_time = time.time()
+        if self.the_licenses_by_package == None:
+            self.the_licenses_by_package = self.read_the_licenses()
+            print('INFO: node_modules: ' + str(len(self.the_licenses_by_package)) + ' packages installed')
+        duration = time.time() - start_time
+
+        for dependency in the_dependencies:
+            # the version of the lockfiles only (another version is downloaded), else the package installed for the project
+            if len(dependency) > 1:
+                license = self.the_licenses_by_version.get((dependency[0], dependency[1]))
+            else:
+                license = self.the_licenses_by_package.get(dependency[0])
+            if license == None: continue
+            result = CDownloadResult('200', None, None, None, start_time, duration, None)
+            the_licenses[tuple(dependency)] = ([license], result)
+
+        return the_licenses
@@ -17,6 +17,7 @@ from bs4 import BeautifulSoup
 import bs4
 import html
 from sources.common import CData
+from .html_parsings import CHTMLLicense
 
 space = ' '
 
@@ -24,11 +25,25 @@ class CParsing:
 
     def __init__(self):
         self.ins_data = CData()
-
-    def get_content(self, file):
+        # 'fast' or 'beautifulsoup'
+        self.html_parser = 'fast'
+
+    def extract(self, name, text):
+        # name: the parsing given by CSearch for the platform
+        if name == 'github':
+            return self.get_license_for_github_in_text(text)
+        if name == 'roast':
+            return self.get_license_for_roast_in_text(text)
+        return self.get_license_with_html_in_text(text)
+
+    def read(self, file):
         content = str()
         with open(file, 'rt', encoding='utf-8') as f:
             content = f.read()
+        return content
+
+    def get_content(self, file):
+        content = self.read(file)
         #content = content.replace('\n', str())
         content = html.unescape(content)
         return content
@@ -42,9 +57,25 @@ class CParsing:
         the_a = soup.find_all()
 
     def get_license_with_html(self, file):
+        return self.get_license_with_html_in_text(self.read(file))
+
+    def get_license_with_html_in_text(self, text):
+        if self.html_parser == 'beautifulsoup':
+            return self.get_license_with_soup_in_text(text)
+
+        # by parts: the rest of the page is not parsed once the license of a h1 is found
+        ins_parser = CHTMLLicense()
+        size = 65536
+        for i in range(0, len(text), size):
+            ins_parser.feed(text[i:i + size])
+            if ins_parser.is_done() == True: break
+        ins_parser.close()
+        return ins_parser.get_the_values()
+
+    def get_license_with_soup_in_text(self, text):
         result = list()
 
-        html_code = self.get_content(file)
+        html_code = html.unescape(text)
         soup = BeautifulSoup(html_code, 'html.parser')
 
         i = 1
@@ -63,9 +94,12 @@ class CParsing:
         return result
 
     def get_license_for_go(self, file):
+        return self.get_license_for_go_in_text(self.read(file))
+
+    def get_license_for_go_in_text(self, text):
         the_values_for_license = list()
 
-        content = self.get_content(file)
+        content = html.unescape(text)
         p = content.find('license')
         if p < 0: return the_values_for_license
         content = content[p+1:]
@@ -84,9 +118,43 @@ class CParsing:
         return the_values_for_license
 
     def get_license_for_roast(self, file):
+        return self.get_license_for_roast_in_text(self.read(file))
+
+    def get_license_of_a_crate(self, data):
+        # the license of the version of a crate of crates.io (/crates/[crate]/[version]),
+        # else of its last version (/crates/[crate]), or None
+        version = data.get('version')
+        if type(version) == dict:
+            return version.get('license')
+
+        crate = data.get('crate', dict())
+        the_versions = data.get('versions', list())
+        if len(the_versions) == 0: return None
+
+        version = the_versions[0]
+        for key in ['max_stable_version', 'newest_version']:
+            the_numbers = [v for v in the_versions if v.get('num') == crate.get(key)]
+            if len(the_numbers) > 0:
+                version = the_numbers[0]
+                break
+
+        return version.get('license')
+
+    def get_license_for_roast_in_text(self, text):
+        try:
+            data = json.loads(text)
+            license = self.get_license_of_a_crate(data)
+        except Exception as e:
+            return self.find_license_for_roast_in_text(text)
+
+        if license == None: return list()
+        return [license.strip()]
+
+    def find_license_for_roast_in_text(self, text):
+        # without JSON: the first value after 'license'
         the_values_for_license = list()
 
-        content = self.get_content(file)
+        content = html.unescape(text)
         p = content.find('license')
         if p < 0: return the_values_for_license
         content = content[p:]
@@ -105,25 +173,22 @@ class CParsing:
         return the_values_for_license
 
     def get_license_for_github(self, file):
-        result = list()
-
-        data = None
+        text = None
         try:
-            with open(file, encoding='utf-8') as f: 
-                data = f.readlines()
+            text = self.read(file)
         except Exception as e:
             print('Error: reading the content of the downloaded file to json.\n\t' + file)
-            return result
+            return list()
 
+        return self.get_license_for_github_in_text(text)
+
+    def get_license_for_github_in_text(self, text):
+        result = list()
+
+        data = None
         try:
             #convert to json
-            line = str()
-            if len(data) == 1:
-                line = data[0]
-            else:
-                for v in data:
-                    line += v
-            data = json.loads(line)
+            data = json.loads(text)
         except Exception as e:
             print('Error: converting the content of the downloaded file to json.')
             return result
@@ -188,3 +253,11 @@ class CParsing:
 
         return version
 
+
+def extract_the_license(name, text, html_parser='fast'):
+    # a function of the module can be called in the processes of a pool
+    if (name == None) or (text == None): return None
+
+    ins_parsing = CParsing()
+    ins_parsing.html_parser = html_parser
+    return ins_parsing.extract(name, text)
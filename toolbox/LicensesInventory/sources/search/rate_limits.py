@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from sources.common import CName
+
+
+class CRateLimit:
+    """
+    The pace of the requests to one platform:
+        - a token bucket gives the number of requests per second (0: no limit)
+        - a number of requests in the same time
+    Both grow while the responses are healthy, up to the values of the configuration,
+    and are divided by 2 when the platform throttles the requests (status code 429).
+    The headers X-RateLimit-Remaining and X-RateLimit-Reset slow down the requests
+    to not exceed the quota of the platform.
+    """
+
+    def __init__(self, rate=0, number_of_parallel_requests=1):
+        self.maximal_rate = rate
+        self.rate = rate
+        self.minimal_rate = 0.05
+        self.rate_after_throttling = 1.0
+
+        self.maximal_number_of_requests = number_of_parallel_requests
+        self.number_of_requests = 1
+        self.number_of_requests_in_progress = 0
+        self.number_of_successes = 0
+
+        # the token bucket
+        self.tokens = 1.0
+        self.last_time = time.monotonic()
+        self.paused_until = 0
+
+        self.condition = threading.Condition()
+        self.lock = threading.Lock()
+
+    def get_capacity(self):
+        # no burst of more than one second of requests
+        return max(1.0, self.rate)
+
+    def wait_for_token(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.last_time, self.paused_until)
+            if self.rate > 0:
+                tokens = self.tokens + (start - self.last_time) * self.rate
+                tokens = min(self.get_capacity(), tokens)
+                if tokens < 1:
+                    start += (1 - tokens) / self.rate
+                    tokens = 1.0
+                self.tokens = tokens - 1
+            self.last_time = start
+            to_wait = start - now
+
+        if to_wait > 0:
+            time.sleep(to_wait)
+
+    def acquire(self):
+        with self.condition:
+            while self.number_of_requests_in_progress >= self.number_of_requests:
+                self.condition.wait()
+            self.number_of_requests_in_progress += 1
+
+        self.wait_for_token()
+
+    def release(self, response):
+        with self.condition:
+            self.number_of_requests_in_progress -= 1
+            if response != None:
+                self.adapt(response)
+            self.condition.notify_all()
+
+    def get_header(self, response, name):
+        try:
+            return response.headers.get(name)
+        except Exception as e:
+            return None
+
+    def get_delay(self, value):
+        # seconds, a timestamp or a HTTP date, to a delay in seconds from now
+        if value == None: return None
+
+        delay = None
+        try:
+            delay = float(value)
+            if delay > 1000000000:
+                delay = delay - time.time()
+        except Exception as e:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except Exception as e:
+                delay = None
+
+        return delay
+
+    def pause(self, delay):
+        if (delay == None) or (delay <= 0): return
+
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def back_off(self):
+        self.number_of_successes = 0
+        self.number_of_requests = max(1, self.number_of_requests // 2)
+
+        if self.rate > 0:
+            self.rate = max(self.minimal_rate, self.rate / 2)
+        else:
+            self.rate = self.rate_after_throttling
+
+    def grow(self):
+        self.number_of_successes += 1
+        if self.number_of_successes < self.number_of_requests: return
+        self.number_of_successes = 0
+
+        if self.number_of_requests < self.maximal_number_of_requests:
+            self.number_of_requests += 1
+
+        if self.rate > 0:
+            rate = self.rate + max(self.minimal_rate, self.rate / 10)
+            if self.maximal_rate > 0:
+                rate = min(rate, self.maximal_rate)
+            self.rate = rate
+
+    def adapt(self, response):
+        try:
+            code = int(response.status_code)
+        except Exception as e:
+            return
+
+        remaining = self.get_header(response, 'X-RateLimit-Remaining')
+        reset = self.get_delay(self.get_header(response, 'X-RateLimit-Reset'))
+        try:
+            remaining = int(remaining)
+        except Exception as e:
+            remaining = None
+
+        if (code == 429) or ((code == 403) and (remaining == 0)):
+            self.back_off()
+            self.pause(self.get_delay(self.get_header(response, 'Retry-After')))
+        else:
+            self.grow()
+
+        if (remaining == None) or (reset == None): return
+        if remaining == 0:
+            self.pause(reset)
+        elif reset > 0:
+            # the remaining requests are spread until the reset of the quota
+            rate = max(self.minimal_rate, remaining / reset)
+            if (self.rate == 0) or (rate < self.rate):
+                self.rate = rate
+
+
+class CRateLimits:
+    """
+    A rate limit by platform
+    """
+
+    def __init__(self, number_of_parallel_requests=1, the_numbers_by_platform=dict(), rate=0, the_rates_by_platform=dict()):
+        self.number_of_parallel_requests = number_of_parallel_requests
+        self.the_numbers_by_platform = the_numbers_by_platform
+        self.rate = rate
+        self.the_rates_by_platform = the_rates_by_platform
+        self.the_rate_limits_by_platform = dict()
+        self.lock = threading.Lock()
+        self.ins_name = CName()
+
+    def get(self, platform):
+        # the lockfiles share the limits of the website of their packages
+        platform = self.ins_name.get_the_platform_of_the_packages(platform)
+        with self.lock:
+            if platform not in self.the_rate_limits_by_platform.keys():
+                number = self.the_numbers_by_platform.get(platform, self.number_of_parallel_requests)
+                rate = self.the_rates_by_platform.get(platform, self.rate)
+                self.the_rate_limits_by_platform[platform] = CRateLimit(rate, number)
+            return self.the_rate_limits_by_platform[platform]
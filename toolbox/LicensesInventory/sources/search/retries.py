@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import random
+import threading
+import time
+import requests
+
+
+class CRetries:
+    """
+    The retries of the requests on a transient failure (status code 5xx, timeout, connection error):
+        - at most number_of_retries by request
+        - at most budget for all the requests of the run (0: no budget)
+        - after a random delay up to delay * 2 ** attempt, limited to maximal_delay
+    """
+
+    def __init__(self, number_of_retries=0, budget=0, timeout=None, delay=1.0, maximal_delay=30.0):
+        self.number_of_retries = number_of_retries
+        self.budget = budget
+        self.timeout = timeout
+        self.delay = delay
+        self.maximal_delay = maximal_delay
+        self.number_of_retries_done = 0
+        self.lock = threading.Lock()
+
+        self.the_transient_exceptions = (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError
+        )
+
+    def is_transient(self, response, exception):
+        if exception != None:
+            return isinstance(exception, self.the_transient_exceptions)
+
+        try:
+            code = int(response.status_code)
+        except Exception as e:
+            return False
+        return (code >= 500) and (code < 600)
+
+    def take(self):
+        # one retry of the budget of the run
+        with self.lock:
+            if (self.budget > 0) and (self.number_of_retries_done >= self.budget):
+                return False
+            self.number_of_retries_done += 1
+            return True
+
+    def can_retry(self, attempt, response, exception):
+        if attempt >= self.number_of_retries: return False
+        if self.is_transient(response, exception) == False: return False
+        return self.take()
+
+    def get_delay(self, attempt):
+        # full jitter: the workers retrying in the same time are spread
+        return random.uniform(0, min(self.maximal_delay, self.delay * (2 ** attempt)))
+
+    def wait(self, attempt):
+        time.sleep(self.get_delay(attempt))
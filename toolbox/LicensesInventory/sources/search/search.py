@@ -12,10 +12,25 @@
 # Software description: A toolbox of scripts to help work of forges admins and open source referents
 
 import os
+from collections import deque
 
-from sources.common import CName, CFile
+from sources.common import CName, CFile, CWorkers, CProcesses
+from sources.common import CRecord, CDependency, CLicenseResult, CErrorResult
+from sources.dependency import CDependencySet
 from .downloads import CDownload
-from .parsings import CParsing
+from .sessions import CSession
+from .caches import CCache
+from .rate_limits import CRateLimits
+from .deferred import CDeferredQueue
+from .retries import CRetries
+from .parsings import CParsing, extract_the_license
+from .html_parsings import CHTMLLicense
+from .github import CGitHub
+from .crates import CCrates
+from .node_modules import CNodeModules
+from .module_caches import CCargoRegistry, CGoModuleCache
+from .maven_caches import CMavenPoms
+from .cocoapods_specs import CCocoaPodsSpecs
 
 
 class CSearch:
@@ -31,26 +46,48 @@ class CSearch:
         #self.ins_config = None
         self.ins_file = CFile()
         self.the_dependencies_on_error_by_platform = None
-
-    def get_license_for_others(self, platform, dependency):
-        the_values_for_license = list()
-
+        self.ins_workers = CWorkers()
+        self.ins_processes = CProcesses()
+        # the licenses found by batches before the downloads, by dependency
+        self.the_resolvers = list()
+        self.the_resolved_licenses = dict()
+        # the licenses found by registry (package.json and its lockfiles...), by key of dependency:
+        # the same package is downloaded once for all the platforms of its registry
+        self.the_licenses_by_registry = dict()
+        self.ins_deferred_queue = CDeferredQueue()
+
+    def get_text(self, result):
+        # the response parsed in memory, or the downloaded file
+        if result.text != None:
+            return result.text
+        if result.file == None:
+            return None
+        return self.ins_parsing.read(result.file)
+
+    def stream_the_license(self, platform, the_key_and_dependency):
+        ins_parser = CHTMLLicense(True)
+        result = self.ins_download.stream(platform, the_key_and_dependency, None, ins_parser)
+        return (None, ins_parser.get_the_values(), result)
+
+    def download_for_others(self, platform, dependency):
         component = dependency[0]
         the_key_and_dependency = dict()
         the_key_and_dependency[self.ins_name.component] = component
-        file = self.ins_download.get_file(platform, the_key_and_dependency, None)
-        if file == None: return the_values_for_license
+        if (platform == self.ins_name.roast) and (len(dependency) > 1) and (dependency[1] not in [None, str(), 'None']):
+            # the license of the version of Cargo.lock
+            the_key_and_dependency[self.ins_name.version] = dependency[1]
+        if (platform != self.ins_name.roast) and (self.ins_download.can_stream() == True):
+            return self.stream_the_license(platform, the_key_and_dependency)
 
-        if platform == self.ins_name.roast:
-            the_values_for_license = self.ins_parsing.get_license_for_roast(file)
-        else:
-            the_values_for_license = self.ins_parsing.get_license_with_html(file)
+        result = self.ins_download.fetch(platform, the_key_and_dependency, None)
 
-        return the_values_for_license
+        name = 'html'
+        if platform == self.ins_name.roast:
+            name = 'roast'
 
-    def get_license_for_gradle(self, platform, dependency):
-        the_values_for_license = list()
+        return (name, list(), result)
 
+    def download_for_gradle(self, platform, dependency):
         component = dependency[0]
         namespace = None
         if len(dependency) > 1:
@@ -59,44 +96,11 @@ class CSearch:
         platform = self.ins_name.github
         the_key_and_dependency = dict()
         the_key_and_dependency[self.ins_name.component] = component
-        file = self.ins_download.get_file(platform, the_key_and_dependency, namespace)
-        if file != None:
-            the_values_for_license = self.ins_parsing.get_license_for_github(file)
-            return the_values_for_license
-
-    def maven_central_does_not_work():
-        # maven central
-        version = None
-        namespace = dependency[1]
-        if (namespace != str()) and (namespace != None):
-            platform = self.ins_name.version_for_maven_central
-            the_key_and_dependency[self.ins_name.namespace] = namespace
-            file = self.ins_download.get_file(platform, the_key_and_dependency, None)
-            if file == None:
-                return bad_result
-            version= self.ins_parsing.extract_version_for_maven_central(file)
-            os.remove(file)
-            if version == None:
-                return bad_result
-
-            platform = self.ins_name.maven_central
-            the_key_and_dependency = dict()
-            new_component = component.replace('.', '/')
-            the_key_and_dependency[self.ins_name.component] = new_component
-            new_namespace = namespace.replace('.', '/')
-            the_key_and_dependency[self.ins_name.namespace] = new_namespace
-            the_key_and_dependency[self.ins_name.version] = version
-            file = self.ins_download.get_file(platform, the_key_and_dependency, None)
-            if file == None:
-                return bad_result
-            license_central = self.ins_parsing.get_license_for_maven_central(file)
-            if license_central == None:
-                return bad_result
-            return license_central
-
-    def get_license_for_go(self, platform, dependency):
-        the_values_for_license = list()
+        result = self.ins_download.fetch(platform, the_key_and_dependency, namespace)
 
+        return ('github', list(), result)
+
+    def download_for_go(self, platform, dependency):
         component = dependency[0]
 
         if 'github' in component:
@@ -106,54 +110,177 @@ class CSearch:
 
         the_key_and_dependency = dict()
         the_key_and_dependency[self.ins_name.component] = component
-        file = self.ins_download.get_file(platform, the_key_and_dependency, None)
-        if file == None:
-            return the_values_for_license
-
-        the_values_for_license = self.ins_parsing.get_license_with_html(file)
-
-        return the_values_for_license
+        if self.ins_download.can_stream() == True:
+            return self.stream_the_license(platform, the_key_and_dependency)
+
+        result = self.ins_download.fetch(platform, the_key_and_dependency, None)
+
+        return ('html', list(), result)
+
+    def get_the_keys_of_the_registry(self, platform, dependency):
+        # the key of the dependency in its registry, then for a lockfile the key without the version,
+        # the one of the same dependency in the manifest
+        registry = self.ins_name.get_the_platform_of_the_packages(platform)
+        key = (registry,) + CDependencySet(registry).get_key(dependency)
+        if (registry == platform) or (len(key) < 3):
+            return [key]
+        return [key, key[:-1]]
+
+    def keep_the_license_of_the_registry(self, platform, dependency, the_values_for_license, result):
+        for key in self.get_the_keys_of_the_registry(platform, dependency):
+            self.the_licenses_by_registry.setdefault(key, (the_values_for_license, result))
+
+    def get_the_licenses_of_the_registry(self, platform, the_dependencies):
+        # the values for the license and the result, by dependency (as a tuple), already found for another platform
+        the_licenses = dict()
+        for dependency in the_dependencies:
+            key = self.get_the_keys_of_the_registry(platform, dependency)[0]
+            if key in self.the_licenses_by_registry.keys():
+                the_licenses[tuple(dependency)] = self.the_licenses_by_registry[key]
+        if len(the_licenses) > 0:
+            print('INFO: ' + platform + ': ' + str(len(the_licenses)) + ' licenses already found in the same registry')
+        return the_licenses
+
+    def resolve_in_advance(self, platform, the_dependencies):
+        self.the_resolved_licenses = self.get_the_licenses_of_the_registry(platform, the_dependencies)
+        for ins_resolver in self.the_resolvers:
+            # the local resolvers are the first ones, the next ones resolve only the rest
+            the_dependencies_to_resolve = [d for d in the_dependencies if tuple(d) not in self.the_resolved_licenses.keys()]
+            if len(the_dependencies_to_resolve) == 0: break
+            self.the_resolved_licenses.update(ins_resolver.resolve(platform, the_dependencies_to_resolve))
+
+    def download_the_license(self, platform, dependency):
+        # the name of the parsing to do (None if the values for the license are known),
+        # the values for the license and the result of the download
+        r = (None, list(), None)
+
+        key = tuple(dependency)
+        if key in self.the_resolved_licenses.keys():
+            the_values_for_license, result = self.the_resolved_licenses[key]
+            r = (None, the_values_for_license, result)
+        elif self.ins_name.get_the_platform_of_the_packages(platform) == self.ins_name.gradle:
+            # build.gradle, gradle.lockfile and libs.versions.toml
+            r = self.download_for_gradle(platform, dependency)
+        elif self.ins_name.get_the_platform_of_the_packages(platform) == self.ins_name.go:
+            # go.mod and go.sum
+            r = self.download_for_go(platform, dependency)
+        elif platform != None:
+            r = self.download_for_others(platform, dependency)
+
+        return r
+
+    def get_the_parsing(self, name, result):
+        # the arguments of extract_the_license: the text is read here, the parsing can be done in another process
+        text = None
+        if (name != None) and (result != None):
+            text = self.get_text(result)
+
+        return (name, text, self.ins_parsing.html_parser)
+
+    def search_the_license(self, platform, dependency):
+        # the values for the license and the result of the download
+        name, the_values_for_license, result = self.download_the_license(platform, dependency)
+
+        name, text, html_parser = self.get_the_parsing(name, result)
+        if (name != None) and (text != None):
+            the_values_for_license = self.ins_parsing.extract(name, text)
+
+        return (the_values_for_license, result)
+
+    def get_the_parsings(self, the_downloads, the_downloads_in_progress):
+        for name, the_values_for_license, result in the_downloads:
+            the_downloads_in_progress.append((the_values_for_license, result))
+            yield self.get_the_parsing(name, result)
+
+    def search_the_licenses_in_processes(self, the_items):
+        # the downloads in the threads feed the parsings in the processes, both in the order of the items
+        the_downloads_in_progress = deque()
+        the_downloads = self.ins_workers.map(self.download_the_license, the_items)
+        the_parsings = self.get_the_parsings(the_downloads, the_downloads_in_progress)
+        the_results = self.ins_processes.map(extract_the_license, the_parsings)
+        try:
+            for the_values in the_results:
+                the_values_for_license, result = the_downloads_in_progress.popleft()
+                if the_values != None:
+                    the_values_for_license = the_values
+                yield (the_values_for_license, result)
+        finally:
+            the_results.close()
+            the_parsings.close()
+            the_downloads.close()
+
+    def search_the_licenses(self, the_items):
+        if self.ins_processes.is_sequential() == True:
+            return self.ins_workers.map(self.search_the_license, the_items)
+        return self.search_the_licenses_in_processes(the_items)
+
+    def defer(self, platform, the_dependencies_to_defer, number_of_errors, the_errors, result):
+        # the dependencies are put in the deferred queue without their last errors, if the delay allows it
+        if self.ins_deferred_queue.can_defer(platform, the_dependencies_to_defer, result) == False: return False
+        del the_errors[len(the_errors) - number_of_errors:]
+        self.ins_deferred_queue.put(platform, the_dependencies_to_defer, result)
+        return True
 
     def extract_the_licenses(self, platform, the_dependencies, number_of_errors_max):
         the_licenses = list()
         the_errors = list()
 
+        self.resolve_in_advance(platform, the_dependencies)
+        the_items = [(platform, dependency) for dependency in the_dependencies]
+        the_results = self.search_the_licenses(the_items)
+
         to_treat = True
         number_of_errors = 0
+        result = None
         for i_dependency in range(0, len(the_dependencies)):
-            dependency = the_dependencies[i_dependency]
-            component = dependency[0]
+            dependency = CDependency(the_dependencies[i_dependency])
+            component = dependency.get_component()
 
             if number_of_errors == number_of_errors_max:
+                if to_treat == True:
+                    # the downloads in progress are stopped
+                    the_results.close()
+                    # the successive errors and the next dependencies are retried after the delay
+                    the_dependencies_to_defer = the_dependencies[i_dependency - number_of_errors:]
+                    if self.defer(platform, the_dependencies_to_defer, number_of_errors, the_errors, result) == True:
+                        return (the_licenses, the_errors)
                 to_treat = False
 
             the_values_for_license = list()
             if to_treat == True:
                 print(platform, ':', component)
-                if platform == self.ins_name.gradle:
-                    the_values_for_license = self.get_license_for_gradle(platform, dependency)
-                elif platform == self.ins_name.go:
-                    the_values_for_license = self.get_license_for_go(platform, dependency)
-                elif platform != None:
-                    the_values_for_license = self.get_license_for_others(platform, dependency)
-
-            error_code = int(self.ins_download.error_code)
-            if error_code < 300:
+                r = next(the_results)
+                the_values_for_license, result = r
+
+            if (result != None) and (result.is_ok() == True):
                 number_of_errors = 0
-                the_licenses.append(dependency + the_values_for_license)
+                the_licenses.append(CLicenseResult(dependency, the_values_for_license))
+                self.keep_the_license_of_the_registry(platform, dependency, the_values_for_license, result)
             else:
-                field_error_code = ['error code = ' + self.ins_download.error_code]
+                error_code = str(None)
+                if result != None:
+                    error_code = result.error_code
+                the_notes = list()
                 if to_treat == False:
-                    dependency += ['successive authorized errors at ' + str(number_of_errors)]
+                    the_notes = [CErrorResult.prefix_of_the_successive_errors + str(number_of_errors)]
                 else:
                     number_of_errors += 1
-                the_errors.append(field_error_code + dependency)
+                the_errors.append(CErrorResult(dependency, error_code, the_notes))
+
+        the_results.close()
+
+        # the last dependencies are in error: the threshold is reached after the loop
+        if (to_treat == True) and (number_of_errors > 0) and (number_of_errors == number_of_errors_max):
+            the_dependencies_to_defer = the_dependencies[len(the_dependencies) - number_of_errors:]
+            if self.defer(platform, the_dependencies_to_defer, number_of_errors, the_errors, result) == True:
+                return (the_licenses, the_errors)
+            to_treat = False
 
         if to_treat == False:
-            if self.ins_download.next_date != None:
-                text = 'retry after ' + self.ins_download.next_date
-                text += ' - in ' + self.ins_download.delay
-                the_errors.insert(0, [text])
+            if (result != None) and (result.next_date != None):
+                text = 'retry after ' + result.next_date
+                text += ' - in ' + result.delay
+                the_errors.insert(0, CRecord([text]))
 
         return (the_licenses, the_errors)
 
@@ -169,21 +296,88 @@ class CSearch:
 
         return the_platforms
 
+    def get_the_platforms_by_registry(self, the_dependencies_by_platform):
+        # the lockfiles before the manifests: the dependencies of the manifests take the licenses of the locked versions
+        the_platforms = list(the_dependencies_by_platform.keys())
+        return sorted(the_platforms, key=lambda platform: self.ins_name.get_the_platform_of_the_packages(platform) == platform)
+
+    def add_the_licenses(self, platform, the_dependencies, ins_config, result, result_on_error):
+        sub_folder = platform.replace('.', '_')
+        self.ins_download.path_licenses = os.path.join(ins_config.path_licenses, sub_folder)
+
+        r =self.extract_the_licenses(platform, the_dependencies, ins_config.number_of_errors_max)
+        the_licenses, the_errors = r
+        if len(the_licenses) > 0:
+            result.setdefault(platform, list()).extend(the_licenses)
+        if len(the_errors) > 0:
+            result_on_error.setdefault(platform, list()).extend(the_errors)
+
     def get_the_licenses(self, the_dependencies_by_platform, ins_config, ins_filter):
         result = dict()
         result_on_error = dict()
 
         self.ins_download.ins_filter = ins_filter
-
-        for platform, the_dependencies in the_dependencies_by_platform.items():
-            sub_folder = platform.replace('.', '_')
-            self.ins_download.path_licenses = os.path.join(ins_config.path_licenses, sub_folder)
-
-            r =self.extract_the_licenses(platform, the_dependencies, ins_config.number_of_errors_max)
-            the_licenses, the_errors = r
-            if len(the_licenses) > 0:
-                result[platform] = the_licenses
-            if len(the_errors) > 0:
-                result_on_error[platform] = the_errors
+        number = ins_config.number_of_parallel_downloads
+        the_numbers = ins_config.the_numbers_of_parallel_downloads_by_platform
+        rate = ins_config.number_of_requests_per_second
+        the_rates = ins_config.the_numbers_of_requests_per_second_by_platform
+        self.ins_download.ins_rate_limits = CRateLimits(number, the_numbers, rate, the_rates)
+        self.ins_workers = CWorkers(ins_config.number_of_parallel_downloads)
+        keep_alive = str(ins_config.keep_alive).lower() in ['yes', 'y', 'true']
+        self.ins_download.ins_session = CSession(ins_config.size_of_the_pool_of_connections, keep_alive)
+        the_times = ins_config.the_times_to_live_of_the_cache_by_platform
+        self.ins_download.ins_cache = CCache(ins_config.path_cache, ins_config.time_to_live_of_the_cache, the_times)
+        timeout = ins_config.timeout
+        if timeout == 0:
+            timeout = None
+        self.ins_download.ins_retries = CRetries(ins_config.number_of_retries, ins_config.budget_of_retries, timeout)
+        self.ins_download.in_memory = str(ins_config.in_memory).lower() in ['yes', 'y', 'true']
+        self.ins_download.to_write = str(ins_config.to_write).lower()
+        self.ins_download.to_stream = str(ins_config.to_stream).lower() in ['yes', 'y', 'true']
+        self.ins_parsing.html_parser = str(ins_config.html_parser).lower()
+        self.ins_processes = CProcesses(ins_config.number_of_parsing_processes)
+        self.the_resolvers = list()
+        path_maven = str()
+        path_gradle = str()
+        if str(ins_config.local_installations).lower() in ['yes', 'y', 'true']:
+            # the node_modules folders next to the files found by the filter
+            the_files_by_platform = dict()
+            if ins_filter != None:
+                the_files_by_platform = ins_filter.the_contents
+            self.the_resolvers.append(CNodeModules(ins_config.path_dependencies, the_files_by_platform))
+            self.the_resolvers.append(CCargoRegistry(ins_config.path_cargo_home))
+            self.the_resolvers.append(CGoModuleCache(ins_config.path_go_modules))
+            self.the_resolvers.append(CCocoaPodsSpecs(ins_config.path_cocoapods_repos))
+            path_maven = ins_config.path_maven_repository
+            path_gradle = ins_config.path_gradle_caches
+        # the POMs of Maven Central when they are not in the caches, only if asked
+        ins_download_for_maven = None
+        if str(ins_config.maven_central).lower() in ['yes', 'y', 'true']:
+            ins_download_for_maven = self.ins_download
+        self.the_resolvers.append(CCrates(self.ins_download, ins_config.number_of_parallel_downloads))
+        self.the_resolvers.append(CMavenPoms(ins_download_for_maven, path_maven, path_gradle, number_of_workers=ins_config.number_of_parallel_downloads))
+        self.the_resolvers.append(CGitHub(self.ins_download, ins_config.github_token))
+
+        delay = ins_config.maximal_delay_of_a_deferred_retry
+        self.ins_deferred_queue = CDeferredQueue(delay, ins_config.number_of_deferred_retries)
+
+        self.the_licenses_by_registry = dict()
+        for platform in self.get_the_platforms_by_registry(the_dependencies_by_platform):
+            the_dependencies = the_dependencies_by_platform[platform]
+            self.add_the_licenses(platform, the_dependencies, ins_config, result, result_on_error)
+
+            # the deferred dependencies which can be retried now
+            item = self.ins_deferred_queue.get(False)
+            while item != None:
+                self.add_the_licenses(item[0], item[1], ins_config, result, result_on_error)
+                item = self.ins_deferred_queue.get(False)
+
+        # the deferred dependencies, by waiting for their date
+        while self.ins_deferred_queue.is_empty() == False:
+            item = self.ins_deferred_queue.get(True)
+            self.add_the_licenses(item[0], item[1], ins_config, result, result_on_error)
+
+        self.ins_download.close()
+        self.ins_processes.close()
 
         return (result, result_on_error)
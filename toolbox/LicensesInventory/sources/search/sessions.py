@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import threading
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CSession:
+    """
+    A session by host: the connections are kept alive and reused by all the downloads
+    """
+
+    def __init__(self, size_of_the_pool=10, keep_alive=True):
+        self.size_of_the_pool = size_of_the_pool
+        self.keep_alive = keep_alive
+        self.the_sessions_by_host = dict()
+        self.lock = threading.Lock()
+
+    def get_host(self, url):
+        return urlparse(url).netloc.lower()
+
+    def create_session(self):
+        session = requests.Session()
+
+        # the workers wait for a free connection instead of opening a new one
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.size_of_the_pool, pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if self.keep_alive == False:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def get_session(self, url):
+        host = self.get_host(url)
+        with self.lock:
+            if host not in self.the_sessions_by_host.keys():
+                self.the_sessions_by_host[host] = self.create_session()
+            return self.the_sessions_by_host[host]
+
+    def get(self, url, **the_parameters):
+        session = self.get_session(url)
+        return session.get(url, **the_parameters)
+
+    def post(self, url, **the_parameters):
+        session = self.get_session(url)
+        return session.post(url, **the_parameters)
+
+    def close(self):
+        with self.lock:
+            for host, session in self.the_sessions_by_host.items():
+                session.close()
+            self.the_sessions_by_host = dict()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+
+# Measure the deletion of the comments on large Gradle and Swift files, generated with and without comments,
+# or on the files given as arguments, from the root of the project:
+#     python3 tests/benchmarks/benchmark_comments.py [file...]
+# The former deletion (CComment before the syntaxes by format) is given to compare, on the same lines.
+# All the rows use the syntax of the format of the file.
+
+import sys
+import os
+import time
+
+path = os.getcwd()
+sys.path.insert(1, path)
+
+from sources.common import CComment, CFile, CFilter, CName
+
+
+class CFormerComment:
+    """
+    The former CComment: the lines starting by a comment, and the block comments
+    """
+
+    def __init__(self):
+        self.the_simples = ['#', '//']
+        self.the_complexes = [('/*', '*/')]
+
+    def is_simple_comment(self, ref):
+        line = ref.strip()
+        for start in self.the_simples:
+            if line.find(start) == 0:
+                return True
+
+                return False
+
+    def is_complex_comment(self, the_lines, a):
+        line = the_lines[a].replace('\n', str())
+        b = a + 0
+
+        # search comment
+        the_values = tuple()
+        my_line = line.strip()
+        for start_and_stop in self.the_complexes:
+            start, stop = start_and_stop
+            p = my_line.find(start)
+            if p > -1:
+                the_values = (start, stop, p)
+
+        if the_values == tuple():
+            return (line, a)
+
+        text_before = str()
+        if p > 0:
+            text_before = line[0:p]
+            my_line = my_line[p:]
+
+        # search the end of the comment
+        b = a + 0
+        while stop not in my_line:
+            b += 1
+            my_line = the_lines[b].replace('\n', str())
+
+        text_after = str()
+        p_stop = my_line.find(stop)
+        p_stop += len(stop)
+        if p_stop < len(my_line):
+            text_after = my_line[p:]
+
+        text_after = text_after.strip()
+        if (text_before == str()) and (text_after == str()):
+            line = None
+        else:
+            line = text_before + ' ' + text_after
+            line = line.rstrip()
+
+        return (line, b)
+
+    def delete(self, the_lines):
+        result = list()
+
+        to_continue = False
+        a = -1
+        while (a+1) < len(the_lines):
+            a += 1
+            line = the_lines[a].replace('\n', str())
+            to_continue = True
+
+            if self.is_simple_comment(line) == True:
+                to_continue = False
+
+            if to_continue == True:
+                r = self.is_complex_comment(the_lines, a)
+                line, a = r
+                if line == None:
+                    to_continue = False
+
+            if to_continue == True:
+                result.append(line)
+
+        return result
+
+
+def get_gradle(number_of_dependencies, with_comments=True):
+    the_lines = ['dependencies {']
+    if with_comments == True:
+        the_lines.insert(0, '// the dependencies of the application')
+    for i in range(0, number_of_dependencies):
+        line = '    implementation \'com.example.group' + str(i) + ':library-' + str(i) + ':1.' + str(i) + '.0\''
+        if with_comments == True:
+            line += ' // the library ' + str(i)
+        the_lines.append(line)
+        if (i % 10 == 0) and (with_comments == True):
+            the_lines += ['    /*', '     * testImplementation "junit:junit:4.13.' + str(i) + '"', '     */']
+        if i % 25 == 0:
+            the_lines.append('')
+    the_lines.append('}')
+    return the_lines
+
+
+def get_swift(number_of_dependencies, with_comments=True):
+    the_lines = ['// swift-tools-version:5.9', 'import PackageDescription', '', 'let package = Package(', '    dependencies: [']
+    for i in range(0, number_of_dependencies):
+        line = '        .package(url: "https://github.com/owner' + str(i) + '/repository-' + str(i) + '.git", from: "1.' + str(i) + '.0"),'
+        if with_comments == True:
+            line += ' // the package ' + str(i)
+        the_lines.append(line)
+        if (i % 10 == 0) and (with_comments == True):
+            the_lines.append('        /* .package(url: "https://github.com/old/old-' + str(i) + '.git", exact: "0.1.0"), */')
+    the_lines += ['    ]', ')']
+    return the_lines
+
+
+def measure(function, the_lines, number_of_runs):
+    # the shortest duration: the least disturbed run
+    result = None
+    duration = None
+
+    for i in range(0, number_of_runs):
+        start = time.perf_counter()
+        result = function(the_lines)
+        d = time.perf_counter() - start
+        if (duration == None) or (d < duration):
+            duration = d
+
+    return (result, duration)
+
+
+def main():
+    the_files = list()
+    for file in sys.argv[1:]:
+        folder, filename = os.path.split(file)
+        platform = CFilter().get_platform(filename)
+        the_files.append((filename, platform, CFile().read_text_file (folder, filename)))
+    if len(the_files) == 0:
+        number_of_dependencies = 20000
+        the_files.append(('build.gradle', CName().gradle, get_gradle(number_of_dependencies)))
+        the_files.append(('build.gradle without comments', CName().gradle, get_gradle(number_of_dependencies, False)))
+        the_files.append(('Package.swift', CName().swift, get_swift(number_of_dependencies)))
+        the_files.append(('Package.swift without comments', CName().swift, get_swift(number_of_dependencies, False)))
+
+    number_of_runs = 11
+    for filename, platform, the_lines in the_files:
+        size = sum([len(line) + 1 for line in the_lines]) / (1024 * 1024)
+        ins_former_comment = CFormerComment()
+        ins_comment = CComment()
+        the_results = list()
+        the_results.append(('former', measure(ins_former_comment.delete, the_lines, number_of_runs)))
+        the_results.append(('one pass', measure(lambda the_lines: ins_comment.delete(the_lines, platform), the_lines, number_of_runs)))
+
+        print(filename + ': ' + str(len(the_lines)) + ' lines, ' + '{:.2f}'.format(size) + ' MB')
+        for name, result in the_results:
+            the_new_lines, duration = result
+            print('    ' + name.ljust(18) + '{:8.2f}'.format(duration * 1000) + ' ms  ' + '{:8.1f}'.format(size / duration) + ' MB/s  ' + str(len(the_new_lines)) + ' lines')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+# Compare the parsers of the HTML pages on the pages of tests/benchmarks/html (npm, pub.dev, cocoapods),
+# with the pages stored for the unit tests if their data are there, or on the folders given as arguments,
+# from the root of the project:
+#     python3 tests/benchmarks/benchmark_html_parsers.py [folder...]
+
+import sys
+import os
+import time
+
+path = os.getcwd()
+sys.path.insert(1, path)
+
+from sources.search import CParsing, CHTMLLicense
+
+
+def get_the_files(the_paths):
+    the_files = list()
+
+    for path in the_paths:
+        if os.path.isdir(path) == False:
+            print('INFO: no folder ' + path)
+            continue
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith('.html') == True:
+                the_files.append(os.path.join(path, filename))
+
+    return the_files
+
+
+def measure(function, text, number_of_runs):
+    result = None
+
+    start = time.perf_counter()
+    for i in range(0, number_of_runs):
+        result = function(text)
+    duration = (time.perf_counter() - start) / number_of_runs
+
+    return (result, duration)
+
+
+def stream(text):
+    # like CDownload.read_by_parts
+    ins_parser = CHTMLLicense(True)
+    size = 16384
+    for i in range(0, len(text), size):
+        ins_parser.feed(text[i:i + size])
+        if ins_parser.is_done() == True: break
+    ins_parser.close()
+    return ins_parser.get_the_values()
+
+
+def main():
+    the_paths = sys.argv[1:]
+    if len(the_paths) == 0:
+        the_paths.append(os.path.join(path, 'tests', 'benchmarks', 'html'))
+        # the data of the unit tests are the assets of the releases
+        path_results = os.path.join(path, 'tests', 'unittests', 'data', 'get_the_licenses', 'results')
+        for sub_folder in ['package_json', 'pubspec_yaml', 'Podfile']:
+            if os.path.isdir(os.path.join(path_results, sub_folder)) == True:
+                the_paths.append(os.path.join(path_results, sub_folder))
+
+    the_files = get_the_files(the_paths)
+    if len(the_files) == 0:
+        print('No HTML page to parse')
+        print('Usage, from the root of the project: python3 tests/benchmarks/benchmark_html_parsers.py [folder with .html files...]')
+        return
+
+    ins_parsing = CParsing()
+    number_of_runs = 20
+    total_soup = 0
+    total_fast = 0
+    for file in the_files:
+        text = ins_parsing.read(file)
+        soup, duration_soup = measure(ins_parsing.get_license_with_soup_in_text, text, number_of_runs)
+        fast, duration_fast = measure(ins_parsing.get_license_with_html_in_text, text, number_of_runs)
+        streamed, duration_stream = measure(stream, text, number_of_runs)
+        total_soup += duration_soup
+        total_fast += duration_fast
+
+        msg = os.path.basename(file) + ': ' + str(len(text) // 1024) + ' KB'
+        msg += ', beautifulsoup ' + str(round(duration_soup * 1000, 2)) + ' ms'
+        msg += ', fast ' + str(round(duration_fast * 1000, 2)) + ' ms'
+        msg += ', stream ' + str(round(duration_stream * 1000, 2)) + ' ms'
+        if fast != soup:
+            msg += ' - DIFFERENT: ' + str(soup) + ' / ' + str(fast)
+        if streamed != soup:
+            msg += ' - stream: ' + str(streamed)
+        print(msg)
+
+    msg = 'Total: beautifulsoup ' + str(round(total_soup * 1000, 2)) + ' ms'
+    msg += ', fast ' + str(round(total_fast * 1000, 2)) + ' ms'
+    if total_fast > 0:
+        msg += ' (x' + str(round(total_soup / total_fast, 1)) + ')'
+    print(msg)
+
+
+if __name__ == "__main__":
+    main()
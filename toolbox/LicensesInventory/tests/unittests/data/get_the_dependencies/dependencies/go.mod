@@ -0,0 +1,12 @@
+module go_project
+
+go 1.21
+
+require (
+	go_c_a v1.0.0
+	go_c_b v1.0.1
+	go_c_c v1.0.2
+	go_c_d v1.0.3
+	go_c_e v1.0.4
+	go_indirect v1.0.0 // indirect
+)
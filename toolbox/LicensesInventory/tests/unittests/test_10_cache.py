@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+import threading
+
+from sources.common import CName, CFilter
+from sources.search import CDownload, CCache
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path_cache = os.path.join(self.tmp.name, 'cache')
+        os.mkdir(self.path_cache)
+        self.path_licenses = os.path.join(self.tmp.name, 'licenses')
+
+        self.platform = CName().roast
+        self.the_key_and_dependency = {CName().component: 'adler'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def get_response(self, status_code, content, headers=dict()):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers
+        response.content = content
+        response.text = content.decode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+    def get_ins_download(self, time_to_live):
+        ins_filter = CFilter()
+        ins_filter.the_URLs[self.platform] = 'https://crates.io/api/v1/crates/[component]'
+        ins_filter.the_filenames[self.platform] = '[component].json'
+
+        ins_download = CDownload()
+        ins_download.ins_filter = ins_filter
+        ins_download.path_licenses = self.path_licenses
+        ins_download.ins_cache = CCache(self.path_cache, time_to_live, dict())
+        return ins_download
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_fresh_page_is_not_downloaded(self, mock_get):
+        headers = {'ETag': '"v1"'}
+        mock_get.return_value = self.get_response(200, b'{"license": "MIT"}', headers)
+
+        ins_download = self.get_ins_download(3600)
+        a = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+        b = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertEqual(1, mock_get.call_count)
+        self.assertEqual('200', b.error_code)
+        self.assertEqual(a.content, b.content)
+        with open(b.file, 'rt', encoding='utf-8') as f:
+            self.assertEqual('{"license": "MIT"}\n', f.read())
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_page_not_modified(self, mock_get):
+        headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 14 Feb 2024 18:00:00 GMT'}
+        mock_get.return_value = self.get_response(200, b'{"license": "MIT"}', headers)
+
+        ins_download = self.get_ins_download(0)
+        ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        mock_get.return_value = self.get_response(304, b'')
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertEqual(2, mock_get.call_count)
+        the_headers = mock_get.call_args[1]['headers']
+        self.assertEqual('"v1"', the_headers['If-None-Match'])
+        self.assertEqual('Wed, 14 Feb 2024 18:00:00 GMT', the_headers['If-Modified-Since'])
+        self.assertEqual(True, result.is_ok())
+        self.assertEqual(b'{"license": "MIT"}', result.content)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_page_of_the_cache_missing(self, mock_get):
+        mock_get.return_value = self.get_response(200, b'{"license": "MIT"}', {'ETag': '"v1"'})
+        ins_download = self.get_ins_download(0)
+        ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        # the entry without its page: no validators, the page is downloaded again
+        url = 'https://crates.io/api/v1/crates/adler'
+        path, file_entry, file_content = ins_download.ins_cache.get_files(url)
+        os.remove(file_content)
+        self.assertEqual(None, ins_download.ins_cache.get(url))
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertNotIn('If-None-Match', mock_get.call_args[1]['headers'])
+        self.assertEqual('200', result.error_code)
+        self.assertEqual(True, os.path.isfile(file_content))
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_page_of_the_cache_removed_during_the_request(self, mock_get):
+        mock_get.return_value = self.get_response(200, b'{"license": "MIT"}', {'ETag': '"v1"'})
+        ins_download = self.get_ins_download(0)
+        ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+        path, file_entry, file_content = ins_download.ins_cache.get_files('https://crates.io/api/v1/crates/adler')
+
+        def get(url, headers=dict(), **kwargs):
+            if 'If-None-Match' in headers:
+                os.remove(file_content)
+                return self.get_response(304, b'')
+            return self.get_response(200, b'{"license": "MIT"}', {'ETag': '"v1"'})
+
+        mock_get.side_effect = get
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        # the 304 is not an error: the page is requested again without validators
+        self.assertEqual(3, mock_get.call_count)
+        self.assertNotIn('If-None-Match', mock_get.call_args[1]['headers'])
+        self.assertEqual('200', result.error_code)
+        self.assertEqual(b'{"license": "MIT"}', result.content)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_no_cache(self, mock_get):
+        mock_get.return_value = self.get_response(200, b'{"license": "MIT"}', {'ETag': '"v1"'})
+
+        ins_download = self.get_ins_download(3600)
+        ins_download.ins_cache = CCache()
+        ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+        ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertEqual(2, mock_get.call_count)
+        self.assertNotIn('If-None-Match', mock_get.call_args[1]['headers'])
+        self.assertEqual([], os.listdir(self.path_cache))
+
+    def test_same_entry_written_by_threads(self):
+        ins_cache = CCache(self.path_cache, 60, dict())
+        file = os.path.join(self.path_cache, 'entry')
+        the_contents = [bytes([i]) * 1000000 for i in range(0, 8)]
+        the_threads = [threading.Thread(target=ins_cache.write_atomically, args=(file, content, 'wb')) for content in the_contents]
+        for thread in the_threads:
+            thread.start()
+        for thread in the_threads:
+            thread.join()
+
+        # one of the contents, whole, and no temporary file left
+        with open(file, 'rb') as f:
+            self.assertIn(f.read(), the_contents)
+        self.assertEqual(['entry'], os.listdir(self.path_cache))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import MagicMock
+import time
+
+from sources.search import CRateLimit, CRateLimits
+
+
+def get_response(status_code, headers=dict()):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers
+    return response
+
+
+class TestRateLimits(unittest.TestCase):
+
+    def test_token_bucket(self):
+        ins_rate_limit = CRateLimit(20, 1)
+        start = time.monotonic()
+        for i in range(0, 5):
+            ins_rate_limit.acquire()
+            ins_rate_limit.release(get_response(200))
+        duration = time.monotonic() - start
+
+        # the first token is available, the next ones each 0.05 second
+        self.assertGreaterEqual(duration, 0.18)
+
+    def test_no_limit(self):
+        ins_rate_limit = CRateLimit(0, 1)
+        start = time.monotonic()
+        for i in range(0, 50):
+            ins_rate_limit.acquire()
+            ins_rate_limit.release(get_response(200))
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_growth_and_back_off(self):
+        ins_rate_limit = CRateLimit(4, 8)
+        ins_rate_limit.rate = 1
+        self.assertEqual(1, ins_rate_limit.number_of_requests)
+
+        for i in range(0, 100):
+            ins_rate_limit.adapt(get_response(200))
+        self.assertEqual(8, ins_rate_limit.number_of_requests)
+        self.assertEqual(4, ins_rate_limit.rate)
+
+        ins_rate_limit.adapt(get_response(429))
+        self.assertEqual(4, ins_rate_limit.number_of_requests)
+        self.assertEqual(2, ins_rate_limit.rate)
+
+    def test_throttled_without_limit(self):
+        ins_rate_limit = CRateLimit(0, 1)
+        ins_rate_limit.adapt(get_response(429, {'Retry-After': '30'}))
+
+        self.assertEqual(ins_rate_limit.rate_after_throttling, ins_rate_limit.rate)
+        self.assertGreater(ins_rate_limit.paused_until, time.monotonic() + 25)
+
+    def test_quota_of_the_platform(self):
+        ins_rate_limit = CRateLimit(0, 1)
+        reset = str(int(time.time()) + 100)
+        ins_rate_limit.adapt(get_response(200, {'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': reset}))
+        self.assertAlmostEqual(0.1, ins_rate_limit.rate, places=2)
+
+        ins_rate_limit.adapt(get_response(403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}))
+        self.assertGreater(ins_rate_limit.paused_until, time.monotonic() + 90)
+
+    def test_by_platform(self):
+        ins_rate_limits = CRateLimits(4, {'a': 2}, 0, {'b': 0.4})
+        a = ins_rate_limits.get('a')
+        b = ins_rate_limits.get('b')
+
+        self.assertIs(a, ins_rate_limits.get('a'))
+        self.assertEqual(2, a.maximal_number_of_requests)
+        self.assertEqual(0, a.rate)
+        self.assertEqual(4, b.maximal_number_of_requests)
+        self.assertEqual(0.4, b.rate)
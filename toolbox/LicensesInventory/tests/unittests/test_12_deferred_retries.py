@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from datetime import datetime, timedelta
+import time
+
+from sources.common import CName, CFilter
+from sources.configuration import CConfig
+from sources.search import CSearch, CDownloadResult, CDeferredQueue
+
+
+class CFakeSearch(CSearch):
+    """
+    The platform package.json throttles the first requests
+    """
+
+    def __init__(self, seconds):
+        super().__init__()
+        self.seconds = seconds
+        self.the_platforms = list()
+
+    def search_the_license(self, platform, dependency):
+        self.the_platforms.append(platform)
+        component = dependency[0]
+        if (platform == CName().package_json) and (self.the_platforms.count(platform) == 1):
+            next_date = datetime.utcnow() + timedelta(seconds=self.seconds)
+            next_date = next_date.strftime('%Y-%m-%d %H:%M:%S')
+            return (list(), CDownloadResult('429', next_date, '0:00:01', None, 0, 0, None))
+        return (['license_' + component], CDownloadResult('200', None, None, b'', 0, 0, component))
+
+
+class CFakeSearchOfTheLast(CFakeSearch):
+    """
+    The platform package.json throttles the first request of its last dependency
+    """
+
+    def search_the_license(self, platform, dependency):
+        self.the_platforms.append(platform)
+        component = dependency[0]
+        if (component == 'b') and (self.the_platforms.count(platform) <= 2):
+            next_date = datetime.utcnow() + timedelta(seconds=self.seconds)
+            next_date = next_date.strftime('%Y-%m-%d %H:%M:%S')
+            return (list(), CDownloadResult('429', next_date, '0:00:01', None, 0, 0, None))
+        return (['license_' + component], CDownloadResult('200', None, None, b'', 0, 0, component))
+
+
+class TestDeferredRetries(unittest.TestCase):
+
+    def get_the_licenses(self, seconds, maximal_delay, ins_search=None):
+        the_dependencies_by_platform = dict()
+        the_dependencies_by_platform[CName().package_json] = [['a'], ['b']]
+        the_dependencies_by_platform[CName().roast] = [['c']]
+
+        ins_config = CConfig()
+        ins_config.path_licenses = 'licenses'
+        ins_config.number_of_errors_max = 1
+        ins_config.maximal_delay_of_a_deferred_retry = maximal_delay
+
+        if ins_search == None:
+            ins_search = CFakeSearch(seconds)
+        r = ins_search.get_the_licenses(the_dependencies_by_platform, ins_config, CFilter())
+        return (ins_search.the_platforms, r)
+
+    def test_the_throttled_platform_is_retried_after_the_others(self):
+        start = time.time()
+        the_platforms, r = self.get_the_licenses(2, 900)
+        result, result_on_error = r
+
+        self.assertGreaterEqual(time.time() - start, 0.9)
+        expected = [CName().package_json, CName().roast, CName().package_json, CName().package_json]
+        self.assertEqual(expected, the_platforms)
+        self.assertEqual([['a', 'license_a'], ['b', 'license_b']], result[CName().package_json])
+        self.assertEqual([['c', 'license_c']], result[CName().roast])
+        self.assertEqual(dict(), result_on_error)
+
+    def test_the_last_dependency_is_throttled(self):
+        # the threshold is reached by the last dependency: it is deferred too
+        the_platforms, r = self.get_the_licenses(2, 900, CFakeSearchOfTheLast(2))
+        result, result_on_error = r
+
+        self.assertEqual(3, the_platforms.count(CName().package_json))
+        self.assertEqual([['a', 'license_a'], ['b', 'license_b']], result[CName().package_json])
+        self.assertEqual(dict(), result_on_error)
+
+    def test_the_last_dependency_is_throttled_too_long(self):
+        the_platforms, r = self.get_the_licenses(3600, 900, CFakeSearchOfTheLast(3600))
+        result, result_on_error = r
+
+        the_errors = result_on_error[CName().package_json]
+        self.assertEqual(0, the_errors[0][0].find('retry after '))
+        self.assertEqual(['error code = 429', 'b'], the_errors[1])
+
+    def test_the_delay_is_too_long(self):
+        the_platforms, r = self.get_the_licenses(3600, 900)
+        result, result_on_error = r
+
+        self.assertNotIn(CName().package_json, result)
+        the_errors = result_on_error[CName().package_json]
+        self.assertEqual(0, the_errors[0][0].find('retry after '))
+        self.assertEqual(['error code = 429', 'a'], the_errors[1])
+        self.assertEqual(['error code = 429', 'b', 'successive authorized errors at 1'], the_errors[2])
+
+    def test_the_number_of_retries(self):
+        ins_deferred_queue = CDeferredQueue(900, 1)
+        next_date = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        result = CDownloadResult('429', next_date, '0:00:00', None, 0, 0, None)
+
+        self.assertEqual(True, ins_deferred_queue.can_defer('p', [['a']], result))
+        ins_deferred_queue.put('p', [['a']], result)
+        self.assertEqual(('p', [['a']]), ins_deferred_queue.get(False))
+        self.assertEqual(True, ins_deferred_queue.is_empty())
+        self.assertEqual(False, ins_deferred_queue.can_defer('p', [['a']], result))
+        self.assertEqual(False, ins_deferred_queue.can_defer('p', [['a']], result._replace(next_date=None)))
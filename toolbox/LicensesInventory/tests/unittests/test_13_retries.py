@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+import threading
+import requests
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from sources.common import CName, CFilter
+from sources.search import CDownload, CRetries, CSession
+
+
+class CAlternateHandler(BaseHTTPRequestHandler):
+    # 502 then 200, with a body not read by the streamed responses
+    protocol_version = 'HTTP/1.1'
+    the_requests = list()
+
+    def do_GET(self):
+        CAlternateHandler.the_requests.append(self.path)
+        status_code = 502
+        if len(CAlternateHandler.the_requests) % 2 == 0:
+            status_code = 200
+        body = b'x' * 100000
+        self.send_response(status_code)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *the_arguments):
+        pass
+
+
+class TestRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.platform = CName().roast
+        self.the_key_and_dependency = {CName().component: 'adler'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def get_response(self, status_code):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = dict()
+        response.content = b'{"license": "MIT"}'
+        response.text = response.content.decode('utf-8')
+        return response
+
+    def get_ins_download(self, number_of_retries, budget):
+        ins_filter = CFilter()
+        ins_filter.the_URLs[self.platform] = 'https://crates.io/api/v1/crates/[component]'
+        ins_filter.the_filenames[self.platform] = '[component].json'
+
+        ins_download = CDownload()
+        ins_download.ins_filter = ins_filter
+        ins_download.path_licenses = os.path.join(self.tmp.name, 'licenses')
+        # no delay between the retries
+        ins_download.ins_retries = CRetries(number_of_retries, budget, 5, 0)
+        return ins_download
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_transient_failures_are_retried(self, mock_get):
+        mock_get.side_effect = [requests.exceptions.ConnectionError(), self.get_response(502), self.get_response(200)]
+
+        ins_download = self.get_ins_download(3, 0)
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertEqual(3, mock_get.call_count)
+        self.assertEqual(5, mock_get.call_args[1]['timeout'])
+        self.assertEqual(True, result.is_ok())
+        self.assertNotEqual(None, result.file)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_other_failures_are_not_retried(self, mock_get):
+        mock_get.return_value = self.get_response(404)
+
+        ins_download = self.get_ins_download(3, 0)
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+
+        self.assertEqual(1, mock_get.call_count)
+        self.assertEqual('404', result.error_code)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_number_of_retries_and_budget(self, mock_get):
+        mock_get.side_effect = requests.exceptions.ReadTimeout()
+
+        ins_download = self.get_ins_download(2, 3)
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+        self.assertEqual(3, mock_get.call_count)
+        self.assertEqual('ReadTimeout', result.error_code)
+
+        # one retry left in the budget of the run
+        result = ins_download.fetch(self.platform, self.the_key_and_dependency, None)
+        self.assertEqual(5, mock_get.call_count)
+        self.assertEqual('ReadTimeout', result.error_code)
+        self.assertEqual(False, ins_download.ins_retries.take())
+
+    def test_streamed_failures_give_back_their_connection(self):
+        CAlternateHandler.the_requests = list()
+        server = HTTPServer(('127.0.0.1', 0), CAlternateHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = 'http://127.0.0.1:' + str(server.server_port) + '/license'
+
+        ins_download = self.get_ins_download(3, 0)
+        # one connection: the retry waits for it if the 502 keeps it
+        ins_download.ins_session = CSession(1)
+        the_responses = list()
+        def request():
+            the_responses.append(ins_download.request(self.platform, 'adler', url, dict(), True))
+        worker = threading.Thread(target=request, daemon=True)
+        worker.start()
+        worker.join(10)
+
+        try:
+            self.assertEqual(False, worker.is_alive())
+            self.assertEqual(2, len(CAlternateHandler.the_requests))
+            self.assertEqual(200, the_responses[0].status_code)
+            the_responses[0].close()
+        finally:
+            ins_download.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_capped_delay(self):
+        ins_retries = CRetries(10, 0, None, 1.0, 4.0)
+        for attempt in range(0, 10):
+            delay = ins_retries.get_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4.0, 2 ** attempt))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+
+from sources.common import CName, CFilter
+from sources.search import CSearch, CParsing
+
+
+class TestInMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path_licenses = os.path.join(self.tmp.name, 'licenses')
+        self.platform = CName().roast
+        self.dependency = ['adler']
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def get_response(self):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = dict()
+        response.content = b'{"crate": {"name": "adler"}, "versions": [{"license": "0BSD OR MIT"}]}'
+        response.text = response.content.decode('utf-8')
+        return response
+
+    def get_ins_search(self, in_memory, to_write):
+        ins_filter = CFilter()
+        ins_filter.the_URLs[self.platform] = 'https://crates.io/api/v1/crates/[component]'
+        ins_filter.the_filenames[self.platform] = '[component].json'
+
+        ins_search = CSearch()
+        ins_search.ins_download.ins_filter = ins_filter
+        ins_search.ins_download.path_licenses = self.path_licenses
+        ins_search.ins_download.in_memory = in_memory
+        ins_search.ins_download.to_write = to_write
+        return ins_search
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_same_license_as_with_the_file(self, mock_get):
+        mock_get.return_value = self.get_response()
+
+        ins_search = self.get_ins_search(False, 'yes')
+        expected, result = ins_search.search_the_license(self.platform, self.dependency)
+        self.assertEqual(None, result.text)
+        self.assertEqual(True, os.path.isfile(result.file))
+
+        os.remove(result.file)
+        ins_search = self.get_ins_search(True, 'no')
+        the_values_for_license, result = ins_search.search_the_license(self.platform, self.dependency)
+        self.assertEqual(['0BSD OR MIT'], expected)
+        self.assertEqual(expected, the_values_for_license)
+        self.assertEqual(None, result.file)
+        self.assertEqual([], os.listdir(self.path_licenses))
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_files_written_in_background(self, mock_get):
+        mock_get.return_value = self.get_response()
+
+        ins_search = self.get_ins_search(True, 'in background')
+        the_values_for_license, result = ins_search.search_the_license(self.platform, self.dependency)
+        ins_search.ins_download.close()
+
+        self.assertEqual(['0BSD OR MIT'], the_values_for_license)
+        with open(result.file, 'rt', encoding='utf-8') as f:
+            self.assertEqual(result.text + '\n', f.read())
+
+    def test_parsing_of_a_text(self):
+        text = '<html><h2>Readme</h2><p>a</p><h3>License</h3>\n<p>Apache-2.0 &amp; MIT</p></html>'
+        file = os.path.join(self.tmp.name, 'page.html')
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+
+        ins_parsing = CParsing()
+        self.assertEqual(['Apache-2.0 & MIT'], ins_parsing.get_license_with_html_in_text(text))
+        self.assertEqual(ins_parsing.get_license_with_html(file), ins_parsing.get_license_with_html_in_text(text))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+
+from sources.common import CName, CFilter
+from sources.search import CSearch, CParsing, CHTMLLicense
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.platform = CName().package_json
+        self.the_parts_read = list()
+
+    def parse_by_parts(self, page, size):
+        ins_parser = CHTMLLicense(True)
+        for i in range(0, len(page), size):
+            ins_parser.feed(page[i:i + size])
+        ins_parser.close()
+        return ins_parser.get_the_values()
+
+    def test_same_license_as_the_whole_page(self):
+        the_pages = [
+            '<div><h3 class="a">License</h3><p>MIT</p></div>',
+            '<div><h2><span>Licen</span>se</h2> text <p> <b>Apache-2.0</b> &amp; MIT </p></div>',
+            '<div><h3>License</h3></div><div><h3>Other license</h3><br><p>BSD</p></div>',
+            '<div><h3>Readme</h3><p>a</p></div><section><h4>license</h4><ul><li>ISC</li></ul></section>',
+            '<div><h3>License</h3><script>var a = 1;</script><p>MIT</p></div>',
+            '<div><h3>Readme</h3><p>no license here</p></div>'
+        ]
+
+        ins_parsing = CParsing()
+        for page in the_pages:
+            expected = ins_parsing.get_license_with_soup_in_text(page)
+            for size in [1, 7, len(page)]:
+                self.assertEqual(expected, self.parse_by_parts(page, size), page)
+
+    def get_parts(self, chunk_size):
+        for part in [b'<html><h3>License</h3>', b'<p>MI', b'T</p>', b'<p>' + b'x' * 100000 + b'</p>', b'</html>']:
+            self.the_parts_read.append(part)
+            yield part
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_the_page_is_not_read_after_the_license(self, mock_get):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = dict()
+        response.encoding = 'utf-8'
+        response.iter_content.side_effect = self.get_parts
+        mock_get.return_value = response
+
+        ins_filter = CFilter()
+        ins_filter.the_URLs[self.platform] = 'https://www.npmjs.com/package/[component]'
+        ins_filter.the_filenames[self.platform] = '[component].html'
+        ins_search = CSearch()
+        ins_search.ins_download.ins_filter = ins_filter
+        ins_search.ins_download.to_stream = True
+
+        the_values_for_license, result = ins_search.search_the_license(self.platform, ['a'])
+
+        self.assertEqual(['MIT'], the_values_for_license)
+        self.assertEqual(True, result.is_ok())
+        self.assertEqual(None, result.file)
+        self.assertEqual(3, len(self.the_parts_read))
+        self.assertEqual(True, mock_get.call_args[1]['stream'])
+        response.close.assert_called_once()
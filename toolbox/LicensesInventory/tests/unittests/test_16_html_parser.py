@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+
+from sources.search import CParsing, CHTMLLicense
+
+
+class TestHTMLParser(unittest.TestCase):
+
+    def check(self, page, expected):
+        ins_parsing = CParsing()
+        self.assertEqual(expected, ins_parsing.get_license_with_soup_in_text(page), page)
+        self.assertEqual(expected, ins_parsing.get_license_with_html_in_text(page), page)
+
+    def test_the_levels_of_the_headings(self):
+        page = '<div><h3>License</h3><p>first</p></div><div><h2>License</h2><p>second</p></div>'
+        self.check(page, ['second'])
+
+        # the streaming takes the first heading of the page
+        ins_parser = CHTMLLicense(True)
+        ins_parser.feed(page)
+        self.assertEqual(['first'], ins_parser.get_the_values())
+
+    def test_the_order_of_the_headings(self):
+        page = '<div><h2>Other License</h2></div><div><h2>License</h2>text<p>second</p><p>third</p></div>'
+        self.check(page, ['second'])
+
+    def test_the_value_contains_a_heading(self):
+        page = '<div><h4>License</h4><div><h2>License</h2><p>inner</p></div></div>'
+        self.check(page, ['inner'])
+
+        page = '<div><h2>License</h2><div><h4>License</h4><p>inner</p></div></div>'
+        self.check(page, ['Licenseinner'])
+
+    def test_tags_not_closed(self):
+        page = '<div><h2>License<p>MIT</div><div><h3>License</h3><p>BSD</p>'
+        self.check(page, ['BSD'])
+
+    def test_the_parser_of_the_configuration(self):
+        page = '<h2>License</h2><p>Apache-2.0 &amp; MIT</p>'
+        ins_parsing = CParsing()
+        ins_parsing.html_parser = 'beautifulsoup'
+        self.assertEqual(['Apache-2.0 & MIT'], ins_parsing.get_license_with_html_in_text(page))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch
+import time
+
+from sources.common import CName, CWorkers, CProcesses
+from sources.search import CSearch, CDownloadResult
+
+
+def download_the_license(self, platform, dependency):
+    # a slow download of a page of crates.io, on error for the components starting with 'error'
+    component = dependency[0]
+    time.sleep(0.01 * (len(component) % 3))
+    if component.find('error') == 0:
+        return ('roast', list(), CDownloadResult('404', None, None, None, 0, 0, None))
+    text = '{"crate": {"id": "' + component + '"}, "versions": [{"license": "MIT-' + component + '"}]}'
+    return ('roast', list(), CDownloadResult('200', None, None, None, 0, 0, None, text))
+
+
+class TestPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.platform = CName().roast
+        the_components = ['c_a', 'c_bb', 'error_c', 'c_ddd', 'c_e', 'error_f', 'c_g', 'c_hh', 'c_i']
+        cls.the_dependencies = [[component] for component in the_components]
+
+    def extract(self, number_of_workers, number_of_processes, number_of_errors_max):
+        ins_search = CSearch()
+        ins_search.ins_workers = CWorkers(number_of_workers)
+        ins_search.ins_processes = CProcesses(number_of_processes)
+        the_dependencies = [dependency[:] for dependency in self.the_dependencies]
+        try:
+            return ins_search.extract_the_licenses(self.platform, the_dependencies, number_of_errors_max)
+        finally:
+            ins_search.ins_processes.close()
+
+    @patch.object(CSearch, 'download_the_license', download_the_license)
+    def test_same_results_as_without_processes(self):
+        expected = self.extract(1, 0, 999)
+        r = self.extract(4, 2, 999)
+        self.assertEqual(expected, r)
+
+        the_licenses, the_errors = r
+        self.assertEqual(7, len(the_licenses))
+        self.assertEqual(['c_a', 'MIT-c_a'], the_licenses[0])
+        self.assertEqual(['error code = 404', 'error_c'], the_errors[0])
+
+    @patch.object(CSearch, 'download_the_license', download_the_license)
+    def test_same_results_with_successive_errors(self):
+        the_dependencies = self.the_dependencies
+        self.the_dependencies = [['c_a'], ['error_b'], ['error_c'], ['c_d'], ['c_e']]
+        try:
+            expected = self.extract(1, 0, 2)
+            r = self.extract(4, 2, 2)
+        finally:
+            self.the_dependencies = the_dependencies
+        self.assertEqual(expected, r)
+
+        the_licenses, the_errors = r
+        self.assertEqual(1, len(the_licenses))
+        self.assertEqual(['error code = 404', 'c_d', 'successive authorized errors at 2'], the_errors[2])
+
+    def test_the_processes_keep_the_order(self):
+        ins_processes = CProcesses(2)
+        try:
+            the_items = [('[' + str(i) + ']', '[]') for i in range(0, 30)]
+            the_results = list(ins_processes.map(str.strip, the_items))
+            self.assertEqual([str(i) for i in range(0, 30)], the_results)
+        finally:
+            ins_processes.close()
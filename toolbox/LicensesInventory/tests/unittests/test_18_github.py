@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+
+from sources.common import CName
+from sources.search import CSearch, CDownload, CGitHub
+
+
+def get_response(status_code, data):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = dict()
+    response.json.return_value = data
+    return response
+
+
+class TestGitHub(unittest.TestCase):
+
+    def setUp(self):
+        self.the_dependencies = [
+            ['https://github.com/AliSoftware/OHHTTPStubs'],
+            ['https://github.com/owner/unknown.git'],
+            ['https://gitlab.com/owner/other']
+        ]
+
+    def get_data(self):
+        data = dict()
+        data['d0'] = {'name': 'OHHTTPStubs', 'licenseInfo': {'name': 'MIT License'}}
+        data['d1'] = None
+        return {'data': data}
+
+    def test_repositories(self):
+        ins_github = CGitHub(None, 'token')
+        self.assertEqual(('AliSoftware', 'OHHTTPStubs'), ins_github.get_repository(CName().swift, self.the_dependencies[0]))
+        self.assertEqual(('owner', 'unknown'), ins_github.get_repository(CName().swift, self.the_dependencies[1]))
+        self.assertEqual(None, ins_github.get_repository(CName().swift, self.the_dependencies[2]))
+        self.assertEqual(('pkg', 'errors'), ins_github.get_repository(CName().go, ['github.com/pkg/errors/v2']))
+        self.assertEqual(None, ins_github.get_repository(CName().go, ['emperror.dev/errors']))
+
+    @patch('sources.search.sessions.requests.Session.get')
+    @patch('sources.search.sessions.requests.Session.post')
+    def test_one_query_for_the_repositories(self, mock_post, mock_get):
+        mock_post.return_value = get_response(200, self.get_data())
+
+        ins_search = CSearch()
+        ins_search.the_resolvers = [CGitHub(ins_search.ins_download, 'token')]
+        ins_search.ins_download.to_stream = True
+        ins_search.ins_download.ins_filter = MagicMock()
+        r = ins_search.extract_the_licenses(CName().swift, self.the_dependencies[0:2], 999)
+        the_licenses, the_errors = r
+
+        self.assertEqual(1, mock_post.call_count)
+        self.assertEqual(0, mock_get.call_count)
+        query = mock_post.call_args[1]['json']['query']
+        self.assertIn('d1: repository(owner: "owner", name: "unknown")', query)
+        self.assertEqual('bearer token', mock_post.call_args[1]['headers']['Authorization'])
+        self.assertEqual([['https://github.com/AliSoftware/OHHTTPStubs', 'MIT License']], the_licenses)
+        self.assertEqual([['error code = 404', 'https://github.com/owner/unknown.git']], the_errors)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    @patch('sources.search.sessions.requests.Session.post')
+    def test_rest_when_the_batch_fails(self, mock_post, mock_get):
+        mock_post.return_value = get_response(502, None)
+        mock_get.return_value = get_response(200, {'license': {'name': 'Apache License 2.0'}})
+
+        ins_github = CGitHub(CDownload(), 'token', 1)
+        the_licenses = ins_github.resolve(CName().swift, self.the_dependencies)
+
+        self.assertEqual(2, mock_post.call_count)
+        self.assertEqual(2, mock_get.call_count)
+        self.assertEqual('https://api.github.com/repos/owner/unknown/license', mock_get.call_args[0][0])
+        the_values_for_license, result = the_licenses[tuple(self.the_dependencies[0])]
+        self.assertEqual(['Apache License 2.0'], the_values_for_license)
+        self.assertEqual(True, result.is_ok())
+
+    @patch('sources.search.sessions.requests.Session.post')
+    def test_search_for_gradle(self, mock_post):
+        data = {'d0': {'nodes': [{'name': 'androidannotations', 'licenseInfo': {'name': 'Other'}}]}, 'd1': {'nodes': []}}
+        mock_post.return_value = get_response(200, {'data': data})
+
+        ins_github = CGitHub(CDownload(), 'token')
+        the_dependencies = [['androidannotations', 'org.androidannotations'], ['unknown']]
+        the_licenses = ins_github.resolve(CName().gradle, the_dependencies)
+
+        self.assertIn('d0: search(query: "androidannotations", type: REPOSITORY, first: 1)', mock_post.call_args[1]['json']['query'])
+        self.assertEqual(['androidannotations', 'Other'], the_licenses[tuple(the_dependencies[0])][0])
+        self.assertEqual(['', ''], the_licenses[('unknown',)][0])
+
+    def test_no_token(self):
+        ins_github = CGitHub(CDownload(), str())
+        self.assertEqual(dict(), ins_github.resolve(CName().swift, self.the_dependencies))
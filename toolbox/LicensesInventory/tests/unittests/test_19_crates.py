@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+
+from sources.common import CName, CFilter
+from sources.search import CDownload, CParsing, CSearch, CCrates
+from sources.search.downloads import CDownloadResult
+
+
+class TestCrates(unittest.TestCase):
+
+    def get_ins_download(self):
+        ins_download = CDownload()
+        ins_download.ins_filter = CFilter()
+        ins_download.ins_filter.the_URLs = ins_download.ins_filter.get_the_URLs_by_name(CName())
+        ins_download.ins_filter.the_filenames = ins_download.ins_filter.get_the_filenames_by_name(CName())
+        return ins_download
+
+    def test_url_of_the_version(self):
+        ins_download = self.get_ins_download()
+        the_key_and_dependency = {CName().component: 'serde', CName().version: '1.0.197'}
+        url, filename, component = ins_download.get_data(CName().roast, the_key_and_dependency, None)
+        self.assertEqual('https://crates.io/api/v1/crates/serde/1.0.197', url)
+        self.assertEqual('serde__1_0_197.json', filename)
+
+        # without version: the crate
+        url, filename, component = ins_download.get_data(CName().roast, {CName().component: 'serde'}, None)
+        self.assertEqual('https://crates.io/api/v1/crates/serde', url)
+        self.assertEqual('serde.json', filename)
+
+    def test_version_of_cargo_lock(self):
+        ins_search = CSearch()
+        ins_search.ins_download = MagicMock()
+        ins_search.ins_download.fetch.return_value = None
+        ins_search.download_for_others(CName().roast, ['serde', '1.0.197'])
+        the_key_and_dependency = ins_search.ins_download.fetch.call_args[0][1]
+        self.assertEqual({CName().component: 'serde', CName().version: '1.0.197'}, the_key_and_dependency)
+
+        ins_search.download_for_others(CName().roast, ['serde'])
+        the_key_and_dependency = ins_search.ins_download.fetch.call_args[0][1]
+        self.assertEqual({CName().component: 'serde'}, the_key_and_dependency)
+
+    def test_license_of_the_version(self):
+        text = '{"version": {"crate": "a", "num": "1.0.0", "license": "MIT OR Apache-2.0"}}'
+        self.assertEqual(['MIT OR Apache-2.0'], CParsing().get_license_for_roast_in_text(text))
+
+    def test_license_of_the_stable_version(self):
+        text = '{"crate": {"id": "a", "max_stable_version": "1.0.0", "newest_version": "2.0.0-rc"}, '
+        text += '"versions": [{"num": "2.0.0-rc", "license": "MIT"}, {"num": "1.0.0", "license": "Apache-2.0"}]}'
+        self.assertEqual(['Apache-2.0'], CParsing().get_license_for_roast_in_text(text))
+
+    def test_license_without_json(self):
+        text = '{"crate": {"id": "a"}, "versions": [{"license": "MIT"}'
+        self.assertEqual(['MIT'], CParsing().get_license_for_roast_in_text(text))
+
+    def test_crates_in_several_versions(self):
+        text = '{"crate": {"id": "syn", "max_stable_version": "2.0.39"}, '
+        text += '"versions": [{"num": "2.0.39", "license": "MIT OR Apache-2.0"}, {"num": "1.0.109", "license": "MIT"}]}'
+        ins_download = MagicMock()
+        ins_download.fetch.return_value = CDownloadResult('200', None, None, None, 0, 0, None, text)
+
+        the_dependencies = [['syn', '1.0.109'], ['serde', '1.0.193'], ['syn', '2.0.39'], ['syn', '0.1.0'], ['syn']]
+        the_licenses = CCrates(ins_download, 2).resolve(CName().roast, the_dependencies)
+
+        # one request for syn, serde is downloaded as usual with its version
+        self.assertEqual(1, ins_download.fetch.call_count)
+        self.assertEqual({CName().component: 'syn'}, ins_download.fetch.call_args[0][1])
+        self.assertEqual(['MIT'], the_licenses[('syn', '1.0.109')][0])
+        self.assertEqual(['MIT OR Apache-2.0'], the_licenses[('syn', '2.0.39')][0])
+        self.assertEqual(['MIT OR Apache-2.0'], the_licenses[('syn',)][0])
+        # a version not in the page is downloaded as usual
+        self.assertNotIn(('syn', '0.1.0'), the_licenses)
+        self.assertNotIn(('serde', '1.0.193'), the_licenses)
+
+        self.assertEqual(dict(), CCrates(ins_download).resolve(CName().go, the_dependencies))
+        self.assertEqual(dict(), CCrates().resolve(CName().roast, the_dependencies))
+
+    def test_crate_on_error(self):
+        ins_download = MagicMock()
+        ins_download.fetch.return_value = CDownloadResult('429', None, None, None, 0, 0, None)
+        the_licenses = CCrates(ins_download).resolve(CName().roast, [['syn', '1.0.109'], ['syn', '2.0.39']])
+
+        # the error for all the versions: they are deferred together
+        self.assertEqual(False, the_licenses[('syn', '1.0.109')][1].is_ok())
+        self.assertEqual('429', the_licenses[('syn', '2.0.39')][1].error_code)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch
+import os
+import json
+import tempfile
+
+from sources.common import CName
+from sources.search import CSearch, CNodeModules
+
+
+class TestNodeModules(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        project = os.path.join(self.tmp.name, 'project')
+        self.write(project, {'name': 'project', 'dependencies': {'express': '^4.0.0'}})
+        node_modules = os.path.join(project, 'node_modules')
+        self.write(os.path.join(node_modules, 'express'), {'name': 'express', 'license': 'MIT'})
+        self.write(os.path.join(node_modules, '@angular', 'core'), {'name': '@angular/core', 'license': {'type': 'MIT'}})
+        self.write(os.path.join(node_modules, 'old'), {'name': 'old', 'licenses': [{'type': 'MIT'}, {'type': 'GPL-2.0'}]})
+        self.write(os.path.join(node_modules, 'nolicense'), {'name': 'nolicense'})
+        self.write(os.path.join(node_modules, 'express', 'node_modules', 'debug'), {'name': 'debug', 'license': 'MIT'})
+        # the nested version of a package installed at the top
+        self.write(os.path.join(node_modules, 'express', 'node_modules', 'old'), {'name': 'old', 'license': 'ISC'})
+        # the files found by the filter
+        self.the_files_by_platform = {CName().package_json: [os.path.join(project, 'package.json')]}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, folder, data):
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, 'package.json'), 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_the_installed_packages(self):
+        ins_node_modules = CNodeModules(self.tmp.name, self.the_files_by_platform)
+        the_dependencies = [['express'], ['@angular/core'], ['old'], ['debug'], ['nolicense'], ['unknown']]
+        the_licenses = ins_node_modules.resolve(CName().package_json, the_dependencies)
+
+        self.assertEqual(['MIT'], the_licenses[('express',)][0])
+        self.assertEqual(True, the_licenses[('express',)][1].is_ok())
+        self.assertEqual(['MIT'], the_licenses[('@angular/core',)][0])
+        self.assertEqual(['MIT OR GPL-2.0'], the_licenses[('old',)][0])
+        self.assertEqual(['MIT'], the_licenses[('debug',)][0])
+        self.assertNotIn(('nolicense',), the_licenses)
+        self.assertNotIn(('unknown',), the_licenses)
+        # the project itself is not an installed package
+        self.assertNotIn('project', ins_node_modules.the_licenses_by_package)
+
+    def test_the_versions_of_the_lockfiles(self):
+        self.write(os.path.join(self.tmp.name, 'project', 'node_modules', 'semver'), {'name': 'semver', 'version': '7.5.4', 'license': 'ISC'})
+        ins_node_modules = CNodeModules(self.tmp.name, self.the_files_by_platform)
+        the_dependencies = [['semver', '7.5.4'], ['semver', '5.7.2'], ['semver']]
+        the_licenses = ins_node_modules.resolve(CName().package_lock, the_dependencies)
+
+        self.assertEqual(['ISC'], the_licenses[('semver', '7.5.4')][0])
+        # another version installed: downloaded
+        self.assertNotIn(('semver', '5.7.2'), the_licenses)
+        self.assertEqual(['ISC'], the_licenses[('semver',)][0])
+
+    def test_the_files_found_only(self):
+        # a project in an ignored folder: its package.json is not found, its node_modules are not read
+        ignored = os.path.join(self.tmp.name, 'build', 'other')
+        self.write(ignored, {'name': 'other'})
+        self.write(os.path.join(ignored, 'node_modules', 'left-pad'), {'name': 'left-pad', 'license': 'WTFPL'})
+        # the node_modules of a lockfile
+        locked = os.path.join(self.tmp.name, 'locked')
+        os.makedirs(locked)
+        self.write(os.path.join(locked, 'node_modules', 'semver'), {'name': 'semver', 'version': '7.5.4', 'license': 'ISC'})
+        self.the_files_by_platform[CName().package_lock] = [os.path.join(locked, 'package-lock.json')]
+
+        ins_node_modules = CNodeModules(self.tmp.name, self.the_files_by_platform)
+        the_licenses = ins_node_modules.resolve(CName().package_json, [['express'], ['left-pad'], ['semver']])
+
+        self.assertEqual(['MIT'], the_licenses[('express',)][0])
+        self.assertNotIn(('left-pad',), the_licenses)
+        self.assertEqual(['ISC'], the_licenses[('semver',)][0])
+
+    def test_without_files(self):
+        # the node_modules folder of the path to parse only
+        ins_node_modules = CNodeModules(os.path.join(self.tmp.name, 'project'))
+        self.assertEqual(['MIT'], ins_node_modules.resolve(CName().package_json, [['express']])[('express',)][0])
+        ins_node_modules = CNodeModules(self.tmp.name)
+        self.assertEqual(dict(), ins_node_modules.resolve(CName().package_json, [['express']]))
+
+    def test_other_platforms(self):
+        ins_node_modules = CNodeModules(self.tmp.name, self.the_files_by_platform)
+        self.assertEqual(dict(), ins_node_modules.resolve(CName().roast, [['express']]))
+        self.assertEqual(None, ins_node_modules.the_licenses_by_package)
+
+    def test_no_path(self):
+        ins_node_modules = CNodeModules(os.path.join(self.tmp.name, 'unknown'))
+        self.assertEqual(dict(), ins_node_modules.resolve(CName().package_json, [['express']]))
+
+    def test_download_of_the_missing_packages(self):
+        the_downloads = list()
+
+        def download_for_others(ins_search, platform, dependency):
+            the_downloads.append(dependency[0])
+            return (None, ['Apache-2.0'], None)
+
+        ins_search = CSearch()
+        ins_search.the_resolvers = [CNodeModules(self.tmp.name, self.the_files_by_platform)]
+        with patch.object(CSearch, 'download_for_others', download_for_others):
+            ins_search.resolve_in_advance(CName().package_json, [['express'], ['unknown']])
+            r = ins_search.download_the_license(CName().package_json, ['express'])
+            self.assertEqual(['MIT'], r[1])
+            ins_search.download_the_license(CName().package_json, ['unknown'])
+
+        self.assertEqual(['unknown'], the_downloads)
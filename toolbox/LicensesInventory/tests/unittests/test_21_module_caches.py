@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import tempfile
+
+from sources.common import CName
+from sources.search import CCargoRegistry, CGoModuleCache, CLicenseFiles
+
+
+MIT = 'MIT License\n\nCopyright (c) 2020\n\nPermission is hereby granted, free of charge, to any person obtaining a copy'
+APACHE = '                                 Apache License\n                           Version 2.0, January 2004'
+GPL_3 = 'GNU GENERAL PUBLIC LICENSE\nVersion 3, 29 June 2007\n' + 'text ' * 100 + '13. Use with the GNU Affero General Public License.'
+
+
+class TestModuleCaches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, folder, filename, text):
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, filename), 'wt', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_the_license_files(self):
+        ins_license_files = CLicenseFiles()
+        self.assertEqual('GPL-3.0', ins_license_files.get_license_in_text(GPL_3))
+        self.write(self.tmp.name, 'LICENSE-MIT', MIT)
+        self.write(self.tmp.name, 'LICENSE-APACHE', APACHE)
+        self.write(self.tmp.name, 'README.md', MIT)
+        self.assertEqual('Apache-2.0, MIT', ins_license_files.get_license(self.tmp.name))
+
+    def test_the_crates(self):
+        registry = os.path.join(self.tmp.name, 'registry', 'src', 'index.crates.io-6f17d22bba15001f')
+        self.write(os.path.join(registry, 'serde-1.0.9'), 'Cargo.toml', '[package]\nname = "serde"\nlicense = "MIT"\n')
+        self.write(os.path.join(registry, 'serde-1.0.10'), 'Cargo.toml', '[package]\nname = "serde"\nlicense = "MIT OR Apache-2.0"\n')
+        self.write(os.path.join(registry, 'serde-json-2.0.0-rc.1'), 'Cargo.toml', '[dependencies]\nlicense = "no"\n')
+        self.write(os.path.join(registry, 'serde-json-2.0.0-rc.1'), 'LICENSE', MIT)
+
+        ins_cargo = CCargoRegistry(self.tmp.name)
+        the_dependencies = [['serde'], ['serde-json'], ['unknown']]
+        the_licenses = ins_cargo.resolve(CName().roast, the_dependencies)
+
+        self.assertEqual(['MIT OR Apache-2.0'], the_licenses[('serde',)][0])
+        self.assertEqual(True, the_licenses[('serde',)][1].is_ok())
+        self.assertEqual(['MIT'], the_licenses[('serde-json',)][0])
+        self.assertNotIn(('unknown',), the_licenses)
+        self.assertEqual(dict(), ins_cargo.resolve(CName().go, the_dependencies))
+
+    def test_the_versions_not_in_the_cache(self):
+        registry = os.path.join(self.tmp.name, 'registry', 'src', 'index.crates.io-6f17d22bba15001f')
+        self.write(os.path.join(registry, 'serde-1.0.9'), 'Cargo.toml', '[package]\nname = "serde"\nlicense = "MIT"\n')
+
+        ins_cargo = CCargoRegistry(self.tmp.name)
+        the_dependencies = [['serde', '1.0.9'], ['serde', '1.0.10'], ['serde']]
+        the_licenses = ins_cargo.resolve(CName().roast, the_dependencies)
+
+        self.assertEqual(['MIT'], the_licenses[('serde', '1.0.9')][0])
+        # the license of another version is not given: it is downloaded
+        self.assertNotIn(('serde', '1.0.10'), the_licenses)
+        self.assertEqual(['MIT'], the_licenses[('serde',)][0])
+
+    def test_the_go_modules(self):
+        self.write(os.path.join(self.tmp.name, 'github.com', '!burnt!sushi', 'toml@v1.2.0'), 'COPYING', MIT)
+        self.write(os.path.join(self.tmp.name, 'github.com', 'pkg', 'errors@v0.9.1'), 'LICENSE', APACHE)
+        self.write(os.path.join(self.tmp.name, 'github.com', 'pkg', 'errors', 'v2@v2.0.0'), 'LICENSE', MIT)
+        self.write(os.path.join(self.tmp.name, 'cache', 'download', 'golang.org', 'x@v1.0.0'), 'LICENSE', MIT)
+
+        ins_go = CGoModuleCache(self.tmp.name)
+        the_dependencies = [['github.com/BurntSushi/toml'], ['github.com/pkg/errors'], ['github.com/pkg/errors/v2'], ['golang.org/x']]
+        the_licenses = ins_go.resolve(CName().go, the_dependencies)
+
+        self.assertEqual(['MIT'], the_licenses[('github.com/BurntSushi/toml',)][0])
+        self.assertEqual(['Apache-2.0'], the_licenses[('github.com/pkg/errors',)][0])
+        self.assertEqual(['MIT'], the_licenses[('github.com/pkg/errors/v2',)][0])
+        self.assertNotIn(('golang.org/x',), the_licenses)
+
+    def test_the_last_version(self):
+        ins_cargo = CCargoRegistry(self.tmp.name)
+        the_versions = ['1.0.0-alpha', '1.10.0', '1.9.0', '1.0.0']
+        self.assertEqual('1.10.0', max(the_versions, key=ins_cargo.get_key_of_version))
+        self.assertEqual('1.0.0', max(['1.0.0-alpha', '1.0.0'], key=ins_cargo.get_key_of_version))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+
+from sources.common import CName
+from sources.configuration import CConfig
+from sources.search import CDownload, CMavenPoms
+
+
+def get_pom(group, artifact, version, licenses=list(), parent=None):
+    text = '<?xml version="1.0"?>\n<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+    if parent != None:
+        text += '<parent><groupId>' + parent[0] + '</groupId><artifactId>' + parent[1] + '</artifactId>'
+        text += '<version>' + parent[2] + '</version></parent>\n'
+    text += '<groupId>' + group + '</groupId><artifactId>' + artifact + '</artifactId><version>' + version + '</version>\n'
+    if len(licenses) > 0:
+        text += '<licenses>' + ''.join(['<license><name>' + name + '</name></license>' for name in licenses]) + '</licenses>\n'
+    return text + '</project>\n'
+
+
+def get_response(status_code, text):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = dict()
+    response.text = text
+    return response
+
+
+class TestMavenCaches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path_maven = os.path.join(self.tmp.name, 'm2')
+        self.path_gradle = os.path.join(self.tmp.name, 'gradle')
+        self.parent = ('org.example', 'parent', '3')
+
+        # the artifacts of Maven without licenses, and their parent
+        self.write(os.path.join(self.path_maven, 'org', 'example', 'parent', '3'), 'parent-3.pom', get_pom(*self.parent, ['Apache License, Version 2.0']))
+        for artifact in ['core', 'io']:
+            for version in ['1.9', '1.10']:
+                folder = os.path.join(self.path_maven, 'org', 'example', artifact, version)
+                self.write(folder, artifact + '-' + version + '.pom', get_pom('org.example', artifact, version, list(), self.parent))
+        # an artifact of Gradle with its licenses
+        folder = os.path.join(self.path_gradle, 'com.squareup.okio', 'okio', '3.0.0', '5d4c2a1b')
+        self.write(folder, 'okio-3.0.0.pom', get_pom('com.squareup.okio', 'okio', '3.0.0', ['The Apache Software License', 'MIT']))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, folder, filename, text):
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, filename), 'wt', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_the_local_poms(self):
+        ins_maven_poms = CMavenPoms(None, self.path_maven, self.path_gradle)
+        the_dependencies = [['core', 'org/example'], ['io', 'org/example'], ['okio', 'com/squareup/okio'], ['unknown', 'org/example'], ['other', '']]
+        the_licenses = ins_maven_poms.resolve(CName().gradle, the_dependencies)
+
+        self.assertEqual(['core', 'Apache License, Version 2.0'], the_licenses[('core', 'org/example')][0])
+        self.assertEqual(True, the_licenses[('core', 'org/example')][1].is_ok())
+        self.assertEqual(['io', 'Apache License, Version 2.0'], the_licenses[('io', 'org/example')][0])
+        self.assertEqual(['okio', 'The Apache Software License, MIT'], the_licenses[('okio', 'com/squareup/okio')][0])
+        self.assertNotIn(('unknown', 'org/example'), the_licenses)
+        self.assertNotIn(('other', ''), the_licenses)
+        # the last versions and their parent, read once
+        self.assertIn(('org.example', 'core', '1.10'), ins_maven_poms.the_poms)
+        self.assertNotIn(('org.example', 'core', '1.9'), ins_maven_poms.the_poms)
+        self.assertEqual(3, len([key for key in ins_maven_poms.the_poms.keys() if key[0] == 'org.example']))
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_maven_central_with_the_parents_read_once(self, mock_get):
+        the_texts = dict()
+        the_texts['https://repo1.maven.org/maven2/com/example/a/maven-metadata.xml'] = '<metadata><versioning><latest>2.0-rc</latest><release>1.0</release></versioning></metadata>'
+        the_texts['https://repo1.maven.org/maven2/com/example/b/maven-metadata.xml'] = '<metadata><versioning><release>1.1</release></versioning></metadata>'
+        the_texts['https://repo1.maven.org/maven2/com/example/a/1.0/a-1.0.pom'] = get_pom('com.example', 'a', '1.0', list(), self.parent)
+        the_texts['https://repo1.maven.org/maven2/com/example/b/1.1/b-1.1.pom'] = get_pom('com.example', 'b', '1.1', list(), ('com.example', 'parent', '1'))
+        the_texts['https://repo1.maven.org/maven2/com/example/parent/1/parent-1.pom'] = get_pom('com.example', 'parent', '1', list(), self.parent)
+
+        def get(url, **kwargs):
+            if url in the_texts.keys():
+                return get_response(200, the_texts[url])
+            return get_response(404, str())
+        mock_get.side_effect = get
+
+        # by 4 workers, each POM downloaded once
+        ins_maven_poms = CMavenPoms(CDownload(), self.path_maven, self.path_gradle, number_of_workers=4)
+        the_dependencies = [['a', 'com/example'], ['b', 'com/example'], ['c', 'com/example']]
+        the_licenses = ins_maven_poms.resolve(CName().gradle, the_dependencies)
+
+        self.assertEqual(['a', 'Apache License, Version 2.0'], the_licenses[('a', 'com/example')][0])
+        self.assertEqual(['b', 'Apache License, Version 2.0'], the_licenses[('b', 'com/example')][0])
+        self.assertNotIn(('c', 'com/example'), the_licenses)
+        # the parent of the cache is not downloaded
+        the_urls = [c[0][0] for c in mock_get.call_args_list]
+        self.assertEqual(6, len(the_urls))
+        self.assertEqual(len(the_urls), len(set(the_urls)))
+
+    def test_maven_central_only_if_asked(self):
+        ins_config = CConfig()
+        self.assertEqual('no', ins_config.maven_central)
+        ins_config.extract_data_from_ini_file(['search the licenses in the local installations = no', 'search the POMs in Maven Central = yes'])
+        self.assertEqual('yes', ins_config.maven_central)
+        self.assertEqual('no', ins_config.local_installations)
+
+    def test_other_platforms(self):
+        ins_maven_poms = CMavenPoms(None, self.path_maven, self.path_gradle)
+        self.assertEqual(dict(), ins_maven_poms.resolve(CName().roast, [['core', 'org/example']]))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import json
+import tempfile
+
+from sources.common import CName, CFilter
+from sources.dependency import CParsing
+from sources.search import CCocoaPodsSpecs
+
+
+PODFILE_LOCK = '''PODS:
+  - Alamofire (5.4.3)
+  - "Firebase/Core (8.0.0)":
+    - Firebase/CoreOnly
+    - FirebaseAnalytics (= 8.0.0)
+  - Firebase/CoreOnly (8.0.0):
+    - FirebaseCore (= 8.0.0)
+  - 'GoogleUtilities/Environment (7.4.1)'
+
+DEPENDENCIES:
+  - Alamofire (~> 5.4)
+  - Firebase/Core
+
+SPEC REPOS:
+  trunk:
+    - Alamofire
+
+PODFILE CHECKSUM: 1a2b3c
+
+COCOAPODS: 1.11.2
+'''
+
+
+class TestCocoaPods(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        specs = os.path.join(self.tmp.name, 'trunk', 'Specs')
+        self.write(os.path.join(specs, 'd', 'a', '2', 'Alamofire', '5.4.3'), 'Alamofire.podspec.json', json.dumps({'name': 'Alamofire', 'license': 'MIT'}))
+        self.write(os.path.join(specs, 'd', 'a', '2', 'Alamofire', '5.10.0'), 'Alamofire.podspec.json', json.dumps({'name': 'Alamofire', 'license': 'Other'}))
+        self.write(os.path.join(specs, '0', '3', '5', 'Firebase', '8.0.0'), 'Firebase.podspec.json', json.dumps({'license': {'type': 'Apache-2.0', 'file': 'LICENSE'}}))
+        # a private repository of podspecs in Ruby
+        private = os.path.join(self.tmp.name, 'private')
+        self.write(os.path.join(private, 'Internal', '1.0.0'), 'Internal.podspec', "s.license = { :type => 'Proprietary', :file => 'LICENSE' }\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, folder, filename, text):
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, filename), 'wt', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_podfile_lock(self):
+        the_lines = CFilter().clean(PODFILE_LOCK.split('\n'), CName().cocoapods_lock)
+        the_dependencies = CParsing().route(CName().cocoapods_lock, the_lines, None)
+        expected = [['Alamofire', '5.4.3'], ['Firebase', '8.0.0'], ['GoogleUtilities', '7.4.1']]
+        self.assertEqual(expected, the_dependencies)
+        self.assertEqual(CName().cocoapods_lock, CFilter().get_platform('Podfile.lock'))
+
+    def test_the_specs(self):
+        ins_specs = CCocoaPodsSpecs(self.tmp.name)
+        the_dependencies = [['Alamofire', '5.4.3'], ['Firebase', '8.0.0'], ['GoogleUtilities', '7.4.1']]
+        the_licenses = ins_specs.resolve(CName().cocoapods_lock, the_dependencies)
+
+        self.assertEqual(['MIT'], the_licenses[('Alamofire', '5.4.3')][0])
+        self.assertEqual(True, the_licenses[('Alamofire', '5.4.3')][1].is_ok())
+        self.assertEqual(['Apache-2.0'], the_licenses[('Firebase', '8.0.0')][0])
+        self.assertNotIn(('GoogleUtilities', '7.4.1'), the_licenses)
+
+    def test_the_specs_of_a_podfile(self):
+        # without version: the last one
+        ins_specs = CCocoaPodsSpecs(self.tmp.name)
+        the_dependencies = [['Alamofire'], ['Firebase/Core'], ['Internal']]
+        the_licenses = ins_specs.resolve(CName().cocoapods, the_dependencies)
+
+        self.assertEqual(['Other'], the_licenses[('Alamofire',)][0])
+        self.assertEqual(['Apache-2.0'], the_licenses[('Firebase/Core',)][0])
+        self.assertEqual(['Proprietary'], the_licenses[('Internal',)][0])
+        self.assertEqual(dict(), ins_specs.resolve(CName().swift, the_dependencies))
+
+    def test_the_folders_of_the_pods(self):
+        # the path of the pod is computed: a pod outside of its shard is not found
+        specs = os.path.join(self.tmp.name, 'trunk', 'Specs')
+        self.write(os.path.join(specs, '0', '0', '0', 'Lost', '1.0.0'), 'Lost.podspec.json', json.dumps({'license': 'MIT'}))
+        ins_specs = CCocoaPodsSpecs(self.tmp.name)
+        the_licenses = ins_specs.resolve(CName().cocoapods_lock, [['Lost', '1.0.0'], ['Alamofire', '5.4.3']])
+
+        self.assertEqual(['MIT'], the_licenses[('Alamofire', '5.4.3')][0])
+        self.assertNotIn(('Lost', '1.0.0'), the_licenses)
+        self.assertEqual(None, ins_specs.the_folders_by_module)
+
+    def test_the_duplicated_pods(self):
+        the_lines = ['PODS:', '  - Firebase/Core (8.0.0)', '  - Firebase/CoreOnly (8.0.0)', '  - Firebase/Analytics (8.1.0)']
+        the_dependencies = CParsing().route(CName().cocoapods_lock, the_lines, None)
+        self.assertEqual([['Firebase', '8.0.0'], ['Firebase', '8.1.0']], the_dependencies)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import json
+import tempfile
+
+from sources.common import CName, CFilter
+from sources.dependency import CParsing, CLockfiles, CJSONTokens
+from sources.search import CRateLimits
+
+
+PACKAGE_LOCK = {
+    'name': 'project', 'version': '1.0.0', 'lockfileVersion': 3,
+    'packages': {
+        '': {'name': 'project', 'version': '1.0.0', 'dependencies': {'express': '^4.0.0'}},
+        'node_modules/express': {'version': '4.18.2', 'license': 'MIT', 'dependencies': {'debug': '2.6.9'}},
+        'node_modules/express/node_modules/debug': {'version': '2.6.9', 'engines': {'node': '>=0.10'}},
+        'node_modules/@babel/core': {'version': '7.12.3', 'dev': True},
+        'node_modules/alias': {'name': 'real', 'version': '1.0.0'},
+        'node_modules/debug': {'version': '2.6.9'},
+        'packages/workspace': {'name': 'workspace', 'version': '0.0.1'}
+    }
+}
+
+PACKAGE_LOCK_V1 = {
+    'name': 'project', 'lockfileVersion': 1,
+    'dependencies': {
+        'express': {'version': '4.18.2', 'requires': {'debug': '2.6.9'}, 'dependencies': {'debug': {'version': '2.6.9'}}},
+        'other': {'version': 'npm:real@2.0.0'}
+    }
+}
+
+YARN_LOCK = '''# THIS IS AN AUTOGENERATED FILE. DO NOT EDIT THIS FILE DIRECTLY.
+# yarn lockfile v1
+
+
+"@babel/code-frame@^7.0.0", "@babel/code-frame@^7.10.4":
+  version "7.12.13"
+  resolved "https://registry.yarnpkg.com/@babel/code-frame/-/code-frame-7.12.13.tgz"
+  dependencies:
+    "@babel/highlight" "^7.12.13"
+
+debug@2.6.9, debug@^2.6.0:
+  version "2.6.9"
+
+debug@^4.0.0:
+  version "4.3.1"
+'''
+
+YARN_BERRY_LOCK = '''__metadata:
+  version: 6
+  cacheKey: 8
+
+"debug@npm:^4.0.0":
+  version: 4.3.1
+  resolution: "debug@npm:4.3.1"
+
+"project@workspace:.":
+  version: 0.0.0-use.local
+'''
+
+PNPM_LOCK_9 = '''lockfileVersion: '9.0'
+
+importers:
+  .:
+    dependencies:
+      debug:
+        specifier: ^4.0.0
+        version: 4.3.1
+
+packages:
+  '@babel/core@7.12.3':
+    resolution: {integrity: sha512-x}
+  debug@4.3.1:
+    resolution: {integrity: sha512-y}
+
+snapshots:
+  '@babel/core@7.12.3(supports-color@8.1.1)':
+    dependencies:
+      debug: 4.3.1
+  debug@4.3.1: {}
+'''
+
+PNPM_LOCK_5 = '''lockfileVersion: 5.4
+
+packages:
+
+  /@babel/core/7.12.3_supports-color@8.1.1:
+    resolution: {integrity: sha512-x}
+  /debug/4.3.1:
+    dev: false
+  github.com/owner/repo/abc:
+    name: repo
+'''
+
+
+class TestLockfiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, filename, text):
+        file = os.path.join(self.tmp.name, filename)
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return file
+
+    def test_package_lock(self):
+        file = self.write('package-lock.json', json.dumps(PACKAGE_LOCK, indent=2))
+        expected = [['express', '4.18.2'], ['debug', '2.6.9'], ['@babel/core', '7.12.3'], ['real', '1.0.0']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().package_lock, [file]))
+
+        file = self.write('package-lock.json', json.dumps(PACKAGE_LOCK_V1))
+        expected = [['debug', '2.6.9'], ['express', '4.18.2'], ['real', '2.0.0']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().package_lock, [file]))
+
+    def test_json_by_small_parts(self):
+        file = self.write('package-lock.json', json.dumps(PACKAGE_LOCK, indent=1) + '\n')
+        the_tokens = list(CJSONTokens().get(file))
+        for size in [1, 2, 3, 7]:
+            self.assertEqual(the_tokens, list(CJSONTokens(size).get(file)))
+        self.assertEqual(['{', '"name"', ':', '"project"', ','], the_tokens[:5])
+        self.assertIn('true', the_tokens)
+
+    def test_yarn_lock(self):
+        file = self.write('yarn.lock', YARN_LOCK)
+        expected = [['@babel/code-frame', '7.12.13'], ['debug', '2.6.9'], ['debug', '4.3.1']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().yarn_lock, [file]))
+
+        file = self.write('yarn.lock', YARN_BERRY_LOCK)
+        self.assertEqual([['debug', '4.3.1']], CLockfiles().get_the_dependencies(CName().yarn_lock, [file]))
+
+    def test_pnpm_lock(self):
+        file_9 = self.write('pnpm-lock-9.yaml', PNPM_LOCK_9)
+        file_5 = self.write('pnpm-lock-5.yaml', PNPM_LOCK_5)
+        expected = [['@babel/core', '7.12.3'], ['debug', '4.3.1']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().pnpm_lock, [file_9]))
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().pnpm_lock, [file_5, file_9]))
+
+    def test_the_platforms(self):
+        ins_filter = CFilter()
+        self.assertEqual(CName().yarn_lock, ins_filter.get_platform('yarn.lock'))
+        self.assertEqual(CName().package_json, ins_filter.get_platform('package.json'))
+        self.assertEqual(CName().package_lock, ins_filter.get_platform('package-lock.json'))
+        the_urls = ins_filter.get_the_URLs_by_name(CName())
+        self.assertEqual(the_urls[CName().package_json], the_urls[CName().pnpm_lock])
+
+        # the files are given to the parser of the lockfiles
+        file = self.write('yarn.lock', YARN_LOCK)
+        self.assertEqual(3, len(CParsing().route(CName().yarn_lock, [file], None)))
+
+        # the same limits as package.json
+        ins_rate_limits = CRateLimits(1, dict(), 0, {CName().package_json: 0.4})
+        self.assertIs(ins_rate_limits.get(CName().package_json), ins_rate_limits.get(CName().yarn_lock))
+        self.assertEqual(0.4, ins_rate_limits.get(CName().package_lock).rate)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+from sources.common import CName, CFilter
+from sources.dependency import CParsing, CLockfiles
+from sources.dependency import lockfiles
+from sources.search import CGitHub
+
+
+CARGO_LOCK = '''# This file is automatically @generated by Cargo.
+# It is not intended for manual editing.
+version = 3
+
+[[package]]
+name = "project"
+version = "0.1.0"
+dependencies = [
+ "serde",
+]
+
+[[package]]
+name = "serde"
+version = "1.0.193"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+checksum = "25dd9975e68d0cb5aa1120c288333fc98731bd1dd12f561e468ea4728c042b89"
+
+[[package]]
+name = "syn"
+version = "1.0.109"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "syn"
+version = "2.0.39"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[metadata]
+"checksum x" = "y"
+'''
+
+GO_MOD = '''module example.com/project
+
+go 1.21
+
+require github.com/pkg/errors v0.9.1
+
+require (
+	golang.org/x/text v0.14.0
+	github.com/old/module v1.0.0
+	github.com/local/module v1.2.0
+	github.com/indirect/module v1.0.0 // indirect
+)
+
+exclude golang.org/x/net v0.1.0
+
+replace github.com/old/module => github.com/new/module v1.1.0
+
+replace github.com/local/module v1.2.0 => ../module
+'''
+
+GO_SUM = '''github.com/pkg/errors v0.9.1 h1:FEBLx1zS214owpjy7qsBeixbURkuhQAwrK5UwLGTwt4=
+github.com/pkg/errors v0.9.1/go.mod h1:bwawxfHBFNV+L2hUp1rHADufV3IMtnDRdf1r5NINEl0=
+golang.org/x/text v0.13.0/go.mod h1:TvPlkZtksWOMsz7fbANvkp4WM8x/WCo/om8BMLbz+aE=
+golang.org/x/text v0.14.0 h1:ScX5w1eTa3QqT8oi6+ziP7dTV1S2+ALU0bI+0zXKWiQ=
+golang.org/x/text v0.14.0 h1:ScX5w1eTa3QqT8oi6+ziP7dTV1S2+ALU0bI+0zXKWiQ=
+'''
+
+
+class TestCargoAndGo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, filename, text):
+        file = os.path.join(self.tmp.name, filename)
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return file
+
+    def test_cargo_lock(self):
+        file = self.write('Cargo.lock', CARGO_LOCK)
+        # the crate of the project has no source
+        expected = [['serde', '1.0.193'], ['syn', '1.0.109'], ['syn', '2.0.39']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().roast, [file]))
+
+        # without tomllib (python < 3.11)
+        with mock.patch.object(lockfiles, 'tomllib', None):
+            self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().roast, [file]))
+
+    def test_go_mod(self):
+        file = self.write('go.mod', GO_MOD)
+        expected = [['github.com/pkg/errors', 'v0.9.1'], ['golang.org/x/text', 'v0.14.0'],
+                    ['github.com/new/module', 'v1.1.0'], ['github.com/local/module', 'v1.2.0']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().go, [file]))
+        self.assertEqual(expected, CParsing().route(CName().go, [file], None))
+
+    def test_go_sum(self):
+        file = self.write('go.sum', GO_SUM)
+        expected = [['github.com/pkg/errors', 'v0.9.1'], ['golang.org/x/text', 'v0.14.0']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().go_sum, [file]))
+
+        self.assertEqual(CName().go_sum, CFilter().get_platform('go.sum'))
+        self.assertEqual(('pkg', 'errors'), CGitHub().get_repository(CName().go_sum, expected[0]))
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import json
+import tempfile
+from unittest import mock
+
+from sources.common import CName, CFilter, CFile, CErrorResult
+from sources.configuration import CConfig
+from sources.dependency import CLockfiles, CDependencies
+from sources.dependency import lockfiles
+from sources.search import CMavenPoms
+
+
+PACKAGE_RESOLVED_V1 = {
+    'object': {'pins': [
+        {'package': 'Alamofire', 'repositoryURL': 'https://github.com/Alamofire/Alamofire.git',
+         'state': {'branch': None, 'revision': 'abc', 'version': '5.4.3'}},
+        {'package': 'Private', 'repositoryURL': 'https://gitlab.com/owner/private.git',
+         'state': {'branch': None, 'revision': 'def', 'version': '1.0.0'}}
+    ]},
+    'version': 1
+}
+
+PACKAGE_RESOLVED_V2 = {
+    'pins': [
+        {'identity': 'swift-log', 'kind': 'remoteSourceControl', 'location': 'https://github.com/apple/swift-log.git',
+         'state': {'revision': '123', 'version': '1.5.3'}},
+        {'identity': 'swift-nio', 'kind': 'remoteSourceControl', 'location': 'https://github.com/apple/swift-nio.git',
+         'state': {'branch': 'main', 'revision': '456'}}
+    ],
+    'version': 2
+}
+
+PUBSPEC_LOCK = '''# Generated by pub
+# See https://dart.dev/tools/pub/glossary#lockfile
+packages:
+  async:
+    dependency: transitive
+    description:
+      name: async
+      sha256: "947bfcf187f74dbc5e146c9eb9c0f10c9f8b30743e341481c1e2ed3ecc18c20c"
+      url: "https://pub.dev"
+    source: hosted
+    version: "2.11.0"
+  flutter:
+    dependency: "direct main"
+    description: flutter
+    source: sdk
+    version: "0.0.0"
+  http:
+    dependency: "direct main"
+    description:
+      name: http
+      url: "https://pub.dartlang.org"
+    source: hosted
+    version: "0.13.6"
+  internal:
+    dependency: "direct main"
+    description:
+      name: internal
+      url: "https://pub.example.com"
+    source: hosted
+    version: "1.0.0"
+  local:
+    dependency: "direct main"
+    description:
+      path: "../local"
+      relative: true
+    source: path
+    version: "1.0.0"
+sdks:
+  dart: ">=3.0.0 <4.0.0"
+'''
+
+GRADLE_LOCKFILE = '''# This is a Gradle generated file for dependency locking.
+# Manual edits can break the build and are not advised.
+# This file is expected to be part of source control.
+com.google.code.gson:gson:2.10.1=compileClasspath,runtimeClasspath
+org.jetbrains.kotlin:kotlin-stdlib:1.9.0=compileClasspath
+com.google.code.gson:gson:2.10.1=testCompileClasspath
+empty=annotationProcessor
+'''
+
+VERSION_CATALOG = '''[versions]
+groovy = "3.0.5"
+checkstyle = { strictly = "8.37" }
+
+[libraries]
+groovy-core = { module = "org.codehaus.groovy:groovy", version.ref = "groovy" }
+groovy-json = { group = "org.codehaus.groovy", name = "groovy-json", version = { ref = "groovy" } }
+commons-lang3 = "org.apache.commons:commons-lang3:3.12.0"
+checkstyle = { module = "com.puppycrawl.tools:checkstyle", version.ref = "checkstyle" }
+okhttp-bom = { module = "com.squareup.okhttp3:okhttp-bom" }
+
+[bundles]
+groovy = ["groovy-core", "groovy-json"]
+
+[plugins]
+versions = { id = "com.github.ben-manes.versions", version = "0.45.0" }
+'''
+
+
+class TestSwiftFlutterGradleLockfiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, filename, text):
+        file = os.path.join(self.tmp.name, filename)
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return file
+
+    def test_package_resolved(self):
+        file_1 = self.write('Package-1.resolved', json.dumps(PACKAGE_RESOLVED_V1))
+        file_2 = self.write('Package-2.resolved', json.dumps(PACKAGE_RESOLVED_V2))
+        expected = [['https://github.com/Alamofire/Alamofire.git', '5.4.3'],
+                    ['https://github.com/apple/swift-log.git', '1.5.3'], ['https://github.com/apple/swift-nio.git', '456']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().swift_resolved, [file_1, file_2]))
+
+    def test_pubspec_lock(self):
+        file = self.write('pubspec.lock', PUBSPEC_LOCK)
+        expected = [['async', '2.11.0'], ['http', '0.13.6']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().flutter_lock, [file]))
+
+    def test_gradle_lockfile(self):
+        file = self.write('gradle.lockfile', GRADLE_LOCKFILE)
+        expected = [['gson', 'com/google/code/gson', '2.10.1'], ['kotlin-stdlib', 'org/jetbrains/kotlin', '1.9.0']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().gradle_lock, [file]))
+
+        # not build.gradle
+        self.assertEqual(CName().gradle_lock, CFilter().get_platform('gradle.lockfile'))
+        self.assertEqual(CName().gradle, CFilter().get_platform('build.gradle.kts'))
+
+    def test_errors_of_the_lockfiles(self):
+        # the errors file read again: the dependencies with their version, without the notes
+        file = self.write('gradle.lockfile', GRADLE_LOCKFILE)
+        the_dependencies = CLockfiles().get_the_dependencies(CName().gradle_lock, [file])
+        the_errors = [CErrorResult(the_dependencies[0], '404'), CErrorResult(the_dependencies[1], None, [CErrorResult.prefix_of_the_successive_errors + '1'])]
+        ins_config = CConfig()
+        ins_config.path_errors = self.tmp.name
+        CFile().save_the_errors({CName().gradle_lock: the_errors}, ins_config)
+
+        the_lines = CFile().read_text_file(self.tmp.name, 'errors_' + CName().gradle_lock + '.txt')
+        self.assertIn('error code = 404 : gson : com/google/code/gson : 2.10.1', the_lines)
+        the_dependencies_on_error = CDependencies().get_the_data_on_error({CName().gradle_lock: the_lines})
+        self.assertEqual({CName().gradle_lock: the_dependencies}, the_dependencies_on_error)
+        the_duplicated = CDependencies().get_the_duplicated(the_dependencies_on_error, {CName().gradle_lock: the_dependencies + [['guava', 'com/google/guava', '31.1-jre']]})
+        self.assertEqual({CName().gradle_lock: the_dependencies}, the_duplicated)
+
+    def test_version_catalog(self):
+        file = self.write('libs.versions.toml', VERSION_CATALOG)
+        expected = [['groovy', 'org/codehaus/groovy', '3.0.5'], ['groovy-json', 'org/codehaus/groovy', '3.0.5'],
+                    ['commons-lang3', 'org/apache/commons', '3.12.0'], ['checkstyle', 'com/puppycrawl/tools', '8.37'],
+                    ['okhttp-bom', 'com/squareup/okhttp3']]
+        self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().gradle_catalog, [file]))
+
+        # without tomllib (python < 3.11)
+        with mock.patch.object(lockfiles, 'tomllib', None):
+            self.assertEqual(expected, CLockfiles().get_the_dependencies(CName().gradle_catalog, [file]))
+
+    def test_exact_version_of_the_pom(self):
+        ins_maven_poms = CMavenPoms(None, self.tmp.name)
+        for version in ['2.9.0', '2.10.1']:
+            folder = os.path.join(self.tmp.name, 'com', 'google', 'code', 'gson', 'gson', version)
+            os.makedirs(folder)
+            self.write(os.path.join(folder, 'gson-' + version + '.pom'),
+                       '<project><name>Gson ' + version + '</name><licenses><license><name>Apache-2.0</name></license></licenses></project>')
+
+        dependency = ['gson', 'com/google/code/gson', '2.9.0']
+        the_licenses = ins_maven_poms.resolve(CName().gradle_lock, [dependency])
+        self.assertEqual(['Gson 2.9.0', 'Apache-2.0'], the_licenses[tuple(dependency)][0])
+
+        # a version not in the caches: not another version, the dependency is downloaded as usual
+        dependency = ['gson', 'com/google/code/gson', '3.0.0']
+        self.assertEqual(dict(), ins_maven_poms.resolve(CName().gradle_catalog, [dependency]))
+        # without version (build.gradle): the last one
+        dependency = ['gson', 'com/google/code/gson']
+        the_licenses = ins_maven_poms.resolve(CName().gradle, [dependency])
+        self.assertEqual(['Gson 2.10.1', 'Apache-2.0'], the_licenses[tuple(dependency)][0])
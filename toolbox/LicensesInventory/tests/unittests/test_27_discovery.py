@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+from sources.common import CFile, CFilter, CGitIgnore, CIgnoredFolders, CName
+from sources.configuration import CConfig
+from sources.dependency import CParsing
+
+
+class TestDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative_file, text=str()):
+        file = os.path.join(self.path, *relative_file.split('/'))
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return file
+
+    def test_gitignore(self):
+        ins_gitignore = CGitIgnore(self.path, ['# comment', '', 'dist/', '/out', '*.log', '!keep.log', 'docs/**/generated', 'a?c'])
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'sub', 'dist'), True))
+        self.assertEqual(None, ins_gitignore.is_ignored(os.path.join(self.path, 'sub', 'dist'), False))
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'out'), True))
+        self.assertEqual(None, ins_gitignore.is_ignored(os.path.join(self.path, 'sub', 'out'), True))
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'sub', 'error.log'), False))
+        self.assertEqual(False, ins_gitignore.is_ignored(os.path.join(self.path, 'keep.log'), False))
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'docs', 'generated'), True))
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'docs', 'x', 'y', 'generated'), True))
+        self.assertEqual(True, ins_gitignore.is_ignored(os.path.join(self.path, 'abc'), True))
+
+    def test_one_walk(self):
+        self.write('package.json')
+        self.write('go.mod')
+        self.write('app/build.gradle')
+        self.write('app/build/package.json')
+        self.write('web/package.json')
+        self.write('web/node_modules/debug/package.json')
+        self.write('.git/package.json')
+        self.write('vendor/go.mod')
+        self.write('.gitignore', 'generated/\n/web/old\ngo.mod\n')
+        self.write('generated/package.json')
+        self.write('web/old/package.json')
+        self.write('web/.gitignore', '*.json\n')
+
+        the_filenames = ['build.gradle', 'package.json', 'go.mod']
+        the_scanned_folders = list()
+        scandir = os.scandir
+        def count(folder):
+            the_scanned_folders.append(folder)
+            return scandir(folder)
+
+        ins_ignored_folders = CIgnoredFolders(CConfig().the_ignored_folders, True)
+        with mock.patch('os.scandir', side_effect=count):
+            the_files = CFile().find_the_files(self.path, the_filenames, ins_ignored_folders)
+        expected = [os.path.join(self.path, 'app', 'build.gradle'), os.path.join(self.path, 'package.json'),
+                    os.path.join(self.path, 'web', 'package.json'), os.path.join(self.path, 'go.mod')]
+        # the filenames of the configuration ignored by a .gitignore file are kept: go.mod, web/package.json
+        self.assertEqual(expected, the_files)
+        # each folder once, without the ignored ones
+        self.assertEqual(sorted(set(the_scanned_folders)), sorted(the_scanned_folders))
+        self.assertEqual(3, len(the_scanned_folders))
+
+        # without the .gitignore files and the globs
+        the_files = CFile().find_the_files(self.path, ['package.json'], CIgnoredFolders(['node_modules', 'app/build']))
+        self.assertEqual(5, len(the_files))
+        self.assertNotIn(os.path.join(self.path, 'app', 'build', 'package.json'), the_files)
+
+    def test_read_by_threads(self):
+        for i in range(0, 8):
+            self.write('p' + str(i) + '/Podfile', "pod 'A" + str(i) + "'\n")
+        self.write('p0/yarn.lock')
+
+        ins_config = CConfig()
+        ins_config.path_dependencies = self.path
+        ins_config.the_filenames = ['Podfile', 'yarn.lock']
+        ins_config.number_of_threads_to_read_the_files = 4
+        ins_filter = CFilter()
+        ins_filter.ins_config = ins_config
+
+        result = ins_filter.get_content_by_name(CName())
+        self.assertEqual([os.path.join(self.path, 'p' + str(i), 'Podfile') for i in range(0, 8)], result[CName().cocoapods])
+        self.assertEqual([os.path.join(self.path, 'p0', 'yarn.lock')], result[CName().yarn_lock])
+
+        ins_filter.the_heads = ins_filter.get_the_heads_by_name(CName())
+        ins_filter.the_foot = ins_filter.get_the_foot_by_name(CName())
+        the_dependencies = CParsing().get_the_dependencies_of_the_manifests(CName().cocoapods, result[CName().cocoapods], ins_filter)
+        self.assertEqual([['A' + str(i)] for i in range(0, 8)], the_dependencies)
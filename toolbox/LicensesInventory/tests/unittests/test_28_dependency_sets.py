@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch
+import time
+
+from sources.common import CName
+from sources.dependency import CDependencies, CDependencySet
+from sources.search import CSearch
+from sources.search.downloads import CDownloadResult
+
+
+class TestDependencySets(unittest.TestCase):
+
+    def test_the_keys(self):
+        ins_dependency_set = CDependencySet(CName().swift)
+        self.assertEqual(True, ins_dependency_set.add(['https://github.com/Owner/Repo.git']))
+        self.assertEqual(False, ins_dependency_set.add(['https://github.com/owner/repo/']))
+        self.assertEqual(True, ins_dependency_set.contains(['https://github.com/owner/repo']))
+        self.assertEqual([['https://github.com/Owner/Repo.git']], ins_dependency_set.get_the_dependencies())
+
+        # the same key for Package.resolved, not for the others
+        self.assertEqual(('https://github.com/a/b', '1.0.0'), CDependencySet(CName().swift_resolved).get_key(['https://github.com/a/b.git', '1.0.0']))
+        self.assertEqual(('Debug',), CDependencySet(CName().package_json).get_key([' Debug ']))
+
+    def test_delete_the_duplicated(self):
+        the_dependencies = [['a'], ['b', 'n'], ['a'], ['c'], ['b', 'n'], ['b', 'm']]
+        result = CDependencies().delete_the_duplicated({CName().gradle: the_dependencies})
+        # the last ones, as before
+        self.assertEqual({CName().gradle: [['a'], ['c'], ['b', 'n'], ['b', 'm']]}, result)
+
+    def test_get_the_duplicated(self):
+        the_new_dependencies = {CName().package_json: [['a'], ['b'], ['c']], CName().roast: [['x']]}
+        the_dependencies_on_error = {CName().package_json: [['c'], ['a'], ['d']], CName().go: [['x']]}
+        result = CDependencies().get_the_duplicated(the_dependencies_on_error, the_new_dependencies)
+        self.assertEqual({CName().package_json: [['a'], ['c']]}, result)
+
+    def test_get_the_duplicated_in_a_registry(self):
+        # the lockfiles and the package.json files share the registry of npm
+        the_new_dependencies = {CName().yarn_lock: [['a', '1.0.0'], ['b', '2.0.0']], CName().package_json: [['a']]}
+        the_dependencies_on_error = {CName().package_lock: [['a', '1.0.0']], CName().package_json: [['a']]}
+        result = CDependencies().get_the_duplicated(the_dependencies_on_error, the_new_dependencies)
+        self.assertEqual({CName().yarn_lock: [['a', '1.0.0']], CName().package_json: [['a']]}, result)
+
+    def test_downloaded_once_by_registry(self):
+        the_downloads = list()
+
+        def download_for_others(ins_search, platform, dependency):
+            the_downloads.append(list(dependency))
+            result = CDownloadResult('200', None, None, None, 0, 0, None)
+            return (None, ['MIT'], result)
+
+        the_dependencies_by_platform = dict()
+        the_dependencies_by_platform[CName().package_json] = [['lodash'], ['express']]
+        the_dependencies_by_platform[CName().package_lock] = [['lodash', '4.17.21'], ['debug', '4.3.1']]
+        the_dependencies_by_platform[CName().yarn_lock] = [['debug', '4.3.1']]
+        the_dependencies_by_platform[CName().roast] = [['debug', '4.3.1']]
+
+        ins_search = CSearch()
+        with patch.object(CSearch, 'download_for_others', download_for_others):
+            for platform in ins_search.get_the_platforms_by_registry(the_dependencies_by_platform):
+                the_licenses, the_errors = ins_search.extract_the_licenses(platform, the_dependencies_by_platform[platform], 10)
+                self.assertEqual(len(the_dependencies_by_platform[platform]), len(the_licenses))
+
+        # package.json takes the license of the locked version, yarn.lock the one of package-lock.json,
+        # and Cargo.lock is another registry
+        self.assertEqual([['lodash', '4.17.21'], ['debug', '4.3.1'], ['express'], ['debug', '4.3.1']], the_downloads)
+
+    def test_many_dependencies(self):
+        the_dependencies = [['package-' + str(i % 15000), str(i % 15000 % 7)] for i in range(0, 20000)]
+        start = time.time()
+        result = CDependencies().delete_the_duplicated({CName().package_lock: the_dependencies})
+        the_duplicated = CDependencies().get_the_duplicated(result, {CName().package_lock: the_dependencies})
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(len(set([tuple(d) for d in the_dependencies])), len(result[CName().package_lock]))
+        self.assertEqual(20000, len(the_duplicated[CName().package_lock]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch
+import pickle
+
+from sources.common import CName, CFile, CRecord, CDependency, CLicenseResult, CErrorResult
+from sources.dependency import CParsing
+from sources.search import CSearch, CDownloadResult
+
+
+def search_the_license(self, platform, dependency):
+    if dependency[0].find('error') == 0:
+        return (list(), CDownloadResult('404', None, None, None, 0, 0, None))
+    return (['MIT'], CDownloadResult('200', None, None, b'', 0, 0, None))
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_the_records(self):
+        dependency = CDependency(['c', 'n/s'])
+        self.assertEqual(['c', 'n/s'], dependency)
+        self.assertEqual(dependency, ['c', 'n/s'])
+        self.assertNotEqual(dependency, ['c'])
+        self.assertEqual('c', dependency.get_component())
+        self.assertEqual(hash(('c', 'n/s')), hash(dependency))
+        self.assertEqual(1, {('c', 'n/s'): 1}[dependency])
+        self.assertEqual("['c', 'n/s']", repr(dependency))
+        with self.assertRaises(AttributeError):
+            dependency.component = 'd'
+        with self.assertRaises(AttributeError):
+            dependency.__dict__
+
+        the_licenses = [CLicenseResult(CDependency(['c' + str(i)]), ['Apache-' + '2.0']) for i in range(0, 2)]
+        self.assertEqual(['c0', 'Apache-2.0'], the_licenses[0])
+        # the licenses are stored once
+        self.assertIs(the_licenses[0][1], the_licenses[1][1])
+
+        error = CErrorResult(dependency, '404', ['note'])
+        self.assertEqual(['error code = 404', 'c', 'n/s', 'note'], error)
+        self.assertEqual(error, pickle.loads(pickle.dumps(error)))
+        self.assertIs(CErrorResult, type(pickle.loads(pickle.dumps(error))))
+
+    def test_the_parsers_give_records(self):
+        the_dependencies = CParsing().route(CName().cocoapods, ["pod 'A'", "pod 'B', '1.0'"], None)
+        self.assertEqual([['A'], ['B']], the_dependencies)
+        self.assertIs(CDependency, type(the_dependencies[0]))
+
+    @patch.object(CSearch, 'search_the_license', search_the_license)
+    def test_the_results(self):
+        the_dependencies = [['c_a'], ['error_b'], ['error_c'], ['c_d']]
+        the_licenses, the_errors = CSearch().extract_the_licenses(CName().package_json, the_dependencies, 2)
+        self.assertEqual([CLicenseResult(['c_a'], ['MIT'])], the_licenses)
+        self.assertEqual(['error code = 404', 'c_d', 'successive authorized errors at 2'], the_errors[2])
+        self.assertIs(CErrorResult, type(the_errors[2]))
+        # the dependencies are not changed
+        self.assertEqual([['c_a'], ['error_b'], ['error_c'], ['c_d']], the_dependencies)
+
+        the_lines = CFile().get_the_lines_from_the_new_licenses(the_licenses + [CRecord(['c_e', str()])])
+        self.assertEqual(['c_a : MIT', 'c_e : None'], the_lines)
+        self.assertEqual(['error code = 404 : error_b'], CFile().manage_new_lines(the_errors[:1]))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+
+import unittest
+import types
+
+from sources.common import CComment, CFilter, CName
+
+
+class TestComments(unittest.TestCase):
+
+    def test_gradle(self):
+        the_lines = [
+            '// the dependencies',
+            'dependencies {',
+            '    implementation "com.squareup.okhttp3:okhttp:4.12.0" // the client',
+            '    /* the tests',
+            '       testImplementation "junit:junit:4.13.2" */',
+            '    api "org.example:lib:1.0" /* kept */ // deleted',
+            '    implementation "https://example.com/#not-a-comment"',
+            '',
+            '}']
+        result = CComment().delete(the_lines, CName().gradle)
+        expected = [
+            'dependencies {',
+            '    implementation "com.squareup.okhttp3:okhttp:4.12.0"',
+            '    api "org.example:lib:1.0"',
+            '    implementation "https://example.com/#not-a-comment"',
+            '',
+            '}']
+        self.assertEqual(expected, result)
+
+    def test_swift(self):
+        the_lines = [
+            '.package(url: "https://github.com/apple/swift-log.git", from: "1.5.0"), // the logs',
+            '/* .package(url: "https://github.com/old/old.git", from: "1.0.0"), */',
+            '.package(url: "https://github.com/a/b.git", /* the version */ exact: "2.0.0"),']
+        result = CComment().delete(the_lines, CName().swift)
+        expected = [
+            '.package(url: "https://github.com/apple/swift-log.git", from: "1.5.0"),',
+            '.package(url: "https://github.com/a/b.git",   exact: "2.0.0"),']
+        self.assertEqual(expected, result)
+
+    def test_yaml_and_ruby(self):
+        the_lines = ['# the dependencies', 'dependencies:', '  http: ^1.2.0 # the client', '  url: https://host/page#anchor', '  name: "a # b"']
+        result = CComment().delete(the_lines, CName().flutter)
+        self.assertEqual(['dependencies:', '  http: ^1.2.0', '  url: https://host/page#anchor', '  name: "a # b"'], result)
+
+        result = CComment().delete(['pod \'Alamofire\', \'~> 5.0\' # the network', '# pod \'Old\''], CName().cocoapods)
+        self.assertEqual(['pod \'Alamofire\', \'~> 5.0\''], result)
+
+    def test_strings_read_by_the_whole_pattern(self):
+        # a \, both quotes, a string not closed, a / or a # in the code: the fast pattern stops before the comment
+        the_lines = ['a "x\\"//y" // c', 'b \'it"s //\' // c', 'c "https://x" / 2 // d', 'd "not closed // e', 'e /* f */ g // h']
+        expected = ['a "x\\"//y"', 'b \'it"s //\'', 'c "https://x" / 2', 'd "not closed // e', 'e   g']
+        self.assertEqual(expected, CComment().delete(the_lines, CName().gradle))
+        the_lines = ['url: https://host/page#anchor # comment', 'name: \'a#b\' # c', 'key: "x\\"#" # d']
+        expected = ['url: https://host/page#anchor', 'name: \'a#b\'', 'key: "x\\"#"']
+        self.assertEqual(expected, CComment().delete(the_lines, CName().flutter))
+
+    def test_without_comments(self):
+        # JSON has no comments: the lines are not read by the tokenizer
+        the_lines = ['{', '  "url": "https://example.com", "a": "// b # c /* d */"', '}']
+        self.assertEqual(the_lines, CComment().delete(the_lines, CName().package_json))
+
+    def test_lazily(self):
+        def get_the_lines():
+            yield '// a comment'
+            yield 'a line'
+            raise Exception('too many lines read')
+
+        result = CComment().get_the_lines(get_the_lines(), CName().gradle)
+        self.assertTrue(isinstance(result, types.GeneratorType))
+        self.assertEqual('a line', next(result))
+
+    def test_clean(self):
+        the_lines = ['implementation \'a:b:1.0\' // comment', '// deleted']
+        self.assertEqual(['implementation "a:b:1.0"'], CFilter().clean(the_lines, CName().gradle))
+        # the errors files: the URLs are not comments
+        the_lines = ['error code = 404 : https://github.com/a/b']
+        self.assertEqual(the_lines, CFilter().clean(the_lines, CName().swift, False))
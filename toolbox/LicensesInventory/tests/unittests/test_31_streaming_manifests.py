@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+
+import unittest
+import os
+import tempfile
+import tracemalloc
+import types
+
+from sources.common import CFile, CFilter, CName
+from sources.configuration import CConfig
+from sources.dependency import CDependencies, CParsing
+
+
+class TestStreamingManifests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative_file, text):
+        file = os.path.join(self.path, *relative_file.split('/'))
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return file
+
+    def get_filter(self, the_filenames):
+        ins_config = CConfig()
+        ins_config.path_dependencies = self.path
+        ins_config.the_filenames = the_filenames
+        ins_filter = CFilter()
+        ins_filter.ins_config = ins_config
+        ins_filter.the_heads = ins_filter.get_the_heads_by_name(CName())
+        ins_filter.the_foot = ins_filter.get_the_foot_by_name(CName())
+        return ins_filter
+
+    def test_read_the_lines(self):
+        for text in [str(), 'a', 'a\n', 'a\n\nb\n\n', 'a\r\nb']:
+            file = self.write('file.txt', text)
+            result = CFile().read_the_lines(self.path, 'file.txt')
+            self.assertTrue(isinstance(result, types.GeneratorType))
+            self.assertEqual(CFile().read_text_file(self.path, 'file.txt'), list(result), repr(text))
+
+    def test_lines_of_a_file(self):
+        file = self.write('app/build.gradle', "plugins {\n  id 'java'\n}\n// the libraries\ndependencies {\n  implementation 'a:b:1.0' // b\n}\n")
+        ins_filter = self.get_filter(['build.gradle'])
+        result = ins_filter.get_the_lines_of_the_file(file, CName().gradle)
+        self.assertTrue(isinstance(result, types.GeneratorType))
+        self.assertEqual(['  implementation "a:b:1.0"'], list(result))
+
+    def test_file_by_file(self):
+        # a block not closed in a file does not take the lines of the next file
+        self.write('a/build.gradle', "dependencies {\n  implementation 'g:a:1.0'\n")
+        self.write('b/build.gradle', "implementation 'g:ignored:1.0'\ndependencies {\n  implementation 'g:b:1.0'\n}\n")
+        self.write('c/build.gradle', "\n\n")
+        ins_filter = self.get_filter(['build.gradle'])
+
+        the_files_by_platform = ins_filter.get_content_by_name(CName())
+        self.assertEqual(3, len(the_files_by_platform[CName().gradle]))
+        result = CDependencies().get_the_data(ins_filter, the_files_by_platform)
+        self.assertEqual({CName().gradle: [['a', 'g'], ['b', 'g']]}, result)
+
+        # the files without dependencies give no platform
+        self.assertEqual(dict(), CDependencies().get_the_data(ins_filter, {CName().gradle: [os.path.join(self.path, 'c', 'build.gradle')]}))
+
+    def test_memory_by_file(self):
+        number_of_files = 20
+        for i in range(0, number_of_files):
+            the_lines = ['dependencies {'] + ['  implementation "g' + str(i) + ':a' + str(j) + ':1.0" // a comment to delete ' + str(j) for j in range(0, 500)] + ['}']
+            self.write('m' + str(i) + '/build.gradle', '\n'.join(the_lines) + '\n')
+        ins_filter = self.get_filter(['build.gradle'])
+        the_files = ins_filter.get_content_by_name(CName())[CName().gradle]
+
+        tracemalloc.start()
+        try:
+            # as before: the lines of all the files in one list
+            the_lines = list()
+            for file in the_files:
+                the_lines += ins_filter.clean(CFile().read_text_file(os.path.split(file)[0], 'build.gradle'), CName().gradle)
+            size_of_the_files = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del the_lines
+
+        tracemalloc.start()
+        try:
+            the_dependencies = CParsing().get_the_dependencies_of_the_manifests(CName().gradle, the_files, ins_filter)
+            size_of_the_dependencies, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(number_of_files * 500, len(the_dependencies))
+        # besides the dependencies, the lines of one file at a time
+        self.assertLess(peak - size_of_the_dependencies, size_of_the_files / 4)
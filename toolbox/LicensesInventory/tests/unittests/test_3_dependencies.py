@@ -68,8 +68,8 @@ class TestDependencies(unittest.TestCase):
         the_expected_maxis_by_platform = dict()
         the_expected_maxis_by_platform[ins_name.gradle] = 10
         the_expected_maxis_by_platform[ins_name.package_json] = 6
-        the_expected_maxis_by_platform[ins_name.roast] = 5
-        the_expected_maxis_by_platform[ins_name.go] = 5
+        the_expected_maxis_by_platform[ins_name.roast] = 5 # without the crate of the project: no source
+        the_expected_maxis_by_platform[ins_name.go] = 5 # without the indirect dependency
         the_expected_maxis_by_platform[ins_name.flutter] = 6 # with duplicated: +1
         the_expected_maxis_by_platform[ins_name.swift] = 7
         the_expected_maxis_by_platform[ins_name.cocoapods] = 3
@@ -122,12 +122,19 @@ class TestDependencies(unittest.TestCase):
         if platform in the_dependencies_with_underscore:
             separator = '/'
 
+        # the lockfiles give the version: 1.0.[index] in Cargo.lock, v1.0.[index] in go.mod
+        the_prefixes_of_the_versions = dict()
+        the_prefixes_of_the_versions[CName().roast] = '1.0.'
+        the_prefixes_of_the_versions[CName().go] = 'v1.0.'
+
         the_letters = list('abcdefghijklmnopqrstuvwxyz')
         for i in range(0, maxi):
             letter = the_letters[i]
             dependency = [prefix + separator + 'c' + separator+ letter]
             if platform == CName().gradle:
                 dependency += [prefix + separator + 'n' + separator + letter]
+            if platform in the_prefixes_of_the_versions:
+                dependency += [the_prefixes_of_the_versions[platform] + str(i)]
             the_expected_dependencies.append(dependency)
 
         if platform == CName().package_json:
@@ -17,7 +17,7 @@ import requests
 import os
 
 from sources.common import CName, CFilter
-from sources.search import CDownload
+from sources.search import CDownload, CSession
 
 
 class TestDownloads(unittest.TestCase):
@@ -39,7 +39,7 @@ class TestDownloads(unittest.TestCase):
         cls.ins_name = CName()
         cls.ins_download = CDownload()
 
-    @patch('sources.search.downloads.requests.get')
+    @patch('sources.search.sessions.requests.Session.get')
     def atest_1_requests_get_OK(self, mock_requests_get):
         # requests
         response = requests.models.Response
@@ -74,7 +74,7 @@ class TestDownloads(unittest.TestCase):
         expected_file = os.path.join(self.path_licenses, expected_filename)
         ins_download.write_in_file = MagicMock()
         ins_download.write_in_file.return_value = expected_file
-        ins_download.manage_sleep = MagicMock()
+        ins_download.ins_rate_limits = MagicMock()
 
         file = ins_download.get_file(platform, the_key_and_dependency, namespace)
 
@@ -82,10 +82,10 @@ class TestDownloads(unittest.TestCase):
         #fichier avec lignes contenant des espaces : 
 
         self.assertEqual(expected_file, file)
-        ins_download.manage_sleep.assert_called_once()
+        ins_download.ins_rate_limits.get.assert_called_once()
         ins_download.write_in_file.assert_called_once()
 
-    @patch('sources.search.downloads.requests.get')
+    @patch('sources.search.sessions.requests.Session.get')
     def atest_2_requests_get_KO(self, mock_requests_get):
         # requests
         response = requests.models.Response
@@ -120,14 +120,14 @@ class TestDownloads(unittest.TestCase):
         expected_file = os.path.join(self.path_licenses, expected_filename)
         ins_download.write_in_file = MagicMock()
         #ins_download.write_in_file.return_value = expected_file
-        ins_download.manage_sleep = MagicMock()
+        ins_download.ins_rate_limits = MagicMock()
 
         file = ins_download.get_file(platform, the_key_and_dependency, namespace)
 
         self.assertEqual(None, file)
-        self.assertEqual(None, ins_download.manage_sleep.assert_called())
+        self.assertEqual(None, ins_download.ins_rate_limits.get.assert_called())
 
-    @patch('sources.search.downloads.requests.get')
+    @patch('sources.search.sessions.requests.Session.get')
     def test_3_retry_after(self, mock_requests_get):
         # requests
         response = requests.models.Response
@@ -164,11 +164,65 @@ class TestDownloads(unittest.TestCase):
 
         expected_file = os.path.join(self.path_licenses, expected_filename)
         ins_download.write_in_file = MagicMock()
-        ins_download.manage_sleep = MagicMock()
+        ins_download.ins_rate_limits = MagicMock()
 
         file = ins_download.get_file(platform, the_key_and_dependency, namespace)
 
         self.assertEqual(None, file)
-        self.assertEqual(None, ins_download.manage_sleep.assert_called())
+        self.assertEqual(None, ins_download.ins_rate_limits.get.assert_called())
         self.assertNotEqual(None, ins_download.next_date)
         self.assertNotEqual(None, ins_download.delay)
+
+    @patch('sources.search.sessions.requests.Session.get')
+    def test_4_fetch_without_shared_status(self, mock_requests_get):
+        # requests
+        response = MagicMock()
+        response.status_code = 429
+        response.headers = {'Retry-After': '120'}
+        response.content = b'line_a\nline_b'
+        mock_requests_get.return_value = response
+
+        # inputs
+        platform = CName().github
+
+        the_key_and_dependency = dict()
+        component = 'gradle.c/a'
+        the_key_and_dependency[CName().component] = component
+
+        ins_filter = CFilter()
+        ins_filter.the_URLs[platform] = "https://api.github.com/search/repositories?q=[component]"
+        ins_filter.the_filenames[platform] = '[component]_github.json'
+
+        ins_download = CDownload()
+        ins_download.ins_filter = ins_filter
+        ins_download.write_in_file = MagicMock()
+
+        result = ins_download.fetch(platform, the_key_and_dependency, None)
+
+        self.assertEqual('429', result.error_code)
+        self.assertEqual(False, result.is_ok())
+        self.assertNotEqual(None, result.next_date)
+        self.assertNotEqual(None, result.delay)
+        self.assertEqual(b'line_a\nline_b', result.content)
+        self.assertEqual(None, result.file)
+        ins_download.write_in_file.assert_not_called()
+
+        # the status is not kept in the instance
+        self.assertEqual(None, ins_download.error_code)
+        self.assertEqual(None, ins_download.next_date)
+        with self.assertRaises(AttributeError):
+            result.error_code = '200'
+
+    def test_5_one_session_by_host(self):
+        ins_session = CSession(4)
+        a = ins_session.get_session('https://registry.npmjs.org/a')
+        b = ins_session.get_session('https://registry.npmjs.org/b?q=1')
+        c = ins_session.get_session('https://crates.io/api/v1/crates/c')
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        adapter = a.get_adapter('https://registry.npmjs.org/a')
+        self.assertEqual(4, adapter._pool_maxsize)
+
+        ins_session.close()
+        self.assertEqual(0, len(ins_session.the_sessions_by_host))
@@ -19,7 +19,7 @@ import os
 
 from sources.common import CFilter, CName
 from sources.configuration import CConfig
-from sources.search import CSearch
+from sources.search import CSearch, CDownloadResult
 
 
 class TestLicenses(unittest.TestCase):
@@ -129,9 +129,9 @@ class TestLicenses(unittest.TestCase):
     def mock_ins_search(self, platform, dependency, error_code):
         ins_search = CSearch()
         ins_search.ins_download = MagicMock()
-        ins_search.ins_download.error_code = error_code
         file = self.get_file_for_mock(platform, dependency)
-        ins_search.ins_download.get_file.return_value = file
+        result = CDownloadResult(error_code, None, None, None, 0, 0, file)
+        ins_search.ins_download.fetch.return_value = result
 
         return ins_search
 
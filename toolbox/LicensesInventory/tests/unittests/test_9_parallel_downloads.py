@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Software Name: floss-toolbox
+# SPDX-FileCopyrightText: Copyright (c) Orange SA
+# SPDX-License-Identifier: Apache-2.0
+#
+# This software is distributed under the Apache 2.0 license,
+# the text of which is available at https://opensource.org/license/apache-2-0
+# or see the "LICENSE.txt" file for more details.
+#
+# Authors: See CONTRIBUTORS.txt
+# Software description: A toolbox of scripts to help work of forges admins and open source referents
+
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+import time
+
+from sources.common import CName, CWorkers
+from sources.configuration import CConfig
+from sources.search import CSearch, CDownloadResult
+
+
+def search_the_license(self, platform, dependency):
+    # a slow download, on error for the components starting with 'error'
+    component = dependency[0]
+    time.sleep(0.01 * (len(component) % 3))
+    if component.find('error') == 0:
+        return (list(), CDownloadResult('404', None, None, None, 0, 0, None))
+    return (['license_' + component], CDownloadResult('200', None, None, b'', 0, 0, component))
+
+
+class TestParallelDownloads(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.platform = CName().package_json
+        the_components = ['c_a', 'c_bb', 'error_c', 'c_ddd', 'c_e', 'error_f', 'c_g', 'c_hh', 'c_i']
+        cls.the_dependencies = [[component] for component in the_components]
+
+    def extract(self, number_of_workers, number_of_errors_max):
+        ins_search = CSearch()
+        ins_search.ins_workers = CWorkers(number_of_workers)
+        the_dependencies = [dependency[:] for dependency in self.the_dependencies]
+        return ins_search.extract_the_licenses(self.platform, the_dependencies, number_of_errors_max)
+
+    def test_the_workers_keep_the_order(self):
+        the_items = [(i,) for i in range(0, 50)]
+        the_results = list(CWorkers(8).map(lambda i: i * i, the_items))
+        self.assertEqual([i * i for i in range(0, 50)], the_results)
+
+    @patch.object(CSearch, 'search_the_license', search_the_license)
+    def test_same_results_as_one_download_at_a_time(self):
+        expected = self.extract(1, 999)
+        r = self.extract(4, 999)
+        self.assertEqual(expected, r)
+
+        the_licenses, the_errors = r
+        self.assertEqual(['c_a', 'license_c_a'], the_licenses[0])
+        self.assertEqual(['error code = 404', 'error_c'], the_errors[0])
+
+    @patch.object(CSearch, 'search_the_license', search_the_license)
+    def test_same_results_with_successive_errors(self):
+        the_dependencies = self.the_dependencies
+        self.the_dependencies = [['error_a'], ['error_b'], ['c_c'], ['c_d']]
+        try:
+            expected = self.extract(1, 2)
+            r = self.extract(4, 2)
+        finally:
+            self.the_dependencies = the_dependencies
+        self.assertEqual(expected, r)
+
+        the_licenses, the_errors = r
+        self.assertEqual(0, len(the_licenses))
+        self.assertEqual(4, len(the_errors))
+        self.assertEqual(['error code = 404', 'c_c', 'successive authorized errors at 2'], the_errors[2])
+
+    def test_configuration(self):
+        the_lines = ['[dependencies]']
+        the_lines += ['number of parallel downloads = 8']
+        the_lines += ['number of parallel downloads for package.json = 2']
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, 'config.ini'), 'wt', encoding='utf-8') as f:
+                f.write('\n'.join(the_lines))
+            ins_config = CConfig()
+            ins_config.path = path
+            ins_config.get_the_config()
+
+        self.assertEqual('8', ins_config.number_of_parallel_downloads)
+        self.assertEqual({'package.json': '2'}, ins_config.the_numbers_of_parallel_downloads_by_platform)